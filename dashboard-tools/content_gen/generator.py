@@ -4,17 +4,86 @@ Generic content generation for promoting agent activity
 """
 
 import os
+import re
 import json
+import asyncio
+import functools
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, asdict
-import anthropic
+from typing import Optional, Dict, Any, List, Union, Iterator, Callable, TYPE_CHECKING
+from dataclasses import dataclass
 import logging
 
-from .templates import get_template, get_templates, AgentConfig
+from .templates import (
+    get_templates,
+    get_cta_text,
+    render_user_prompt,
+    render_local_template,
+    AgentConfig
+)
+
+if TYPE_CHECKING:
+    import anthropic
 
 logger = logging.getLogger(__name__)
 
+# Splits combined "1. X post: ... 2. LinkedIn post: ..." responses in one pass
+_PLATFORM_SPLIT = re.compile(
+    r'\s*(?:1\.\s*)?(?i:x\s+post:)?\s*'
+    r'(?P<x>(?:(?!LinkedIn)[^\n])*)'
+    r'(?:.*?LinkedIn(?:\s+post)?\s*:?(?P<li>.*))?',
+    re.S
+)
+
+# Connection pool limits shared by every generator using the same API key
+_MAX_KEEPALIVE_CONNECTIONS = 32
+_MAX_CONNECTIONS = 64
+
+
+# The anthropic SDK (and httpx under it) is imported lazily: it is slow to
+# import and only needed once a client is actually created
+@functools.lru_cache(maxsize=8)
+def _get_client(api_key: str) -> 'anthropic.Anthropic':
+    """Get a process-wide Anthropic client for an API key"""
+    import anthropic
+    import httpx
+
+    limits = httpx.Limits(
+        max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+        max_connections=_MAX_CONNECTIONS
+    )
+    return anthropic.Anthropic(
+        api_key=api_key,
+        http_client=anthropic.DefaultHttpxClient(limits=limits)
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _get_aclient(api_key: str) -> 'anthropic.AsyncAnthropic':
+    """Get a process-wide async Anthropic client for an API key"""
+    import anthropic
+    import httpx
+
+    limits = httpx.Limits(
+        max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+        max_connections=_MAX_CONNECTIONS
+    )
+    return anthropic.AsyncAnthropic(
+        api_key=api_key,
+        http_client=anthropic.DefaultAsyncHttpxClient(limits=limits)
+    )
+
+
+def _truncate(text: Optional[str], limit: int, ellipsis: str = '...') -> str:
+    """Clip text to at most limit characters, marking the cut with ellipsis"""
+    if not text:
+        return ''
+    if len(text) <= limit:
+        return text
+    return text[:limit - len(ellipsis)] + ellipsis
+
 
 @dataclass
 class GeneratedContent:
@@ -27,56 +96,253 @@ class GeneratedContent:
     metadata: Dict[str, Any]
 
     def to_dict(self) -> dict:
-        data = asdict(self)
-        data['generated_at'] = self.generated_at.isoformat()
-        return data
+        # Built by hand: asdict() deep-copies metadata on every call
+        return {
+            'platform': self.platform,
+            'content': self.content,
+            'template_used': self.template_used,
+            'activity_id': self.activity_id,
+            'generated_at': self.generated_at.isoformat(),
+            'metadata': self.metadata
+        }
 
 
 class ContentGenerator:
     """Generates social media content from bot activities using Claude"""
 
+    # X posts are capped at 280 characters, so a full 1024-token budget is waste
+    X_MAX_TOKENS = 400
+    X_MAX_CHARS = 280
+
+    # Short-form templates run on a smaller model; others use `model`
+    DEFAULT_MODEL_MAP = {
+        'x_post': 'claude-haiku-4-5',
+        'daily_summary_x': 'claude-haiku-4-5',
+    }
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         model: str = "claude-sonnet-4-20250514",
         bot_name: str = "MyAgent",
-        agent_config: Optional[AgentConfig] = None
+        agent_config: Optional[AgentConfig] = None,
+        cache_ttl_seconds: int = 0,
+        cache_max_entries: int = 256,
+        model_map: Optional[Dict[str, str]] = None,
+        local_templates: bool = False
     ):
+        """
+        Args:
+            local_templates: Render boilerplate posts (milestones, and daily X
+                summaries for days with no activity) from local Jinja2
+                templates instead of calling Claude
+            model: Model used for templates without an entry in model_map
+            model_map: Template name -> model overrides (defaults to
+                DEFAULT_MODEL_MAP; pass {} to use `model` everywhere)
+            cache_ttl_seconds: Reuse the response to an identical request for
+                this long instead of calling Claude again (0 disables)
+            cache_max_entries: Maximum number of cached responses kept
+        """
         self.api_key = api_key or os.environ.get('ANTHROPIC_API_KEY')
         if not self.api_key:
             logger.warning("No Anthropic API key provided - content generation will fail")
 
         self.model = model
+        self.local_templates = local_templates
+        self.model_map = dict(self.DEFAULT_MODEL_MAP if model_map is None else model_map)
         self.bot_name = bot_name
         self.agent_config = agent_config or AgentConfig(name=bot_name)
         self.client = None
+        self.aclient = None
+        self._templates = get_templates(self.agent_config)
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache_max_entries = cache_max_entries
+        self._response_cache: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._pending_batches: Dict[str, Dict[str, Callable[[str], GeneratedContent]]] = {}
 
         if self.api_key:
-            self.client = anthropic.Anthropic(api_key=self.api_key)
+            self.client = _get_client(self.api_key)
+            self.aclient = _get_aclient(self.api_key)
 
     def _get_template(self, template_name: str) -> dict:
-        """Get template with agent config applied"""
-        return get_template(template_name, self.agent_config)
+        """Get template with agent config applied.
+
+        Templates are rendered once per config, so the system prompt bytes
+        stay identical between calls, which prompt caching relies on.
+        """
+        return self._templates.get(template_name, self._templates['x_post'])
+
+    @staticmethod
+    def _system_blocks(system_prompt: Union[str, List[dict]]) -> List[dict]:
+        """Wrap a system prompt as a cacheable content block"""
+        if isinstance(system_prompt, list):
+            return system_prompt
+        return [{
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"}
+        }]
+
+    def _request_kwargs(
+        self,
+        system_prompt: Union[str, List[dict]],
+        user_prompt: str,
+        max_tokens: int = 1024,
+        template_name: Optional[str] = None
+    ) -> dict:
+        """Build the messages.create arguments shared by sync and async calls"""
+        return {
+            "model": self.model_map.get(template_name, self.model),
+            "max_tokens": max_tokens,
+            "system": self._system_blocks(system_prompt),
+            "messages": [
+                {"role": "user", "content": user_prompt}
+            ]
+        }
+
+    @staticmethod
+    def _log_usage(message) -> None:
+        """Log prompt cache hits for a Claude response"""
+        usage = getattr(message, 'usage', None)
+        if usage is not None:
+            logger.debug(
+                f"Claude usage: cache_read={getattr(usage, 'cache_read_input_tokens', 0)}, "
+                f"cache_write={getattr(usage, 'cache_creation_input_tokens', 0)}, "
+                f"input={usage.input_tokens}"
+            )
 
-    def _call_claude(self, system_prompt: str, user_prompt: str) -> str:
-        """Call Claude API"""
+    @staticmethod
+    def _cache_key(request: dict) -> str:
+        """Hash the full request (model, limits, prompts) into a cache key"""
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode()).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Return a fresh cached response, if any"""
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, text = entry
+        if time.monotonic() - stored_at > self.cache_ttl_seconds:
+            del self._response_cache[key]
+            return None
+        self._response_cache.move_to_end(key)
+        return text
+
+    def _cache_put(self, key: str, text: str) -> None:
+        """Store a response, evicting the least recently used entries"""
+        self._response_cache[key] = (time.monotonic(), text)
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > self.cache_max_entries:
+            self._response_cache.popitem(last=False)
+
+    def _call_claude(
+        self,
+        system_prompt: Union[str, List[dict]],
+        user_prompt: str,
+        max_output_chars: Optional[int] = None,
+        template_name: Optional[str] = None
+    ) -> str:
+        """Call Claude API with the system prompt marked for prompt caching
+
+        With max_output_chars set, the response is streamed with a short-form
+        token budget and the stream is dropped once the text exceeds that many
+        characters - anything further would be truncated away anyway.
+        template_name selects the model through model_map.
+        """
         if not self.client:
             raise ValueError("Anthropic client not initialized - check API key")
 
+        request = self._request_kwargs(
+            system_prompt,
+            user_prompt,
+            max_tokens=self.X_MAX_TOKENS if max_output_chars else 1024,
+            template_name=template_name
+        )
+        key = None
+        if self.cache_ttl_seconds > 0:
+            key = self._cache_key(request)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=1024,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_prompt}
-                ]
-            )
-            return message.content[0].text
+            if max_output_chars:
+                text = self._stream_text(request, max_output_chars)
+            else:
+                message = self.client.messages.create(**request)
+                self._log_usage(message)
+                text = message.content[0].text
+        except Exception as e:
+            logger.error(f"Claude API error: {e}")
+            raise
+
+        if key is not None:
+            self._cache_put(key, text)
+        return text
+
+    def _stream_text(self, request: dict, max_chars: int) -> str:
+        """Stream a response, stopping once it is longer than max_chars"""
+        parts = []
+        length = 0
+        with self.client.messages.stream(**request) as stream:
+            for text in stream.text_stream:
+                parts.append(text)
+                length += len(text)
+                if length > max_chars:
+                    break
+        return ''.join(parts)
+
+    async def _acall_claude(
+        self,
+        system_prompt: Union[str, List[dict]],
+        user_prompt: str,
+        max_output_chars: Optional[int] = None,
+        template_name: Optional[str] = None
+    ) -> str:
+        """Async variant of _call_claude"""
+        if not self.aclient:
+            raise ValueError("Anthropic client not initialized - check API key")
+
+        request = self._request_kwargs(
+            system_prompt,
+            user_prompt,
+            max_tokens=self.X_MAX_TOKENS if max_output_chars else 1024,
+            template_name=template_name
+        )
+        key = None
+        if self.cache_ttl_seconds > 0:
+            key = self._cache_key(request)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
+        try:
+            if max_output_chars:
+                text = await self._astream_text(request, max_output_chars)
+            else:
+                message = await self.aclient.messages.create(**request)
+                self._log_usage(message)
+                text = message.content[0].text
         except Exception as e:
             logger.error(f"Claude API error: {e}")
             raise
 
+        if key is not None:
+            self._cache_put(key, text)
+        return text
+
+    async def _astream_text(self, request: dict, max_chars: int) -> str:
+        """Async variant of _stream_text"""
+        parts = []
+        length = 0
+        async with self.aclient.messages.stream(**request) as stream:
+            async for text in stream.text_stream:
+                parts.append(text)
+                length += len(text)
+                if length > max_chars:
+                    break
+        return ''.join(parts)
+
     def generate_for_activity(
         self,
         activity: 'Activity',
@@ -101,24 +367,50 @@ class ContentGenerator:
 
         return results
 
-    def _generate_x_post(self, activity: 'Activity') -> GeneratedContent:
-        """Generate an X/Twitter post"""
+    async def agenerate_for_activity(
+        self,
+        activity: 'Activity',
+        platforms: List[str] = ['x', 'linkedin']
+    ) -> Dict[str, GeneratedContent]:
+        """Generate content for all specified platforms concurrently"""
+        coros = {}
+        for platform in platforms:
+            if platform == 'x':
+                coros[platform] = self._agenerate_x_post(activity)
+            elif platform == 'linkedin':
+                coros[platform] = self._agenerate_linkedin_post(activity)
+            else:
+                logger.warning(f"Unknown platform: {platform}")
+
+        outcomes = await asyncio.gather(*coros.values(), return_exceptions=True)
+
+        results = {}
+        for platform, outcome in zip(coros, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to generate {platform} content: {outcome}")
+            else:
+                results[platform] = outcome
+        return results
+
+    def _x_post_prompt(self, activity: 'Activity') -> tuple:
+        """Build the (system, user) prompts for an X post"""
         template = self._get_template('x_post')
 
-        user_prompt = template['user_template'].format(
+        user_prompt = render_user_prompt(
+            template,
             community=activity.community,
             title=activity.title or '',
-            content=activity.content[:500] if activity.content else activity.title or '',
+            content=_truncate(activity.content, 500, ellipsis='') or activity.title or '',
             upvotes=activity.upvotes,
             comments=activity.comments_count,
             url=activity.url
         )
+        return template['system_prompt'], user_prompt
 
-        content = self._call_claude(template['system_prompt'], user_prompt)
-
+    def _x_post_result(self, activity: 'Activity', content: str) -> GeneratedContent:
+        """Wrap a generated X post"""
         # Ensure within character limit
-        if len(content) > 280:
-            content = content[:277] + "..."
+        content = _truncate(content, self.X_MAX_CHARS)
 
         return GeneratedContent(
             platform='x',
@@ -129,21 +421,37 @@ class ContentGenerator:
             metadata={'community': activity.community, 'upvotes': activity.upvotes}
         )
 
-    def _generate_linkedin_post(self, activity: 'Activity') -> GeneratedContent:
-        """Generate a LinkedIn post"""
+    def _generate_x_post(self, activity: 'Activity') -> GeneratedContent:
+        """Generate an X/Twitter post"""
+        content = self._call_claude(
+            *self._x_post_prompt(activity), max_output_chars=self.X_MAX_CHARS, template_name='x_post'
+        )
+        return self._x_post_result(activity, content)
+
+    async def _agenerate_x_post(self, activity: 'Activity') -> GeneratedContent:
+        """Generate an X/Twitter post asynchronously"""
+        content = await self._acall_claude(
+            *self._x_post_prompt(activity), max_output_chars=self.X_MAX_CHARS, template_name='x_post'
+        )
+        return self._x_post_result(activity, content)
+
+    def _linkedin_post_prompt(self, activity: 'Activity') -> tuple:
+        """Build the (system, user) prompts for a LinkedIn post"""
         template = self._get_template('linkedin')
 
-        user_prompt = template['user_template'].format(
+        user_prompt = render_user_prompt(
+            template,
             community=activity.community,
             title=activity.title or '',
-            content=activity.content[:1500] if activity.content else activity.title or '',
+            content=_truncate(activity.content, 1500, ellipsis='') or activity.title or '',
             upvotes=activity.upvotes,
             comments=activity.comments_count,
             url=activity.url
         )
+        return template['system_prompt'], user_prompt
 
-        content = self._call_claude(template['system_prompt'], user_prompt)
-
+    def _linkedin_post_result(self, activity: 'Activity', content: str) -> GeneratedContent:
+        """Wrap a generated LinkedIn post"""
         return GeneratedContent(
             platform='linkedin',
             content=content,
@@ -153,20 +461,31 @@ class ContentGenerator:
             metadata={'community': activity.community, 'upvotes': activity.upvotes}
         )
 
+    def _generate_linkedin_post(self, activity: 'Activity') -> GeneratedContent:
+        """Generate a LinkedIn post"""
+        content = self._call_claude(*self._linkedin_post_prompt(activity), template_name='linkedin')
+        return self._linkedin_post_result(activity, content)
+
+    async def _agenerate_linkedin_post(self, activity: 'Activity') -> GeneratedContent:
+        """Generate a LinkedIn post asynchronously"""
+        content = await self._acall_claude(*self._linkedin_post_prompt(activity), template_name='linkedin')
+        return self._linkedin_post_result(activity, content)
+
     def generate_x_thread(self, activity: 'Activity') -> GeneratedContent:
         """Generate an X thread for significant content"""
         template = self._get_template('x_thread')
 
-        user_prompt = template['user_template'].format(
+        user_prompt = render_user_prompt(
+            template,
             community=activity.community,
             title=activity.title or '',
-            content=activity.content[:1500] if activity.content else activity.title or '',
+            content=_truncate(activity.content, 1500, ellipsis='') or activity.title or '',
             upvotes=activity.upvotes,
             comments=activity.comments_count,
             url=activity.url
         )
 
-        content = self._call_claude(template['system_prompt'], user_prompt)
+        content = self._call_claude(template['system_prompt'], user_prompt, template_name='x_thread')
 
         return GeneratedContent(
             platform='x_thread',
@@ -177,41 +496,26 @@ class ContentGenerator:
             metadata={'community': activity.community}
         )
 
-    def generate_daily_summary(
+    def _daily_summary_prompts(
         self,
         stats: Dict[str, Any],
-        top_content: str = "",
-        insights: str = ""
-    ) -> Dict[str, GeneratedContent]:
-        """Generate daily summary posts for both platforms"""
-        results = {}
-
-        # X summary
+        top_content: str,
+        insights: str
+    ) -> Dict[str, tuple]:
+        """Build the (system, user) prompts for both daily summary posts"""
         x_template = self._get_template('daily_summary_x')
-        x_prompt = x_template['user_template'].format(
+        x_prompt = render_user_prompt(
+            x_template,
             posts_today=stats.get('posts_today', 0),
             comments_today=stats.get('comments_today', 0),
             upvotes_today=stats.get('total_upvotes', 0),
             communities=stats.get('communities_active', 0),
-            top_content=top_content[:200]
-        )
-
-        x_content = self._call_claude(x_template['system_prompt'], x_prompt)
-        if len(x_content) > 280:
-            x_content = x_content[:277] + "..."
-
-        results['x'] = GeneratedContent(
-            platform='x',
-            content=x_content,
-            template_used='daily_summary_x',
-            activity_id=f"daily_{datetime.now().strftime('%Y%m%d')}",
-            generated_at=datetime.now(),
-            metadata={'stats': stats}
+            top_content=_truncate(top_content, 200, ellipsis='')
         )
 
-        # LinkedIn summary
         li_template = self._get_template('daily_summary_linkedin')
-        li_prompt = li_template['user_template'].format(
+        li_prompt = render_user_prompt(
+            li_template,
             posts_today=stats.get('posts_today', 0),
             comments_today=stats.get('comments_today', 0),
             upvotes_today=stats.get('total_upvotes', 0),
@@ -220,104 +524,368 @@ class ContentGenerator:
             insights=insights or "Observing AI-to-AI interaction patterns"
         )
 
-        li_content = self._call_claude(li_template['system_prompt'], li_prompt)
+        return {
+            'x': (x_template['system_prompt'], x_prompt),
+            'linkedin': (li_template['system_prompt'], li_prompt)
+        }
 
-        results['linkedin'] = GeneratedContent(
-            platform='linkedin',
-            content=li_content,
-            template_used='daily_summary_linkedin',
-            activity_id=f"daily_{datetime.now().strftime('%Y%m%d')}",
-            generated_at=datetime.now(),
+    def _daily_summary_result(
+        self,
+        platform: str,
+        stats: Dict[str, Any],
+        content: str,
+        now: datetime
+    ) -> GeneratedContent:
+        """Wrap one generated daily summary post"""
+        if platform == 'x':
+            content = _truncate(content, self.X_MAX_CHARS)
+
+        return GeneratedContent(
+            platform=platform,
+            content=content,
+            template_used=f'daily_summary_{platform}',
+            activity_id=f"daily_{now.strftime('%Y%m%d')}",
+            generated_at=now,
             metadata={'stats': stats}
         )
 
-        return results
+    def _daily_summary_results(
+        self,
+        stats: Dict[str, Any],
+        x_content: str,
+        li_content: str
+    ) -> Dict[str, GeneratedContent]:
+        """Wrap generated daily summary posts"""
+        now = datetime.now()
+        return {
+            'x': self._daily_summary_result('x', stats, x_content, now),
+            'linkedin': self._daily_summary_result('linkedin', stats, li_content, now)
+        }
+
+    def _render_local(self, name: str, **context) -> Optional[str]:
+        """Render a local template with agent details, or None if unavailable"""
+        if not self.local_templates:
+            return None
+        return render_local_template(
+            name,
+            agent=self.agent_config.name,
+            owner=self.agent_config.owner_name,
+            cta=get_cta_text(self.agent_config),
+            **context
+        )
 
-    def generate_milestone_content(
+    def _local_daily_x(self, stats: Dict[str, Any], top_content: str) -> Optional[str]:
+        """Render the daily X summary locally for a day with nothing to write about"""
+        if top_content or any(stats.get(key) for key in ('posts_today', 'comments_today', 'total_upvotes')):
+            return None
+        return self._render_local(
+            'daily_x.j2',
+            posts_today=stats.get('posts_today', 0),
+            upvotes_today=stats.get('total_upvotes', 0),
+            communities=stats.get('communities_active', 0),
+            top_content=_truncate(top_content, 100)
+        )
+
+    def generate_daily_summary(
+        self,
+        stats: Dict[str, Any],
+        top_content: str = "",
+        insights: str = ""
+    ) -> Dict[str, GeneratedContent]:
+        """Generate daily summary posts for both platforms"""
+        prompts = self._daily_summary_prompts(stats, top_content, insights)
+        x_content = self._local_daily_x(stats, top_content)
+        if x_content is None:
+            x_content = self._call_claude(
+                *prompts['x'], max_output_chars=self.X_MAX_CHARS, template_name='daily_summary_x'
+            )
+        li_content = self._call_claude(*prompts['linkedin'], template_name='daily_summary_linkedin')
+        return self._daily_summary_results(stats, x_content, li_content)
+
+    async def agenerate_daily_summary(
+        self,
+        stats: Dict[str, Any],
+        top_content: str = "",
+        insights: str = ""
+    ) -> Dict[str, GeneratedContent]:
+        """Generate daily summary posts for both platforms concurrently"""
+        prompts = self._daily_summary_prompts(stats, top_content, insights)
+        x_content = self._local_daily_x(stats, top_content)
+        li_call = self._acall_claude(*prompts['linkedin'], template_name='daily_summary_linkedin')
+        if x_content is None:
+            x_content, li_content = await asyncio.gather(
+                self._acall_claude(
+                    *prompts['x'], max_output_chars=self.X_MAX_CHARS, template_name='daily_summary_x'
+                ),
+                li_call
+            )
+        else:
+            li_content = await li_call
+        return self._daily_summary_results(stats, x_content, li_content)
+
+    def generate_batch(self, specs: List[Dict[str, Any]]) -> str:
+        """
+        Submit non-urgent generations through the Message Batches API
+
+        Batched requests are billed at half the normal token price but can
+        take up to 24 hours to complete.
+
+        Args:
+            specs: Items of the form {'activity': Activity, 'platforms': [...]}
+                or {'daily_summary': stats, 'top_content': str, 'insights': str}
+
+        Returns:
+            Batch id to pass to poll_batch
+        """
+        if not self.client:
+            raise ValueError("Anthropic client not initialized - check API key")
+
+        requests = []
+        finishers = {}
+        now = datetime.now()
+
+        for index, spec in enumerate(specs):
+            if 'activity' in spec:
+                activity = spec['activity']
+                for platform in spec.get('platforms', ['x', 'linkedin']):
+                    if platform == 'x':
+                        prompt = self._x_post_prompt(activity)
+                        finish = functools.partial(self._x_post_result, activity)
+                    elif platform == 'linkedin':
+                        prompt = self._linkedin_post_prompt(activity)
+                        finish = functools.partial(self._linkedin_post_result, activity)
+                    else:
+                        logger.warning(f"Unknown platform: {platform}")
+                        continue
+                    custom_id = f"{index}-{platform}"
+                    max_tokens = self.X_MAX_TOKENS if platform == 'x' else 1024
+                    requests.append({
+                        "custom_id": custom_id,
+                        "params": self._request_kwargs(
+                            *prompt,
+                            max_tokens=max_tokens,
+                            template_name='x_post' if platform == 'x' else 'linkedin'
+                        )
+                    })
+                    finishers[custom_id] = finish
+            elif 'daily_summary' in spec:
+                stats = spec['daily_summary']
+                prompts = self._daily_summary_prompts(
+                    stats, spec.get('top_content', ''), spec.get('insights', '')
+                )
+                for platform, prompt in prompts.items():
+                    custom_id = f"{index}-daily-{platform}"
+                    max_tokens = self.X_MAX_TOKENS if platform == 'x' else 1024
+                    requests.append({
+                        "custom_id": custom_id,
+                        "params": self._request_kwargs(
+                            *prompt,
+                            max_tokens=max_tokens,
+                            template_name=f'daily_summary_{platform}'
+                        )
+                    })
+                    finishers[custom_id] = functools.partial(
+                        self._daily_summary_result, platform, stats, now=now
+                    )
+            else:
+                logger.warning(f"Unknown batch spec: {sorted(spec)}")
+
+        batch = self.client.messages.batches.create(requests=requests)
+        self._pending_batches[batch.id] = finishers
+        logger.info(f"Submitted batch {batch.id} with {len(requests)} requests")
+        return batch.id
+
+    def poll_batch(self, batch_id: str, poll_interval: int = 60) -> Iterator[GeneratedContent]:
+        """
+        Wait for a batch submitted by generate_batch and yield its content
+
+        Only batches submitted by this generator instance can be resolved,
+        since the activity data needed to wrap results is kept in memory.
+        """
+        finishers = self._pending_batches.get(batch_id)
+        if finishers is None:
+            raise KeyError(f"Unknown batch: {batch_id}")
+
+        while self.client.messages.batches.retrieve(batch_id).processing_status != 'ended':
+            time.sleep(poll_interval)
+
+        for entry in self.client.messages.batches.results(batch_id):
+            finish = finishers.get(entry.custom_id)
+            if finish is None:
+                continue
+            if entry.result.type != 'succeeded':
+                logger.error(f"Batch request {entry.custom_id} {entry.result.type}")
+                continue
+            yield finish(entry.result.message.content[0].text)
+
+        del self._pending_batches[batch_id]
+
+    @staticmethod
+    def _split_platform_response(response: str) -> tuple:
+        """Split a combined response into its X and LinkedIn parts"""
+        match = _PLATFORM_SPLIT.match(response)
+        li_content = match.group('li')
+        if li_content is None:
+            li_content = response
+        return match.group('x').strip()[:280], li_content.strip()
+
+    def _milestone_prompt(
         self,
         milestone: str,
         previous_value: int,
         current_value: int
-    ) -> Dict[str, GeneratedContent]:
-        """Generate content celebrating a milestone"""
-        results = {}
+    ) -> tuple:
+        """Build the (system, user) prompts for milestone content"""
         template = self._get_template('milestone')
 
-        prompt = template['user_template'].format(
+        prompt = render_user_prompt(
+            template,
             milestone=milestone,
             previous_value=previous_value,
             current_value=current_value
         )
+        return template['system_prompt'], prompt
 
-        response = self._call_claude(template['system_prompt'], prompt)
-
-        # Parse the response to extract X and LinkedIn parts
-        parts = response.split('LinkedIn', 1)
-        x_content = parts[0].replace('X post:', '').replace('1.', '').strip()
-        li_content = parts[1] if len(parts) > 1 else response
-
-        # Clean up
-        x_content = x_content.split('\n')[0].strip()[:280]
+    def _milestone_results(
+        self,
+        milestone: str,
+        current_value: int,
+        x_content: str,
+        li_content: str
+    ) -> Dict[str, GeneratedContent]:
+        """Wrap milestone content for both platforms"""
+        results = {}
+        now = datetime.now()
+        activity_id = f"milestone_{milestone}_{now.isoformat()}"
 
         results['x'] = GeneratedContent(
             platform='x',
             content=x_content,
             template_used='milestone',
-            activity_id=f"milestone_{milestone}_{datetime.now().isoformat()}",
-            generated_at=datetime.now(),
+            activity_id=activity_id,
+            generated_at=now,
             metadata={'milestone': milestone, 'value': current_value}
         )
 
         results['linkedin'] = GeneratedContent(
             platform='linkedin',
-            content=li_content.strip(),
+            content=li_content,
             template_used='milestone',
-            activity_id=f"milestone_{milestone}_{datetime.now().isoformat()}",
-            generated_at=datetime.now(),
+            activity_id=activity_id,
+            generated_at=now,
             metadata={'milestone': milestone, 'value': current_value}
         )
 
         return results
 
-    def generate_high_engagement_content(self, activity: 'Activity') -> Dict[str, GeneratedContent]:
-        """Generate content for high-engagement activities"""
-        results = {}
+    def generate_milestone_content(
+        self,
+        milestone: str,
+        previous_value: int,
+        current_value: int,
+        narrative: bool = False
+    ) -> Dict[str, GeneratedContent]:
+        """Generate content celebrating a milestone
+
+        With local_templates enabled, and unless narrative is requested, the
+        posts are rendered from local templates and Claude is not called.
+        """
+        local = None if narrative else self._local_milestone(milestone, previous_value, current_value)
+        if local is not None:
+            return self._milestone_results(milestone, current_value, *local)
+
+        response = self._call_claude(
+            *self._milestone_prompt(milestone, previous_value, current_value), template_name='milestone'
+        )
+        return self._milestone_results(milestone, current_value, *self._split_platform_response(response))
+
+    async def agenerate_milestone_content(
+        self,
+        milestone: str,
+        previous_value: int,
+        current_value: int,
+        narrative: bool = False
+    ) -> Dict[str, GeneratedContent]:
+        """Generate content celebrating a milestone asynchronously"""
+        local = None if narrative else self._local_milestone(milestone, previous_value, current_value)
+        if local is not None:
+            return self._milestone_results(milestone, current_value, *local)
+
+        response = await self._acall_claude(
+            *self._milestone_prompt(milestone, previous_value, current_value), template_name='milestone'
+        )
+        return self._milestone_results(milestone, current_value, *self._split_platform_response(response))
+
+    def _local_milestone(
+        self,
+        milestone: str,
+        previous_value: int,
+        current_value: int
+    ) -> Optional[tuple]:
+        """Render (x, linkedin) milestone posts locally, or None if unavailable"""
+        context = {
+            'milestone': milestone,
+            'previous_value': previous_value,
+            'current_value': current_value
+        }
+        x_content = self._render_local('milestone_x.j2', **context)
+        if x_content is None:
+            return None
+        return _truncate(x_content, self.X_MAX_CHARS), self._render_local('milestone_li.j2', **context)
+
+    def _high_engagement_prompt(self, activity: 'Activity') -> tuple:
+        """Build the (system, user) prompts for high-engagement content"""
         template = self._get_template('high_engagement')
 
-        prompt = template['user_template'].format(
+        prompt = render_user_prompt(
+            template,
             activity_type=activity.type,
             community=activity.community,
-            content=activity.content[:500] if activity.content else activity.title or '',
+            content=_truncate(activity.content, 500, ellipsis='') or activity.title or '',
             upvotes=activity.upvotes,
             comments=activity.comments_count,
             url=activity.url
         )
+        return template['system_prompt'], prompt
 
-        response = self._call_claude(template['system_prompt'], prompt)
-
-        # Parse response
-        parts = response.split('LinkedIn', 1)
-        x_content = parts[0].replace('X post:', '').replace('1.', '').strip()
-        li_content = parts[1] if len(parts) > 1 else response
-
-        x_content = x_content.split('\n')[0].strip()[:280]
+    def _high_engagement_results(
+        self,
+        activity: 'Activity',
+        response: str
+    ) -> Dict[str, GeneratedContent]:
+        """Parse a high-engagement response into per-platform content"""
+        results = {}
+        now = datetime.now()
+        x_content, li_content = self._split_platform_response(response)
 
         results['x'] = GeneratedContent(
             platform='x',
             content=x_content,
             template_used='high_engagement',
             activity_id=activity.id,
-            generated_at=datetime.now(),
+            generated_at=now,
             metadata={'upvotes': activity.upvotes, 'comments': activity.comments_count}
         )
 
         results['linkedin'] = GeneratedContent(
             platform='linkedin',
-            content=li_content.strip(),
+            content=li_content,
             template_used='high_engagement',
             activity_id=activity.id,
-            generated_at=datetime.now(),
+            generated_at=now,
             metadata={'upvotes': activity.upvotes, 'comments': activity.comments_count}
         )
 
         return results
+
+    def generate_high_engagement_content(self, activity: 'Activity') -> Dict[str, GeneratedContent]:
+        """Generate content for high-engagement activities"""
+        response = self._call_claude(*self._high_engagement_prompt(activity), template_name='high_engagement')
+        return self._high_engagement_results(activity, response)
+
+    async def agenerate_high_engagement_content(self, activity: 'Activity') -> Dict[str, GeneratedContent]:
+        """Generate content for high-engagement activities asynchronously"""
+        response = await self._acall_claude(
+            *self._high_engagement_prompt(activity), template_name='high_engagement'
+        )
+        return self._high_engagement_results(activity, response)
@@ -3,13 +3,20 @@ Templates for generating social media content
 Generic templates for promoting agent activity on Moltbook
 """
 
+import functools
+import os
+import string
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class AgentConfig:
-    """Configuration for the agent whose content is being promoted"""
+    """Configuration for the agent whose content is being promoted
+
+    Frozen so it can key the rendered-template cache.
+    """
     name: str = "MyAgent"
     owner_name: str = "Agent Owner"
     owner_bio: str = "AI enthusiast and developer"
@@ -25,10 +32,59 @@ class AgentConfig:
 # Default config (to be overridden by application)
 DEFAULT_CONFIG = AgentConfig()
 
+# Jinja2 templates for posts that are rendered without calling Claude
+LOCAL_TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates_local')
 
-def get_templates(config: Optional[AgentConfig] = None) -> dict:
-    """Get templates with agent configuration applied"""
+# Jinja2 is imported lazily - it is only needed for local rendering
+_local_env = None
+
+
+def get_cta_text(config: Optional[AgentConfig] = None) -> str:
+    """Get the call-to-action phrase for a config"""
     cfg = config or DEFAULT_CONFIG
+    if cfg.x_handle:
+        return f"follow @{cfg.x_handle}"
+    return f"follow {cfg.owner_name}" if cfg.owner_name else "follow the creator"
+
+
+def _get_local_env():
+    global _local_env
+    if _local_env is None:
+        try:
+            import jinja2
+        except ImportError:
+            return None
+        _local_env = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(LOCAL_TEMPLATES_DIR),
+            auto_reload=False,
+            cache_size=400,
+            autoescape=False,
+            trim_blocks=True,
+            lstrip_blocks=True
+        )
+    return _local_env
+
+
+def render_local_template(name: str, **context) -> Optional[str]:
+    """Render a local post template, or None if Jinja2 is not installed"""
+    env = _get_local_env()
+    if env is None:
+        return None
+    return env.get_template(name).render(**context).strip()
+
+
+def get_templates(config: Optional[AgentConfig] = None) -> dict:
+    """Get templates with agent configuration applied
+
+    The prompts are rendered once per config; each call gets its own copy
+    of the template dicts, so callers may modify them freely.
+    """
+    return {name: dict(template) for name, template in _render_templates(config or DEFAULT_CONFIG).items()}
+
+
+@functools.lru_cache(maxsize=16)
+def _render_templates(cfg: AgentConfig) -> dict:
+    """Render every template for a config; cached, so never hand this out directly"""
 
     # Build credentials string based on available info
     credentials = []
@@ -47,11 +103,9 @@ def get_templates(config: Optional[AgentConfig] = None) -> dict:
 
     credentials_text = "\n".join(credentials) if credentials else "- AI enthusiast and developer"
 
-    cta_text = f"follow {cfg.owner_name}" if cfg.owner_name else "follow the creator"
-    if cfg.x_handle:
-        cta_text = f"follow @{cfg.x_handle}"
+    cta_text = get_cta_text(cfg)
 
-    return {
+    templates = {
         'x_post': {
             'name': 'X/Twitter Post',
             'max_length': 280,
@@ -230,6 +284,39 @@ Be truthful about the numbers and content. Focus on the interesting dynamics."""
         }
     }
 
+    for template in templates.values():
+        # Interned so every generator sharing a config holds the same prompt objects
+        template['system_prompt'] = sys.intern(template['system_prompt'])
+        template['user_template'] = sys.intern(template['user_template'])
+
+    return templates
+
+
+@functools.lru_cache(maxsize=128)
+def _to_percent_template(user_template: str) -> Optional[str]:
+    """Convert a str.format user template into %-mapping form, cached per template
+
+    %-formatting measured faster than both str.format and a pre-split join
+    for these short prompts. Returns None when a placeholder is not a plain
+    keyword field, so rendering falls back to str.format.
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(user_template):
+        if format_spec or conversion or (field_name is not None and not field_name.isidentifier()):
+            return None
+        parts.append(literal.replace('%', '%%'))
+        if field_name is not None:
+            parts.append(f"%({field_name})s")
+    return ''.join(parts)
+
+
+def render_user_prompt(template: dict, **fields) -> str:
+    """Fill a template's user prompt; equivalent to user_template.format(**fields)"""
+    pct = _to_percent_template(template['user_template'])
+    if pct is None:
+        return template['user_template'].format(**fields)
+    return pct % fields
+
 
 # Legacy interface for backward compatibility
 TEMPLATES = get_templates()
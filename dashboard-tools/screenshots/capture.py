@@ -4,8 +4,9 @@ Screenshot Capture Service using Playwright
 
 import asyncio
 import os
+import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List, Dict, Any, Union
 from dataclasses import dataclass
 import logging
 
@@ -14,21 +15,33 @@ logger = logging.getLogger(__name__)
 # Playwright is imported lazily to avoid issues if not installed
 playwright = None
 async_playwright = None
+PlaywrightTimeoutError = None
 
 
 def _ensure_playwright():
     """Lazily import playwright"""
-    global playwright, async_playwright
+    global playwright, async_playwright, PlaywrightTimeoutError
     if playwright is None:
         try:
             from playwright.async_api import async_playwright as ap
+            from playwright.async_api import TimeoutError as pte
             async_playwright = ap
+            PlaywrightTimeoutError = pte
         except ImportError:
             raise ImportError(
                 "Playwright not installed. Run: pip install playwright && playwright install chromium"
             )
 
 
+# File suffixes listed by get_recent_screenshots
+_IMAGE_SUFFIXES = ('.png', '.jpg', '.jpeg')
+
+
+def _unique_stamp() -> str:
+    """Timestamp plus a random suffix, so concurrent captures never share a name"""
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+
 @dataclass
 class Screenshot:
     """Captured screenshot data"""
@@ -53,25 +66,83 @@ class ScreenshotCapture:
 
     MOLTBOOK_BASE = "https://moltbook.com"
 
+    # Formats Playwright can encode, with the file extension used for each
+    IMAGE_EXTENSIONS = {'png': '.png', 'jpeg': '.jpg'}
+
     def __init__(
         self,
         output_dir: str = "./screenshots",
         viewport_width: int = 1280,
-        viewport_height: int = 800
+        viewport_height: int = 800,
+        image_format: str = 'png',
+        quality: int = 85
     ):
+        """
+        Args:
+            image_format: 'png' (lossless) or 'jpeg' (much smaller, for previews)
+            quality: JPEG quality, 0-100 (ignored for PNG)
+        """
+        if image_format not in self.IMAGE_EXTENSIONS:
+            raise ValueError(
+                f"Unsupported image format {image_format!r}, expected one of: "
+                f"{', '.join(self.IMAGE_EXTENSIONS)}"
+            )
+
         self.output_dir = output_dir
         self.viewport_width = viewport_width
         self.viewport_height = viewport_height
+        self.image_format = image_format
+        self.quality = quality
+        self.extension = self.IMAGE_EXTENSIONS[image_format]
+
+        # Browser is launched on first capture and reused until aclose()
+        self._playwright = None
+        self._browser = None
+        self._browser_lock: Optional[asyncio.Lock] = None
 
         os.makedirs(output_dir, exist_ok=True)
 
+    async def _ensure_browser(self):
+        """Launch the shared browser if it is not already running"""
+        _ensure_playwright()
+
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+        return self._browser
+
+    async def _new_context(self):
+        """Open a browser context with the configured viewport"""
+        browser = await self._ensure_browser()
+        return await browser.new_context(
+            viewport={'width': self.viewport_width, 'height': self.viewport_height}
+        )
+
+    async def aclose(self):
+        """Close the shared browser and stop Playwright"""
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                logger.warning(f"Failed to close browser: {e}")
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
     async def capture_url(
         self,
         url: str,
         filename: Optional[str] = None,
         full_page: bool = False,
         wait_for_selector: Optional[str] = None,
-        crop_selector: Optional[str] = None
+        crop_selector: Optional[str] = None,
+        context: Optional[Any] = None
     ) -> Screenshot:
         """
         Capture a screenshot of a URL
@@ -82,65 +153,104 @@ class ScreenshotCapture:
             full_page: Capture full scrollable page
             wait_for_selector: CSS selector to wait for before capture
             crop_selector: CSS selector to crop screenshot to
+            context: Browser context to open the page in (a private one is
+                created and closed if not provided)
         """
-        _ensure_playwright()
-
         if not filename:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"screenshot_{timestamp}.png"
+            filename = f"screenshot_{_unique_stamp()}{self.extension}"
 
         filepath = os.path.join(self.output_dir, filename)
+        image_options = {'type': self.image_format}
+        if self.image_format == 'jpeg':
+            image_options['quality'] = self.quality
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                viewport={'width': self.viewport_width, 'height': self.viewport_height}
-            )
-            page = await context.new_page()
+        owns_context = context is None
+        if owns_context:
+            context = await self._new_context()
+        page = await context.new_page()
 
-            try:
-                # Navigate to the page
-                await page.goto(url, wait_until='networkidle')
-
-                # Wait for specific element if requested
-                if wait_for_selector:
-                    await page.wait_for_selector(wait_for_selector, timeout=10000)
-
-                # Add a small delay for any animations
-                await asyncio.sleep(1)
-
-                # Capture screenshot
-                if crop_selector:
-                    element = await page.query_selector(crop_selector)
-                    if element:
-                        await element.screenshot(path=filepath)
-                    else:
-                        logger.warning(f"Selector {crop_selector} not found, capturing full page")
-                        await page.screenshot(path=filepath, full_page=full_page)
+        try:
+            # Navigate to the page; the selector/load waits below decide readiness
+            await page.goto(url, wait_until='domcontentloaded', timeout=15000)
+
+            # Wait for specific element if requested
+            if wait_for_selector:
+                await page.wait_for_selector(wait_for_selector, timeout=10000)
+            else:
+                await page.wait_for_load_state('load')
+
+            # Element crops are sensitive to late font swaps shifting layout
+            if crop_selector:
+                try:
+                    await page.wait_for_function("document.fonts.status === 'loaded'", timeout=5000)
+                except PlaywrightTimeoutError:
+                    logger.warning(f"Fonts still loading for {url}, capturing anyway")
+
+            # Capture screenshot
+            if crop_selector:
+                element = await page.query_selector(crop_selector)
+                if element:
+                    await element.screenshot(path=filepath, **image_options)
                 else:
-                    await page.screenshot(path=filepath, full_page=full_page)
+                    logger.warning(f"Selector {crop_selector} not found, capturing full page")
+                    await page.screenshot(path=filepath, full_page=full_page, **image_options)
+            else:
+                await page.screenshot(path=filepath, full_page=full_page, **image_options)
+
+            logger.info(f"Screenshot saved to {filepath}")
+
+            return Screenshot(
+                path=filepath,
+                url=url,
+                captured_at=datetime.now(),
+                width=self.viewport_width,
+                height=self.viewport_height
+            )
 
-                logger.info(f"Screenshot saved to {filepath}")
+        except Exception as e:
+            logger.error(f"Failed to capture screenshot: {e}")
+            raise
 
-                return Screenshot(
-                    path=filepath,
-                    url=url,
-                    captured_at=datetime.now(),
-                    width=self.viewport_width,
-                    height=self.viewport_height
-                )
+        finally:
+            if owns_context:
+                await context.close()
+            else:
+                await page.close()
 
-            except Exception as e:
-                logger.error(f"Failed to capture screenshot: {e}")
-                raise
+    async def capture_many(
+        self,
+        specs: List[Dict[str, Any]],
+        max_concurrency: int = 4
+    ) -> List[Union[Screenshot, Exception]]:
+        """
+        Capture several URLs concurrently in one shared browser context
 
-            finally:
-                await browser.close()
+        Args:
+            specs: capture_url keyword arguments, one dict per screenshot
+            max_concurrency: Maximum number of pages open at once
+
+        Returns:
+            One Screenshot per spec, or the exception that capture raised
+        """
+        context = await self._new_context()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def capture_one(spec: Dict[str, Any]) -> Screenshot:
+            async with semaphore:
+                return await self.capture_url(**spec, context=context)
+
+        try:
+            return await asyncio.gather(
+                *(capture_one(spec) for spec in specs),
+                return_exceptions=True
+            )
+        finally:
+            await context.close()
 
     async def capture_post(self, community: str, post_id: str) -> Screenshot:
         """Capture a screenshot of a specific post"""
         url = f"{self.MOLTBOOK_BASE}/m/{community}/post/{post_id}"
-        filename = f"post_{community}_{post_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        filename = f"post_{community}_{post_id}_{_unique_stamp()}{self.extension}"
 
         return await self.capture_url(
             url=url,
@@ -152,7 +262,7 @@ class ScreenshotCapture:
     async def capture_user_profile(self, username: str) -> Screenshot:
         """Capture a screenshot of a user profile"""
         url = f"{self.MOLTBOOK_BASE}/u/{username}"
-        filename = f"profile_{username}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        filename = f"profile_{username}_{_unique_stamp()}{self.extension}"
 
         return await self.capture_url(
             url=url,
@@ -168,7 +278,7 @@ class ScreenshotCapture:
     ) -> Screenshot:
         """Capture a screenshot focused on a specific comment"""
         url = f"{self.MOLTBOOK_BASE}/m/{community}/post/{post_id}#comment-{comment_id}"
-        filename = f"comment_{comment_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        filename = f"comment_{comment_id}_{_unique_stamp()}{self.extension}"
 
         return await self.capture_url(
             url=url,
@@ -179,7 +289,7 @@ class ScreenshotCapture:
     async def capture_community(self, community: str) -> Screenshot:
         """Capture a screenshot of a community page"""
         url = f"{self.MOLTBOOK_BASE}/m/{community}"
-        filename = f"community_{community}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        filename = f"community_{community}_{_unique_stamp()}{self.extension}"
 
         return await self.capture_url(
             url=url,
@@ -189,26 +299,33 @@ class ScreenshotCapture:
 
     def get_recent_screenshots(self, limit: int = 20) -> list:
         """Get list of recent screenshots"""
-        screenshots = []
-        if os.path.exists(self.output_dir):
-            files = sorted(
-                [f for f in os.listdir(self.output_dir) if f.endswith('.png')],
-                key=lambda x: os.path.getmtime(os.path.join(self.output_dir, x)),
-                reverse=True
-            )
-            for f in files[:limit]:
-                filepath = os.path.join(self.output_dir, f)
-                screenshots.append({
-                    'filename': f,
-                    'path': filepath,
-                    'created': datetime.fromtimestamp(os.path.getmtime(filepath)).isoformat()
-                })
-        return screenshots
+        try:
+            with os.scandir(self.output_dir) as it:
+                entries = [
+                    (entry.stat().st_mtime, entry)
+                    for entry in it
+                    if entry.name.endswith(_IMAGE_SUFFIXES) and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []
+
+        entries.sort(key=lambda item: item[0], reverse=True)
+        return [
+            {
+                'filename': entry.name,
+                'path': entry.path,
+                'created': datetime.fromtimestamp(mtime).isoformat()
+            }
+            for mtime, entry in entries[:limit]
+        ]
 
 
 # Convenience function for one-off captures
 async def capture_moltbook_url(url: str, output_dir: str = "./screenshots") -> str:
     """Convenience function to capture a single URL"""
     capturer = ScreenshotCapture(output_dir=output_dir)
-    screenshot = await capturer.capture_url(url)
+    try:
+        screenshot = await capturer.capture_url(url)
+    finally:
+        await capturer.aclose()
     return screenshot.path
@@ -5,17 +5,234 @@ Slack Bot for sending Moltbook activity notifications
 import os
 import json
 import asyncio
+import inspect
+import math
+import re
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Callable, Dict, Any, List, Tuple
 import aiohttp
 import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Preview limits for content embedded in Slack blocks
+ACTIVITY_PREVIEW_CHARS = 300
+ALERT_PREVIEW_CHARS = 500
+LINKEDIN_PREVIEW_CHARS = 2000
+SUMMARY_LINKEDIN_CHARS = 1500
+
+# Invariant blocks, shared by reference across messages (never mutated)
+_DIVIDER = {"type": "divider"}
+_X_LABEL = {"type": "section", "text": {"type": "mrkdwn", "text": "*🐦 READY FOR X:*"}}
+_LI_LABEL = {"type": "section", "text": {"type": "mrkdwn", "text": "*💼 READY FOR LINKEDIN:*"}}
+_COPY_X_ACTION = {
+    "type": "actions",
+    "elements": [
+        {
+            "type": "button",
+            "text": {"type": "plain_text", "text": "📋 Copy X Post"},
+            "value": "copy_x",
+            "action_id": "copy_x_content"
+        }
+    ]
+}
+_COPY_LI_ACTION = {
+    "type": "actions",
+    "elements": [
+        {
+            "type": "button",
+            "text": {"type": "plain_text", "text": "📋 Copy LinkedIn Post"},
+            "value": "copy_linkedin",
+            "action_id": "copy_linkedin_content"
+        }
+    ]
+}
+_SUMMARY_X_LABEL = {"type": "section", "text": {"type": "mrkdwn", "text": "*🐦 X Summary Post:*"}}
+_SUMMARY_LI_LABEL = {"type": "section", "text": {"type": "mrkdwn", "text": "*💼 LinkedIn Summary Post:*"}}
+_HEADER_MILESTONE = {
+    "type": "header",
+    "text": {"type": "plain_text", "text": "🎉 Milestone Reached!", "emoji": True}
+}
+_HEADER_HIGH_ENGAGEMENT = {
+    "type": "header",
+    "text": {"type": "plain_text", "text": "🔥 High Engagement Alert!", "emoji": True}
+}
+
+_ACTIVITY_EMOJI = {"post": "📝", "comment": "💬"}
+
+
+def _activity_message(
+    bot_name: str,
+    kind: str,
+    kind_label: str,
+    emoji: str,
+    community: str,
+    preview: str,
+    upvotes: Any,
+    comments: Any,
+    url: str
+) -> Dict[str, Any]:
+    """Build the fallback text and fixed blocks of an activity message"""
+    return {
+        "text": f"New {kind} by {bot_name} in m/{community}",
+        "blocks": [
+            {
+                "type": "header",
+                "text": {
+                    "type": "plain_text",
+                    "text": f"🤖 {bot_name} Activity",
+                    "emoji": True
+                }
+            },
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": f"{emoji} *{kind_label}* in m/{community}"
+                }
+            },
+            _DIVIDER,
+            {
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": f"```{preview}```"}
+            },
+            {
+                "type": "context",
+                "elements": [
+                    {
+                        "type": "mrkdwn",
+                        "text": f"📊 *{upvotes}* upvotes  •  *{comments}* comments  •  <{url}|View on Moltbook>"
+                    }
+                ]
+            },
+            _DIVIDER
+        ]
+    }
+
+
+def _daily_summary_message(
+    day: Any,
+    bot_name: str,
+    posts: Any,
+    comments: Any,
+    karma: Any,
+    communities: Any
+) -> Dict[str, Any]:
+    """Build the fallback text and fixed blocks of a daily summary message"""
+    return {
+        "text": f"Day {day} Summary for {bot_name}",
+        "blocks": [
+            {
+                "type": "header",
+                "text": {
+                    "type": "plain_text",
+                    "text": f"📊 Day {day} Summary - {bot_name}",
+                    "emoji": True
+                }
+            },
+            _DIVIDER,
+            {
+                "type": "section",
+                "fields": [
+                    {"type": "mrkdwn", "text": f"*Posts Today:*\n{posts}"},
+                    {"type": "mrkdwn", "text": f"*Comments Today:*\n{comments}"},
+                    {"type": "mrkdwn", "text": f"*Total Karma:*\n{karma}"},
+                    {"type": "mrkdwn", "text": f"*Communities:*\n{communities}"}
+                ]
+            },
+            _DIVIDER
+        ]
+    }
+
+
+def _json_fragment(value: Any) -> bytes:
+    """Encode str(value) as the inside of a JSON string literal"""
+    return _dumps(str(value))[1:-1]
+
+
+def _json_blocks_tail(blocks: List[dict]) -> bytes:
+    """Encode extra blocks for appending after the last templated block"""
+    return b"," + _dumps(blocks)[1:-1] if blocks else b""
+
+
+# Placeholders survive JSON encoding as \u0000name\u0000
+_SLOT_RE = re.compile(rb"\\u0000(\w+)\\u0000")
+
+
+def _body_template(build: Callable[..., Dict[str, Any]]) -> bytes:
+    """Pre-render a message builder's JSON body as a %-template
+
+    Each builder argument becomes a %(name)s slot for a _json_fragment, and
+    %(extra)s and %(channel)s take _json_blocks_tail and _channel_tail.
+    """
+    names = inspect.signature(build).parameters
+    body = _dumps(build(**{name: f"\x00{name}\x00" for name in names}))
+    body = _SLOT_RE.sub(rb"%(\1)s", body.replace(b"%", b"%%"))
+    return body[:-2] + b"%(extra)s]%(channel)s}"
+
+
+# Pre-rendered JSON bodies for the most frequent messages; the variable fields
+# are spliced in as already-escaped JSON string fragments
+_ACTIVITY_TEMPLATE = _body_template(_activity_message)
+_DAILY_SUMMARY_TEMPLATE = _body_template(_daily_summary_message)
+
+
+# Connection pool shared by every SlackBot in the process
+_shared_connector: Optional[aiohttp.TCPConnector] = None
+_shared_connector_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _get_shared_connector() -> aiohttp.TCPConnector:
+    """Return the process-wide connector, creating it for the running loop if needed"""
+    global _shared_connector, _shared_connector_loop
+    loop = asyncio.get_running_loop()
+    if _shared_connector is None or _shared_connector.closed or _shared_connector_loop is not loop:
+        if _shared_connector is not None and not _shared_connector.closed:
+            # Left over from a previous loop; release its sockets instead of leaking them
+            try:
+                await _shared_connector.close()
+            except Exception as e:
+                logger.warning(f"Failed to close stale Slack connector: {e}")
+        _shared_connector = aiohttp.TCPConnector(
+            limit=50, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=75
+        )
+        _shared_connector_loop = loop
+    return _shared_connector
+
+
+def _truncate(text: str, limit: int, ellipsis: str = "...") -> str:
+    """Clip text to limit characters, appending ellipsis only when something was cut"""
+    return text if len(text) <= limit else f"{text[:limit]}{ellipsis}"
+
+
+def _activity_preview(activity: 'Activity') -> str:
+    """Truncated activity content, headed by the title when there is one"""
+    preview = _truncate(activity.content, ACTIVITY_PREVIEW_CHARS)
+    return f"*{activity.title}*\n\n{preview}" if activity.title else preview
+
 
 class SlackBot:
     """Sends notifications and content to Slack"""
 
+    MAX_CONCURRENT_SENDS = 8
+    QUEUE_MAXSIZE = 1000
+    QUEUE_BATCH_SIZE = 16
+    MAX_RETRIES = 3
+    MAX_RETRY_DELAY = 30.0
+    RETRY_STATUSES = frozenset({429, 500, 502, 503})
+    MAX_ERROR_BODY = 4096
+
     def __init__(
         self,
         webhook_url: Optional[str] = None,
@@ -25,17 +242,109 @@ class SlackBot:
         self.webhook_url = webhook_url or os.environ.get('SLACK_WEBHOOK_URL')
         self.channel = channel
         self.bot_name = bot_name
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
 
         if not self.webhook_url:
             logger.warning("No Slack webhook URL provided - messages will not be sent")
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        connector = await _get_shared_connector()
+        if self._session is None or self._session.closed or self._session.connector is not connector:
+            if self._session is not None and not self._session.closed:
+                # Bound to a replaced connector; the connector itself isn't ours to close
+                await self._session.close()
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10),
+                connector=connector,
+                connector_owner=False
+            )
+        return self._session
+
+    async def start(self):
+        """Start the background worker that posts queued (fire-and-forget) messages"""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.QUEUE_MAXSIZE)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+
+    async def stop(self):
+        """Flush queued messages and stop the background worker"""
+        if self._worker is None:
+            return
+        if not self._worker.done():
+            await self._queue.join()
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+
+    async def _drain(self):
+        """Post queued bodies in concurrent batches until cancelled"""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.QUEUE_BATCH_SIZE and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await asyncio.gather(*(self._post(body) for body in batch), return_exceptions=True)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _dispatch(self, body: bytes, fire_and_forget: bool = False) -> bool:
+        """Post an encoded payload now, or queue it for the background worker"""
+        if not fire_and_forget:
+            return await self._post(body)
+        await self.start()
+        try:
+            self._queue.put_nowait(body)
+        except asyncio.QueueFull:
+            logger.warning("Slack queue full, dropping message")
+            return False
+        return True
+
+    async def aclose(self):
+        """Flush queued messages and close the HTTP session"""
+        await self.stop()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    @classmethod
+    async def shutdown_shared(cls):
+        """Close the connection pool shared by all bots (call at application exit)"""
+        global _shared_connector, _shared_connector_loop, _default_bot
+        if _default_bot is not None:
+            await _default_bot.aclose()
+            _default_bot = None
+        if _shared_connector is not None and not _shared_connector.closed:
+            await _shared_connector.close()
+        _shared_connector = None
+        _shared_connector_loop = None
+
+    async def __aenter__(self) -> 'SlackBot':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
     async def send_message(
         self,
         text: str,
         blocks: Optional[List[dict]] = None,
-        attachments: Optional[List[dict]] = None
+        attachments: Optional[List[dict]] = None,
+        fire_and_forget: bool = False
     ) -> bool:
-        """Send a message to Slack"""
+        """Send a message to Slack
+
+        With fire_and_forget=True the message is queued for the background
+        worker and True is returned once it is accepted.
+        """
         if not self.webhook_url:
             logger.error("No webhook URL configured")
             return False
@@ -48,22 +357,68 @@ class SlackBot:
         if self.channel:
             payload["channel"] = self.channel
 
+        return await self._dispatch(_dumps(payload), fire_and_forget)
+
+    def _channel_tail(self) -> bytes:
+        """Encode the channel override for appending to a templated body"""
+        return b',"channel":' + _dumps(self.channel) if self.channel else b""
+
+    async def _post(self, body: bytes) -> bool:
+        """POST an encoded payload to the webhook, retrying transient failures"""
         try:
-            async with aiohttp.ClientSession() as session:
+            session = await self._get_session()
+            for attempt in range(self.MAX_RETRIES):
                 async with session.post(
                     self.webhook_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
+                    data=body,
+                    headers=_JSON_HEADERS
                 ) as resp:
                     if resp.status == 200:
+                        resp.release()
                         logger.info("Message sent to Slack successfully")
                         return True
-                    else:
-                        logger.error(f"Slack API error: {resp.status} - {await resp.text()}")
-                        return False
+                    # Cap the error body so a large error page can't bloat the logs
+                    error = (await resp.content.read(self.MAX_ERROR_BODY)).decode("utf-8", "replace")
+                    retry_after = resp.headers.get("Retry-After")
+                if resp.status not in self.RETRY_STATUSES or attempt == self.MAX_RETRIES - 1:
+                    logger.error(f"Slack API error: {resp.status} - {error}")
+                    return False
+                delay = self._retry_delay(retry_after, attempt)
+                logger.warning(f"Slack API returned {resp.status}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
         except Exception as e:
             logger.error(f"Failed to send Slack message: {e}")
-            return False
+        return False
+
+    @classmethod
+    def _retry_delay(cls, retry_after: Optional[str], attempt: int) -> float:
+        """Seconds to wait before retrying, honouring Slack's Retry-After header up to MAX_RETRY_DELAY"""
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = math.nan
+        if math.isnan(delay):
+            delay = float(2 ** attempt)
+        return min(max(delay, 0.0), cls.MAX_RETRY_DELAY)
+
+    async def _send_guarded(self, text: str, blocks: Optional[List[dict]] = None) -> bool:
+        """Send a message while holding the concurrency semaphore"""
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self.MAX_CONCURRENT_SENDS)
+        async with self._sem:
+            return await self.send_message(text, blocks=blocks)
+
+    async def send_many(self, messages: List[Tuple[str, Optional[List[dict]]]]) -> List[bool]:
+        """Send several messages concurrently over the shared session
+
+        Args:
+            messages: (text, blocks) pairs, sent at most MAX_CONCURRENT_SENDS at a time
+        """
+        results = await asyncio.gather(
+            *(self._send_guarded(text, blocks) for text, blocks in messages),
+            return_exceptions=True
+        )
+        return [r is True for r in results]
 
     def _format_activity_blocks(
         self,
@@ -72,127 +427,56 @@ class SlackBot:
         linkedin_content: Optional[str] = None,
         screenshot_url: Optional[str] = None
     ) -> List[dict]:
-        """Format activity into Slack blocks"""
-        blocks = []
-
-        # Header
-        emoji = "📝" if activity.type == "post" else "💬" if activity.type == "comment" else "🎯"
-        activity_type = activity.type.upper()
-
-        blocks.append({
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": f"🤖 {self.bot_name} Activity",
-                "emoji": True
-            }
-        })
-
-        # Activity details
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"{emoji} *{activity_type}* in m/{activity.community}"
-            }
-        })
-
-        blocks.append({"type": "divider"})
-
-        # Content preview
-        content_preview = activity.content[:300] + "..." if len(activity.content) > 300 else activity.content
-        if activity.title:
-            content_preview = f"*{activity.title}*\n\n{content_preview}"
+        """Format activity into Slack blocks (dict form, e.g. for send_many)"""
+        blocks = _activity_message(
+            self.bot_name, activity.type, activity.type.upper(),
+            _ACTIVITY_EMOJI.get(activity.type, "🎯"), activity.community,
+            _activity_preview(activity), activity.upvotes, activity.comments_count, activity.url
+        )["blocks"]
+        blocks += self._activity_extra_blocks(x_content, linkedin_content, screenshot_url)
+        return blocks
 
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"```{content_preview}```"
-            }
-        })
+    def _activity_extra_blocks(
+        self,
+        x_content: Optional[str] = None,
+        linkedin_content: Optional[str] = None,
+        screenshot_url: Optional[str] = None
+    ) -> List[dict]:
+        """Format the optional X, LinkedIn and screenshot sections of an activity message"""
+        blocks = []
 
-        # Engagement stats
-        blocks.append({
-            "type": "context",
-            "elements": [
+        if x_content:
+            blocks += [
+                _X_LABEL,
                 {
-                    "type": "mrkdwn",
-                    "text": f"📊 *{activity.upvotes}* upvotes  •  *{activity.comments_count}* comments  •  <{activity.url}|View on Moltbook>"
-                }
+                    "type": "section",
+                    "text": {"type": "mrkdwn", "text": f"```{x_content}```"}
+                },
+                _COPY_X_ACTION,
+                _DIVIDER
             ]
-        })
-
-        blocks.append({"type": "divider"})
 
-        # X content section
-        if x_content:
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*🐦 READY FOR X:*"
-                }
-            })
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"```{x_content}```"
-                }
-            })
-            blocks.append({
-                "type": "actions",
-                "elements": [
-                    {
-                        "type": "button",
-                        "text": {"type": "plain_text", "text": "📋 Copy X Post"},
-                        "value": "copy_x",
-                        "action_id": "copy_x_content"
-                    }
-                ]
-            })
-
-            blocks.append({"type": "divider"})
-
-        # LinkedIn content section
         if linkedin_content:
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*💼 READY FOR LINKEDIN:*"
-                }
-            })
             # LinkedIn content can be longer, so truncate if needed for Slack
-            li_preview = linkedin_content[:2000] + "..." if len(linkedin_content) > 2000 else linkedin_content
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"```{li_preview}```"
-                }
-            })
-            blocks.append({
-                "type": "actions",
-                "elements": [
-                    {
-                        "type": "button",
-                        "text": {"type": "plain_text", "text": "📋 Copy LinkedIn Post"},
-                        "value": "copy_linkedin",
-                        "action_id": "copy_linkedin_content"
-                    }
-                ]
-            })
+            li_preview = _truncate(linkedin_content, LINKEDIN_PREVIEW_CHARS)
+            blocks += [
+                _LI_LABEL,
+                {
+                    "type": "section",
+                    "text": {"type": "mrkdwn", "text": f"```{li_preview}```"}
+                },
+                _COPY_LI_ACTION
+            ]
 
-        # Screenshot
         if screenshot_url:
-            blocks.append({"type": "divider"})
-            blocks.append({
-                "type": "image",
-                "image_url": screenshot_url,
-                "alt_text": "Moltbook screenshot"
-            })
+            blocks += [
+                _DIVIDER,
+                {
+                    "type": "image",
+                    "image_url": screenshot_url,
+                    "alt_text": "Moltbook screenshot"
+                }
+            ]
 
         return blocks
 
@@ -201,96 +485,89 @@ class SlackBot:
         activity: 'Activity',
         x_content: Optional[str] = None,
         linkedin_content: Optional[str] = None,
-        screenshot_url: Optional[str] = None
+        screenshot_url: Optional[str] = None,
+        fire_and_forget: bool = False
     ) -> bool:
         """Send a formatted activity notification"""
-        blocks = self._format_activity_blocks(
-            activity,
-            x_content,
-            linkedin_content,
-            screenshot_url
-        )
-
-        fallback_text = f"New {activity.type} by {self.bot_name} in m/{activity.community}"
-        return await self.send_message(fallback_text, blocks=blocks)
+        if not self.webhook_url:
+            logger.debug("Slack disabled, skipping")
+            return False
+        # Fast path: splice fields into the pre-rendered body instead of
+        # building and encoding the block dicts (_format_activity_blocks)
+        body = _ACTIVITY_TEMPLATE % {
+            b"bot_name": _json_fragment(self.bot_name),
+            b"kind": _json_fragment(activity.type),
+            b"kind_label": _json_fragment(activity.type.upper()),
+            b"emoji": _json_fragment(_ACTIVITY_EMOJI.get(activity.type, "🎯")),
+            b"community": _json_fragment(activity.community),
+            b"preview": _json_fragment(_activity_preview(activity)),
+            b"upvotes": _json_fragment(activity.upvotes),
+            b"comments": _json_fragment(activity.comments_count),
+            b"url": _json_fragment(activity.url),
+            b"extra": _json_blocks_tail(self._activity_extra_blocks(x_content, linkedin_content, screenshot_url)),
+            b"channel": self._channel_tail()
+        }
+        return await self._dispatch(body, fire_and_forget)
 
     async def send_daily_summary(
         self,
         stats: Dict[str, Any],
         x_content: Optional[str] = None,
         linkedin_content: Optional[str] = None,
-        day_number: int = 1
+        day_number: int = 1,
+        fire_and_forget: bool = False
     ) -> bool:
         """Send daily summary to Slack"""
-        blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"📊 Day {day_number} Summary - {self.bot_name}",
-                    "emoji": True
-                }
-            },
-            {"type": "divider"},
-            {
-                "type": "section",
-                "fields": [
-                    {"type": "mrkdwn", "text": f"*Posts Today:*\n{stats.get('posts_today', 0)}"},
-                    {"type": "mrkdwn", "text": f"*Comments Today:*\n{stats.get('comments_today', 0)}"},
-                    {"type": "mrkdwn", "text": f"*Total Karma:*\n{stats.get('current_karma', 0)}"},
-                    {"type": "mrkdwn", "text": f"*Communities:*\n{stats.get('communities_active', 0)}"}
-                ]
-            },
-            {"type": "divider"}
-        ]
+        if not self.webhook_url:
+            logger.debug("Slack disabled, skipping")
+            return False
+        blocks = []
 
         if x_content:
-            blocks.extend([
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": "*🐦 X Summary Post:*"}
-                },
+            blocks += [
+                _SUMMARY_X_LABEL,
                 {
                     "type": "section",
                     "text": {"type": "mrkdwn", "text": f"```{x_content}```"}
                 }
-            ])
+            ]
 
         if linkedin_content:
-            blocks.extend([
-                {"type": "divider"},
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": "*💼 LinkedIn Summary Post:*"}
-                },
+            blocks += [
+                _DIVIDER,
+                _SUMMARY_LI_LABEL,
                 {
                     "type": "section",
-                    "text": {"type": "mrkdwn", "text": f"```{linkedin_content[:1500]}```"}
+                    "text": {"type": "mrkdwn", "text": f"```{_truncate(linkedin_content, SUMMARY_LINKEDIN_CHARS, '')}```"}
                 }
-            ])
+            ]
 
-        return await self.send_message(
-            f"Day {day_number} Summary for {self.bot_name}",
-            blocks=blocks
-        )
+        body = _DAILY_SUMMARY_TEMPLATE % {
+            b"day": _json_fragment(day_number),
+            b"bot_name": _json_fragment(self.bot_name),
+            b"posts": _json_fragment(stats.get('posts_today', 0)),
+            b"comments": _json_fragment(stats.get('comments_today', 0)),
+            b"karma": _json_fragment(stats.get('current_karma', 0)),
+            b"communities": _json_fragment(stats.get('communities_active', 0)),
+            b"extra": _json_blocks_tail(blocks),
+            b"channel": self._channel_tail()
+        }
+        return await self._dispatch(body, fire_and_forget)
 
     async def send_milestone(
         self,
         milestone: str,
         value: int,
         x_content: Optional[str] = None,
-        linkedin_content: Optional[str] = None
+        linkedin_content: Optional[str] = None,
+        fire_and_forget: bool = False
     ) -> bool:
         """Send milestone notification"""
+        if not self.webhook_url:
+            logger.debug("Slack disabled, skipping")
+            return False
         blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "🎉 Milestone Reached!",
-                    "emoji": True
-                }
-            },
+            _HEADER_MILESTONE,
             {
                 "type": "section",
                 "text": {
@@ -298,47 +575,43 @@ class SlackBot:
                     "text": f"*{milestone}*: {value}"
                 }
             },
-            {"type": "divider"}
+            _DIVIDER
         ]
 
         if x_content:
-            blocks.extend([
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": f"*🐦 X Post:*\n```{x_content}```"}
-                }
-            ])
+            blocks.append({
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": f"*🐦 X Post:*\n```{x_content}```"}
+            })
 
         if linkedin_content:
-            blocks.extend([
-                {"type": "divider"},
+            blocks += [
+                _DIVIDER,
                 {
                     "type": "section",
-                    "text": {"type": "mrkdwn", "text": f"*💼 LinkedIn Post:*\n```{linkedin_content[:1500]}```"}
+                    "text": {"type": "mrkdwn", "text": f"*💼 LinkedIn Post:*\n```{_truncate(linkedin_content, SUMMARY_LINKEDIN_CHARS, '')}```"}
                 }
-            ])
+            ]
 
         return await self.send_message(
             f"Milestone: {milestone}",
-            blocks=blocks
+            blocks=blocks,
+            fire_and_forget=fire_and_forget
         )
 
     async def send_high_engagement_alert(
         self,
         activity: 'Activity',
         x_content: Optional[str] = None,
-        linkedin_content: Optional[str] = None
+        linkedin_content: Optional[str] = None,
+        fire_and_forget: bool = False
     ) -> bool:
         """Send alert for high engagement content"""
+        if not self.webhook_url:
+            logger.debug("Slack disabled, skipping")
+            return False
         blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "🔥 High Engagement Alert!",
-                    "emoji": True
-                }
-            },
+            _HEADER_HIGH_ENGAGEMENT,
             {
                 "type": "section",
                 "text": {
@@ -354,10 +627,10 @@ class SlackBot:
                     {"type": "mrkdwn", "text": f"*Community:* m/{activity.community}"}
                 ]
             },
-            {"type": "divider"},
+            _DIVIDER,
             {
                 "type": "section",
-                "text": {"type": "mrkdwn", "text": f"```{activity.content[:500]}```"}
+                "text": {"type": "mrkdwn", "text": f"```{_truncate(activity.content, ALERT_PREVIEW_CHARS, '')}```"}
             },
             {
                 "type": "context",
@@ -368,31 +641,46 @@ class SlackBot:
         ]
 
         if x_content:
-            blocks.extend([
-                {"type": "divider"},
+            blocks += [
+                _DIVIDER,
                 {
                     "type": "section",
                     "text": {"type": "mrkdwn", "text": f"*🐦 X Post:*\n```{x_content}```"}
                 }
-            ])
+            ]
 
         if linkedin_content:
-            blocks.extend([
-                {"type": "divider"},
+            blocks += [
+                _DIVIDER,
                 {
                     "type": "section",
-                    "text": {"type": "mrkdwn", "text": f"*💼 LinkedIn Post:*\n```{linkedin_content[:1500]}```"}
+                    "text": {"type": "mrkdwn", "text": f"*💼 LinkedIn Post:*\n```{_truncate(linkedin_content, SUMMARY_LINKEDIN_CHARS, '')}```"}
                 }
-            ])
+            ]
 
         return await self.send_message(
             f"High engagement alert: {activity.upvotes} upvotes",
-            blocks=blocks
+            blocks=blocks,
+            fire_and_forget=fire_and_forget
         )
 
 
+# Bot for the SLACK_WEBHOOK_URL environment webhook, reused by send_quick_slack
+_default_bot: Optional[SlackBot] = None
+
+
 # Convenience function for quick messages
 async def send_quick_slack(message: str, webhook_url: Optional[str] = None) -> bool:
     """Send a quick message to Slack"""
-    bot = SlackBot(webhook_url=webhook_url)
-    return await bot.send_message(message)
+    global _default_bot
+    if webhook_url is None:
+        env_url = os.environ.get('SLACK_WEBHOOK_URL')
+        if not env_url:
+            logger.debug("Slack disabled, skipping")
+            return False
+        if _default_bot is None or _default_bot.webhook_url != env_url:
+            _default_bot = SlackBot(webhook_url=env_url)
+        return await _default_bot.send_message(message)
+
+    async with SlackBot(webhook_url=webhook_url) as bot:
+        return await bot.send_message(message)
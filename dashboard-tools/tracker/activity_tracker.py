@@ -5,17 +5,74 @@ Persists data to Google Cloud Storage for durability across container restarts
 """
 
 import asyncio
+import atexit
+import io
 import json
 import os
 import re
+import sys
+import uuid
 from datetime import datetime, timedelta
-from typing import Optional, Callable, List, Dict, Any
-from dataclasses import dataclass, asdict, field
+from typing import Optional, Callable, List, Dict, Any, Union, Deque
+from collections import deque
+from itertools import islice
+from dataclasses import dataclass, field
 import logging
 
+import aiohttp
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _dumps_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps_line(obj: Any) -> bytes:
+        return (json.dumps(obj) + '\n').encode('utf-8')
+
+    _loads = json.loads
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.fromisoformat
+
+_KARMA_RE = re.compile(r'(\d+)\s*karma')
+
+# Post dates scraped from the profile page, e.g. "1/30/2026, 4:05:09 PM"
+_POST_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4}),\s*(\d{1,2}):(\d{2}):(\d{2})\s*([AP])M')
+
+
+def _parse_post_date(value: str) -> Optional[datetime]:
+    """Parse a scraped post date without going through strptime"""
+    match = _POST_DATE_RE.fullmatch(value.strip())
+    if not match:
+        return None
+    month, day, year, hour, minute, second, meridiem = match.groups()
+    hour = int(hour)
+    if not 1 <= hour <= 12:
+        return None
+    hour = hour % 12 + (12 if meridiem == 'P' else 0)
+    try:
+        return datetime(int(year), int(month), int(day), hour, int(minute), int(second))
+    except ValueError:
+        return None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Activities go to GCS as concatenated zstd frames when zstandard is available
+_ZSTD_LEVEL = 3
+_LEGACY_ACTIVITIES_BLOB = "activities.jsonl"
+_ACTIVITIES_BLOB = "activities.jsonl.zst" if zstandard else _LEGACY_ACTIVITIES_BLOB
+
 # Playwright imported lazily
 _playwright_module = None
 
@@ -35,21 +92,6 @@ def _get_playwright():
     return _playwright_module
 
 
-# HTTP client for API calls
-_http_session = None
-
-def _get_http_session():
-    global _http_session
-    if _http_session is None:
-        try:
-            import aiohttp
-            _http_session = aiohttp.ClientSession
-        except ImportError:
-            logger.warning("aiohttp not installed, trying requests")
-            return None
-    return _http_session
-
-
 def _get_gcs_client():
     global _gcs_client
     if _gcs_client is None:
@@ -65,7 +107,38 @@ def _get_gcs_client():
     return _gcs_client
 
 
-@dataclass
+_POST_LINK_SELECTOR = 'a[href*="/post/"]'
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
+
+async def _block_heavy_resources(route):
+    """Playwright route handler that aborts requests the scraper doesn't need"""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Uploads up to this size go out as one multipart request (no resumable buffer)
+_GCS_SINGLE_SHOT_MAX = 8 * 1024 * 1024
+_GCS_CHUNK_ALIGN = 256 * 1024
+
+
+def _sized_blob(bucket, blob_name: str, size: int):
+    """Return a blob whose upload chunking is sized to a payload of the given size"""
+    blob = bucket.blob(blob_name)
+    if size <= _GCS_SINGLE_SHOT_MAX:
+        blob.chunk_size = None
+    else:
+        blob.chunk_size = -(-size // _GCS_CHUNK_ALIGN) * _GCS_CHUNK_ALIGN
+    return blob
+
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Activity:
     """Represents a single bot activity"""
     id: str
@@ -81,15 +154,31 @@ class Activity:
     parent_post_id: Optional[str] = None
     parent_post_title: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Activities aren't modified once created, so the serialized form is built once
+    _dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
-        return data
+        if self._dict is None:
+            self._dict = {
+                'id': self.id,
+                'type': self.type,
+                'timestamp': self.timestamp.isoformat(),
+                'community': self.community,
+                'title': self.title,
+                'content': self.content,
+                'url': self.url,
+                'karma': self.karma,
+                'upvotes': self.upvotes,
+                'comments_count': self.comments_count,
+                'parent_post_id': self.parent_post_id,
+                'parent_post_title': self.parent_post_title,
+                'metadata': self.metadata
+            }
+        return self._dict
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Activity':
-        data['timestamp'] = datetime.fromisoformat(data['timestamp'])
+        data['timestamp'] = _parse_iso(data['timestamp'])
         return cls(**data)
 
 
@@ -97,7 +186,12 @@ class ActivityTracker:
     """Tracks agent activity on Moltbook using Playwright"""
 
     MOLTBOOK_BASE = "https://www.moltbook.com"
+    API_BASE = f"{MOLTBOOK_BASE}/api/v1"
     DEFAULT_GCS_BUCKET = "moltbook-dashboard-data"
+    # Polls between rewrites of the tracker_state.json snapshot
+    STATE_COMPACT_INTERVAL = 60
+    # Most recent activities kept in memory
+    MAX_ACTIVITIES_IN_MEMORY = 10000
 
     def __init__(
         self,
@@ -105,20 +199,49 @@ class ActivityTracker:
         poll_interval: int = 60,
         data_dir: str = "./data",
         bot_username: str = "MyAgent",
-        gcs_bucket: Optional[str] = None
+        gcs_bucket: Optional[str] = None,
+        api_key: Optional[str] = None
     ):
         self.on_activity = on_activity
         self.poll_interval = poll_interval
         self.data_dir = data_dir
         self.bot_username = bot_username
         self.GCS_BUCKET = gcs_bucket or self.DEFAULT_GCS_BUCKET
+        # Resolved once; every poll reuses it
+        self.api_key = api_key or os.environ.get('MOLTBOOK_API_KEY', '')
+        self._api_headers = {'Authorization': f'Bearer {self.api_key}'}
         self._running = False
         self._seen_ids: set = set()
-        self._activities: List[Activity] = []
+        self._activities: Deque[Activity] = deque(maxlen=self.MAX_ACTIVITIES_IN_MEMORY)
+        self._activities_by_id: Dict[str, Activity] = {}
         self._last_karma: int = 0
+        # Activity lines not yet appended to the GCS activities blob
+        self._pending_gcs_lines: List[bytes] = []
+        # Playwright browser reused across polls (see _ensure_browser_context)
+        self._pw = None
+        self._browser = None
+        self._context = None
+        self._browser_lock: Optional[asyncio.Lock] = None
+        # HTTP session reused across API polls (see _get_api_session)
+        self._session = None
+        self._owns_session = True
+        # Background GCS writer (see _queue_gcs_write)
+        self._gcs_queue: Optional[asyncio.Queue] = None
+        self._gcs_flusher: Optional[asyncio.Task] = None
+        # Seen ids since the last snapshot are appended to seen_ids.log
+        self._seen_log_file = os.path.join(data_dir, "seen_ids.log")
+        self._polls_since_compact = 0
 
         os.makedirs(data_dir, exist_ok=True)
         self._load_state()
+        self._saved_karma = self._last_karma
+
+        self._seen_log_fh = open(self._seen_log_file, 'a', buffering=1 << 16)
+        atexit.register(lambda: self._seen_log_fh.close())
+
+        # Long-lived buffered handle for local activity appends; flushed once per poll
+        self._activities_fh = open(os.path.join(data_dir, "activities.jsonl"), 'ab', buffering=1 << 16)
+        atexit.register(self._activities_fh.close)
 
     def _gcs_download(self, blob_name: str) -> Optional[str]:
         """Download a file from GCS"""
@@ -134,19 +257,116 @@ class ActivityTracker:
             logger.warning(f"GCS download failed for {blob_name}: {e}")
         return None
 
-    def _gcs_upload(self, blob_name: str, content: str):
+    def _gcs_upload(self, blob_name: str, content: Union[str, bytes]):
         """Upload a file to GCS"""
         client = _get_gcs_client()
         if not client:
             return
         try:
             bucket = client.bucket(self.GCS_BUCKET)
-            blob = bucket.blob(blob_name)
+            blob = _sized_blob(bucket, blob_name, len(content))
             blob.upload_from_string(content)
             logger.debug(f"Uploaded {blob_name} to GCS")
         except Exception as e:
             logger.warning(f"GCS upload failed for {blob_name}: {e}")
 
+    def _gcs_download_compressed(self, blob_name: str) -> Optional[str]:
+        """Download a zstd blob from GCS, decompressing every concatenated frame"""
+        client = _get_gcs_client()
+        if not client or not zstandard:
+            return None
+        try:
+            blob = client.bucket(self.GCS_BUCKET).get_blob(blob_name)
+            if blob is None:
+                return None
+            data = blob.download_as_bytes(raw_download=True)
+            reader = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data), read_across_frames=True)
+            return reader.read().decode('utf-8')
+        except Exception as e:
+            logger.warning(f"GCS download failed for {blob_name}: {e}")
+        return None
+
+    def _gcs_append(self, blob_name: str, content: Union[str, bytes]) -> bool:
+        """Append content to a GCS blob server-side via compose
+
+        The new content is uploaded as a small staging blob and concatenated
+        onto the existing blob, so the existing data is never downloaded or
+        re-uploaded. Returns True when the content is stored.
+        """
+        client = _get_gcs_client()
+        if not client:
+            return True
+        try:
+            bucket = client.bucket(self.GCS_BUCKET)
+            main = bucket.get_blob(blob_name)
+            if main is None:
+                _sized_blob(bucket, blob_name, len(content)).upload_from_string(content, if_generation_match=0)
+                return True
+
+            part = _sized_blob(bucket, f"{blob_name}.parts/{uuid.uuid4().hex}", len(content))
+            part.upload_from_string(content)
+            try:
+                main.compose([main, part], if_generation_match=main.generation)
+            finally:
+                part.delete()
+            logger.debug(f"Appended {len(content)} bytes to {blob_name} in GCS")
+            return True
+        except Exception as e:
+            logger.warning(f"GCS append failed for {blob_name}: {e}")
+            return False
+
+    def _gcs_append_activities(self, content: bytes) -> bool:
+        """Append activity lines to GCS, as one zstd frame when compression is available"""
+        if zstandard:
+            content = zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(content)
+        return self._gcs_append(_ACTIVITIES_BLOB, content)
+
+    async def _flush_gcs_activities(self):
+        """Append buffered activity lines to GCS in a single compose"""
+        if not self._pending_gcs_lines:
+            return
+        lines, self._pending_gcs_lines = self._pending_gcs_lines, []
+        if not await asyncio.to_thread(self._gcs_append_activities, b''.join(lines)):
+            # Keep them (in order) for the next attempt
+            self._pending_gcs_lines[:0] = lines
+
+    def _queue_gcs_write(self, blob_name: str, content: Optional[bytes] = None):
+        """Hand a GCS write to the background flusher
+
+        content=None requests an append of the buffered activity lines.
+        """
+        loop = asyncio.get_running_loop()
+        if self._gcs_flusher is not None and self._gcs_flusher.get_loop() is not loop:
+            # Called from a new event loop (e.g. repeated asyncio.run); start over
+            self._gcs_flusher = None
+            self._gcs_queue = None
+        if self._gcs_queue is None:
+            self._gcs_queue = asyncio.Queue()
+        if self._gcs_flusher is None or self._gcs_flusher.done():
+            self._gcs_flusher = loop.create_task(self._gcs_flush_loop())
+        self._gcs_queue.put_nowait((blob_name, content))
+
+    async def _gcs_flush_loop(self):
+        """Perform queued GCS writes in a worker thread, coalescing repeated uploads"""
+        while True:
+            batch = [await self._gcs_queue.get()]
+            while not self._gcs_queue.empty():
+                batch.append(self._gcs_queue.get_nowait())
+
+            append_activities = any(content is None for _, content in batch)
+            latest = {name: content for name, content in batch if content is not None}
+            try:
+                # Activities first, so state never references unsaved ones
+                if append_activities:
+                    await self._flush_gcs_activities()
+                for name, content in latest.items():
+                    await asyncio.to_thread(self._gcs_upload, name, content)
+            except Exception as e:
+                logger.warning(f"Background GCS write failed: {e}")
+            finally:
+                for _ in batch:
+                    self._gcs_queue.task_done()
+
     def _load_state(self):
         """Load previous state from GCS or disk"""
         state_data = None
@@ -155,7 +375,7 @@ class ActivityTracker:
         gcs_content = self._gcs_download("tracker_state.json")
         if gcs_content:
             try:
-                state_data = json.loads(gcs_content)
+                state_data = _loads(gcs_content)
                 logger.info("Loaded state from GCS")
             except Exception as e:
                 logger.error(f"Failed to parse GCS state: {e}")
@@ -165,8 +385,8 @@ class ActivityTracker:
             state_file = os.path.join(self.data_dir, "tracker_state.json")
             if os.path.exists(state_file):
                 try:
-                    with open(state_file, 'r') as f:
-                        state_data = json.load(f)
+                    with open(state_file, 'rb') as f:
+                        state_data = _loads(f.read())
                     logger.info("Loaded state from local file")
                 except Exception as e:
                     logger.error(f"Failed to load local state: {e}")
@@ -174,6 +394,16 @@ class ActivityTracker:
         if state_data:
             self._seen_ids = set(state_data.get('seen_ids', []))
             self._last_karma = state_data.get('last_karma', 0)
+
+        # Replay ids recorded since the last snapshot
+        if os.path.exists(self._seen_log_file):
+            try:
+                with open(self._seen_log_file, 'r') as f:
+                    self._seen_ids.update(line.rstrip('\n') for line in f if line.strip())
+            except Exception as e:
+                logger.error(f"Failed to replay seen ids log: {e}")
+
+        if self._seen_ids or state_data:
             logger.info(f"Restored state: {len(self._seen_ids)} seen activities, karma={self._last_karma}")
 
         # Also load activities
@@ -183,8 +413,11 @@ class ActivityTracker:
         """Load activities from GCS or disk"""
         activities_content = None
 
-        # Try GCS first
-        gcs_content = self._gcs_download("activities.jsonl")
+        # Try GCS first (uncompressed data from before zstd, then the zstd blob)
+        gcs_parts = [self._gcs_download(_LEGACY_ACTIVITIES_BLOB)]
+        if _ACTIVITIES_BLOB != _LEGACY_ACTIVITIES_BLOB:
+            gcs_parts.append(self._gcs_download_compressed(_ACTIVITIES_BLOB))
+        gcs_content = '\n'.join(part for part in gcs_parts if part)
         if gcs_content:
             activities_content = gcs_content
             logger.info("Loaded activities from GCS")
@@ -203,127 +436,194 @@ class ActivityTracker:
             for line in activities_content.strip().split('\n'):
                 if line.strip():
                     try:
-                        activity = Activity.from_dict(json.loads(line))
-                        self._activities.append(activity)
+                        activity = Activity.from_dict(_loads(line))
+                        self._remember(activity)
                         self._seen_ids.add(activity.id)
                     except Exception as e:
                         logger.error(f"Failed to parse activity: {e}")
             logger.info(f"Loaded {len(self._activities)} activities from storage")
 
-    def _save_state(self):
-        """Save state to both GCS and disk"""
+    def _mark_seen(self, activity_id: str):
+        """Record an activity id as seen (appended to the delta log)"""
+        self._seen_ids.add(activity_id)
+        try:
+            self._seen_log_fh.write(activity_id + '\n')
+        except Exception as e:
+            logger.error(f"Failed to log seen id: {e}")
+
+    def _save_state(self, force: bool = False):
+        """Save state to both GCS and disk
+
+        New seen ids are already in the delta log, so the full snapshot is
+        only rewritten when karma changes or every STATE_COMPACT_INTERVAL
+        polls (or when forced), at which point the log is truncated.
+        """
+        try:
+            self._seen_log_fh.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush seen ids log: {e}")
+
+        # GCS writes happen in the background flusher, off the event loop
+        self._queue_gcs_write(_ACTIVITIES_BLOB)
+
+        self._polls_since_compact += 1
+        if not (force or self._last_karma != self._saved_karma
+                or self._polls_since_compact >= self.STATE_COMPACT_INTERVAL):
+            return
+
         state_data = {
             'seen_ids': list(self._seen_ids),
             'last_karma': self._last_karma
         }
-        state_json = json.dumps(state_data)
+        state_json = _dumps_line(state_data)
 
-        # Save to local file
+        # Save to local file atomically, then start a fresh delta log
         state_file = os.path.join(self.data_dir, "tracker_state.json")
         try:
-            with open(state_file, 'w') as f:
+            tmp_file = state_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
                 f.write(state_json)
+            os.replace(tmp_file, state_file)
+            self._seen_log_fh.close()
+            self._seen_log_fh = open(self._seen_log_file, 'w', buffering=1 << 16)
         except Exception as e:
             logger.error(f"Failed to save local state: {e}")
 
-        # Save to GCS
-        self._gcs_upload("tracker_state.json", state_json)
+        self._queue_gcs_write("tracker_state.json", state_json)
+        self._saved_karma = self._last_karma
+        self._polls_since_compact = 0
 
     def _save_activity(self, activity: Activity):
         """Save activity to both GCS and disk"""
-        activity_json = json.dumps(activity.to_dict())
+        activity_line = _dumps_line(activity.to_dict())
 
-        # Append to local file
-        activities_file = os.path.join(self.data_dir, "activities.jsonl")
+        # Append to local file (buffered, flushed in check_for_updates)
         try:
-            with open(activities_file, 'a') as f:
-                f.write(activity_json + '\n')
+            self._activities_fh.write(activity_line)
         except Exception as e:
             logger.error(f"Failed to save local activity: {e}")
 
-        # For GCS, we need to append to existing content
-        existing = self._gcs_download("activities.jsonl") or ""
-        new_content = existing + activity_json + '\n'
-        self._gcs_upload("activities.jsonl", new_content)
+        # Buffered for GCS; appended in one compose by _save_state
+        self._pending_gcs_lines.append(activity_line)
+
+    def _remember(self, activity: Activity):
+        """Keep an activity in memory, indexed by id"""
+        if len(self._activities) == self._activities.maxlen:
+            evicted = self._activities[0]
+            if self._activities_by_id.get(evicted.id) is evicted:
+                del self._activities_by_id[evicted.id]
+        self._activities.append(activity)
+        self._activities_by_id[activity.id] = activity
+
+    def _tail(self, limit: int) -> List[Activity]:
+        """Return the newest ``limit`` in-memory activities, oldest first"""
+        total = len(self._activities)
+        return list(islice(self._activities, max(0, total - limit), total))
 
     def load_activities(self, limit: int = 100) -> List[Activity]:
         """Load recent activities from memory (already loaded from storage)"""
-        return self._activities[-limit:]
+        return self._tail(limit)
+
+    def get_activity_by_id(self, activity_id: str) -> Optional[Activity]:
+        """Look up an in-memory activity by id"""
+        return self._activities_by_id.get(activity_id)
+
+    async def _get_api_session(self):
+        """Return the pooled HTTP session for API calls, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16, limit_per_host=8, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+            self._owns_session = True
+        return self._session
+
+    def use_session(self, session: 'aiohttp.ClientSession'):
+        """Poll through a session owned by the caller, sharing its connection pool"""
+        self._session = session
+        self._owns_session = False
 
     async def _fetch_with_api(self) -> Dict[str, Any]:
         """Fetch bot data using Moltbook API (much more reliable than scraping)"""
-        import os
         result = {'karma': 0, 'posts': [], 'comments_count': 0}
 
-        api_key = os.environ.get('MOLTBOOK_API_KEY', '')
-        if not api_key:
+        if not self.api_key:
             logger.warning("MOLTBOOK_API_KEY not set, cannot fetch from API")
             return result
 
-        headers = {'Authorization': f'Bearer {api_key}'}
-        base_url = 'https://www.moltbook.com/api/v1'
-
-        try:
-            import aiohttp
-            async with aiohttp.ClientSession() as session:
-                # Get agent profile
-                async with session.get(
-                    f'{base_url}/agents/profile?name={self.bot_username}',
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        if data.get('success'):
-                            agent = data.get('agent', {})
-                            result['karma'] = agent.get('karma', 0)
-
-                            # Process recent posts from profile
-                            for post in data.get('recentPosts', []):
-                                result['posts'].append({
-                                    'id': post.get('id'),
-                                    'community': post.get('submolt', {}).get('name', 'unknown'),
-                                    'title': post.get('title', ''),
-                                    'content': post.get('content', ''),
-                                    'date': post.get('created_at'),
-                                    'upvotes': post.get('upvotes', 0),
-                                    'comments': post.get('comment_count', 0)
-                                })
-                            logger.info(f"API fetch: karma={result['karma']}, posts={len(result['posts'])}")
-                    else:
-                        logger.error(f"API profile fetch failed: {resp.status}")
-
-                # Get recent comments by this agent
-                async with session.get(
-                    f'{base_url}/agents/{self.bot_username}/comments?limit=50',
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        if data.get('success'):
-                            result['comments_count'] = len(data.get('comments', []))
-                            # Could also process individual comments here if needed
-
-        except ImportError:
-            logger.error("aiohttp not installed - run: pip install aiohttp")
-        except Exception as e:
-            logger.error(f"API fetch failed: {e}")
+        headers = self._api_headers
+        base_url = self.API_BASE
+
+        async def fetch_profile(session) -> Dict[str, Any]:
+            profile = {'karma': 0, 'posts': []}
+            async with session.get(
+                f'{base_url}/agents/profile?name={self.bot_username}',
+                headers=headers
+            ) as resp:
+                if resp.status == 200:
+                    data = await resp.json()
+                    if data.get('success'):
+                        agent = data.get('agent', {})
+                        profile['karma'] = agent.get('karma', 0)
+
+                        # Process recent posts from profile
+                        for post in data.get('recentPosts', []):
+                            profile['posts'].append({
+                                'id': post.get('id'),
+                                'community': post.get('submolt', {}).get('name', 'unknown'),
+                                'title': post.get('title', ''),
+                                'content': post.get('content', ''),
+                                'date': post.get('created_at'),
+                                'upvotes': post.get('upvotes', 0),
+                                'comments': post.get('comment_count', 0)
+                            })
+                        logger.info(f"API fetch: karma={profile['karma']}, posts={len(profile['posts'])}")
+                else:
+                    logger.error(f"API profile fetch failed: {resp.status}")
+            return profile
+
+        async def fetch_comments(session) -> Dict[str, Any]:
+            # Get recent comments by this agent
+            comments = {}
+            async with session.get(
+                f'{base_url}/agents/{self.bot_username}/comments?limit=50',
+                headers=headers
+            ) as resp:
+                if resp.status == 200:
+                    data = await resp.json()
+                    if data.get('success'):
+                        comments['comments_count'] = len(data.get('comments', []))
+                        # Could also process individual comments here if needed
+            return comments
+
+        session = await self._get_api_session()
+
+        # The two endpoints are independent, so fetch them concurrently
+        for part in await asyncio.gather(
+            fetch_profile(session), fetch_comments(session), return_exceptions=True
+        ):
+            if isinstance(part, Exception):
+                logger.error(f"API fetch failed: {part}")
+            else:
+                result.update(part)
 
         return result
 
-    async def _fetch_with_playwright(self) -> Dict[str, Any]:
-        """Fetch profile page using Playwright and extract data"""
+    async def _ensure_browser_context(self):
+        """Return the long-lived browser context, launching Chromium on first use"""
         async_playwright = _get_playwright()
         if not async_playwright:
-            return {'karma': 0, 'posts': []}
+            return None
 
-        result = {'karma': 0, 'posts': []}
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
 
-        try:
-            async with async_playwright() as p:
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._pw is None:
+                    self._pw = await async_playwright().start()
                 # Launch with args to avoid headless detection
-                browser = await p.chromium.launch(
+                self._browser = await self._pw.chromium.launch(
                     headless=True,
                     args=[
                         '--disable-blink-features=AutomationControlled',
@@ -331,98 +631,143 @@ class ActivityTracker:
                         '--no-sandbox'
                     ]
                 )
-                context = await browser.new_context(
+                self._context = None
+            if self._context is None:
+                self._context = await self._browser.new_context(
                     viewport={'width': 1280, 'height': 800},
                     user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
                     java_script_enabled=True
                 )
                 # Remove webdriver property
-                await context.add_init_script("""
+                await self._context.add_init_script("""
                     Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
                 """)
-                page = await context.new_page()
-
-                url = f"{self.MOLTBOOK_BASE}/u/{self.bot_username}"
-                logger.info(f"Fetching {url} with Playwright...")
+                # Only the DOM is scraped, so skip images, fonts and media
+                await self._context.route("**/*", _block_heavy_resources)
+        return self._context
+
+    async def aclose(self):
+        """Finish pending GCS writes, close the API session and browser, and stop Playwright"""
+        # Final snapshot, so the next start doesn't have to replay the delta log
+        self._save_state(force=True)
+        if self._gcs_flusher is not None:
+            if not self._gcs_flusher.done():
+                await self._gcs_queue.join()
+                self._gcs_flusher.cancel()
+                try:
+                    await self._gcs_flusher
+                except asyncio.CancelledError:
+                    pass
+            self._gcs_flusher = None
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        for resource in (self._context, self._browser):
+            if resource is not None:
+                try:
+                    await resource.close()
+                except Exception as e:
+                    logger.warning(f"Failed to close Playwright resource: {e}")
+        self._context = None
+        self._browser = None
+        if self._pw is not None:
+            await self._pw.stop()
+            self._pw = None
 
-                # Navigate and wait for network to settle
-                response = await page.goto(url, wait_until='networkidle', timeout=60000)
-                logger.info(f"Page response status: {response.status if response else 'None'}")
+    async def _fetch_with_playwright(self) -> Dict[str, Any]:
+        """Fetch profile page using Playwright and extract data"""
+        result = {'karma': 0, 'posts': []}
 
-                # Additional wait for React/Next.js to hydrate
-                await asyncio.sleep(5)
+        page = None
+        try:
+            context = await self._ensure_browser_context()
+            if context is None:
+                return result
+            page = await context.new_page()
 
-                # Try to wait for actual content
-                try:
-                    await page.wait_for_function(
-                        "() => !document.body.innerText.includes('Loading...')",
-                        timeout=15000
-                    )
-                    logger.info("Page finished loading (no more Loading...)")
-                except:
-                    logger.warning("Page still showing Loading... after wait")
-
-                # Check current URL
-                current_url = page.url
-                logger.info(f"Current URL: {current_url}")
-
-                # Get page content
-                content = await page.content()
-
-                # Extract karma
-                karma_match = re.search(r'(\d+)\s*karma', content)
-                if karma_match:
-                    result['karma'] = int(karma_match.group(1))
-                    logger.info(f"Found karma: {result['karma']}")
-
-                # Debug: count post links
-                link_count = await page.evaluate('() => document.querySelectorAll("a[href*=\\"/post/\\"]").length')
-                logger.info(f"Found {link_count} post links on page")
-
-                # Debug: log all hrefs
-                all_hrefs = await page.evaluate('() => Array.from(document.querySelectorAll("a")).slice(0, 20).map(a => a.href)')
-                logger.info(f"Sample hrefs: {all_hrefs[:5]}")
-
-                # Extract posts using page evaluation
-                posts_data = await page.evaluate('''() => {
-                    const posts = [];
-                    const postLinks = document.querySelectorAll('a[href*="/post/"]');
-                    const seenIds = new Set();
-
-                    postLinks.forEach(link => {
-                        const href = link.getAttribute('href') || link.href || '';
-                        const match = href.match(/\\/post\\/([a-f0-9-]{36})/);
-                        if (match && !seenIds.has(match[1])) {
-                            seenIds.add(match[1]);
-                            const container = link.closest('a') || link;
-                            const text = container.textContent || '';
-                            const communityMatch = text.match(/m\\/([a-zA-Z0-9_-]+)/);
-                            const dateMatch = text.match(/(\\d{1,2}\\/\\d{1,2}\\/\\d{4},\\s*\\d{1,2}:\\d{2}:\\d{2}\\s*[AP]M)/);
-                            const heading = container.querySelector('h1, h2, h3, h4');
-                            const title = heading ? heading.textContent.trim() : '';
-                            const upvotesMatch = text.match(/[⬆▲]\\s*(\\d+)/);
-                            const commentsMatch = text.match(/💬\\s*(\\d+)\\s*comment/i);
-
-                            posts.push({
-                                id: match[1],
-                                community: communityMatch ? communityMatch[1] : 'unknown',
-                                title: title,
-                                date: dateMatch ? dateMatch[1] : null,
-                                upvotes: upvotesMatch ? parseInt(upvotesMatch[1]) : 0,
-                                comments: commentsMatch ? parseInt(commentsMatch[1]) : 0
-                            });
-                        }
-                    });
-                    return posts;
-                }''')
+            url = f"{self.MOLTBOOK_BASE}/u/{self.bot_username}"
+            logger.info(f"Fetching {url} with Playwright...")
 
-                result['posts'] = posts_data
-                logger.info(f"Found {len(posts_data)} posts")
+            # Navigate, then proceed as soon as post links have rendered
+            response = await page.goto(url, wait_until='domcontentloaded', timeout=60000)
+            logger.info(f"Page response status: {response.status if response else 'None'}")
 
-                await browser.close()
+            try:
+                await page.wait_for_selector(_POST_LINK_SELECTOR, timeout=15000)
+                logger.info("Page finished loading (post links rendered)")
+            except Exception:
+                logger.warning("No post links rendered after wait")
+
+            # Check current URL
+            current_url = page.url
+            logger.info(f"Current URL: {current_url}")
+
+            # Get page content
+            content = await page.content()
+
+            # Extract karma
+            karma_match = _KARMA_RE.search(content)
+            if karma_match:
+                result['karma'] = int(karma_match.group(1))
+                logger.info(f"Found karma: {result['karma']}")
+
+            # Debug: count post links
+            link_count = await page.evaluate('() => document.querySelectorAll("a[href*=\\"/post/\\"]").length')
+            logger.info(f"Found {link_count} post links on page")
+
+            # Debug: log all hrefs
+            all_hrefs = await page.evaluate('() => Array.from(document.querySelectorAll("a")).slice(0, 20).map(a => a.href)')
+            logger.info(f"Sample hrefs: {all_hrefs[:5]}")
+
+            # Extract posts using page evaluation
+            posts_data = await page.evaluate('''() => {
+                const POST_ID_RE = /\\/post\\/([a-f0-9-]{36})/;
+                // One pass over the card text; the first match of each named group wins
+                const FIELDS_RE = /m\\/(?<community>[a-zA-Z0-9_-]+)|(?<date>\\d{1,2}\\/\\d{1,2}\\/\\d{4},\\s*\\d{1,2}:\\d{2}:\\d{2}\\s*[AP]M)|[⬆▲]\\s*(?<upvotes>\\d+)|💬\\s*(?<comments>\\d+)\\s*[Cc][Oo][Mm][Mm][Ee][Nn][Tt]/g;
+                const posts = [];
+                const postLinks = document.querySelectorAll('a[href*="/post/"]');
+                const seenIds = new Set();
+
+                postLinks.forEach(link => {
+                    const href = link.getAttribute('href') || link.href || '';
+                    const match = href.match(POST_ID_RE);
+                    if (match && !seenIds.has(match[1])) {
+                        seenIds.add(match[1]);
+                        const text = link.textContent || '';
+                        const fields = {};
+                        for (const m of text.matchAll(FIELDS_RE)) {
+                            for (const name in m.groups) {
+                                if (m.groups[name] !== undefined && !(name in fields)) {
+                                    fields[name] = m.groups[name];
+                                }
+                            }
+                        }
+                        const heading = link.querySelector('h1, h2, h3, h4');
+
+                        posts.push({
+                            id: match[1],
+                            community: fields.community || 'unknown',
+                            title: heading ? heading.textContent.trim() : '',
+                            date: fields.date || null,
+                            upvotes: fields.upvotes ? parseInt(fields.upvotes) : 0,
+                            comments: fields.comments ? parseInt(fields.comments) : 0
+                        });
+                    }
+                });
+                return posts;
+            }''')
+
+            result['posts'] = posts_data
+            logger.info(f"Found {len(posts_data)} posts")
 
         except Exception as e:
             logger.error(f"Playwright fetch failed: {e}")
+        finally:
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
 
         return result
 
@@ -431,8 +776,7 @@ class ActivityTracker:
         new_activities = []
 
         # Try API first (much more reliable), fall back to Playwright
-        import os
-        if os.environ.get('MOLTBOOK_API_KEY'):
+        if self.api_key:
             data = await self._fetch_with_api()
         else:
             logger.info("No API key, falling back to Playwright scraping")
@@ -479,14 +823,11 @@ class ActivityTracker:
         for post in posts:
             activity_id = f"post_{post['id']}"
             if activity_id not in self._seen_ids:
-                self._seen_ids.add(activity_id)
+                self._mark_seen(activity_id)
 
                 timestamp = datetime.now()
                 if post.get('date'):
-                    try:
-                        timestamp = datetime.strptime(post['date'].strip(), '%m/%d/%Y, %I:%M:%S %p')
-                    except:
-                        pass
+                    timestamp = _parse_post_date(post['date']) or timestamp
 
                 activity = Activity(
                     id=activity_id,
@@ -506,7 +847,7 @@ class ActivityTracker:
         # Save new activities
         for activity in new_activities:
             self._save_activity(activity)
-            self._activities.append(activity)
+            self._remember(activity)
 
             if self.on_activity:
                 try:
@@ -514,6 +855,10 @@ class ActivityTracker:
                 except Exception as e:
                     logger.error(f"Activity callback failed: {e}")
 
+        try:
+            self._activities_fh.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush local activities: {e}")
         self._save_state()
         return new_activities
 
@@ -533,32 +878,54 @@ class ActivityTracker:
             await asyncio.sleep(self.poll_interval)
 
     def stop(self):
-        """Stop the activity tracking loop"""
+        """Stop the activity tracking loop (call aclose() to release the browser)"""
         self._running = False
         logger.info("Stopping activity tracker")
 
     def get_recent_activities(self, limit: int = 50) -> List[Activity]:
         """Get recent activities from memory"""
-        return self._activities[-limit:]
+        return self._tail(limit)
 
     def get_stats(self) -> dict:
         """Get summary statistics"""
-        activities = self._activities  # Use in-memory activities
         now = datetime.now()
         today = now.replace(hour=0, minute=0, second=0, microsecond=0)
         week_ago = now - timedelta(days=7)
 
-        posts = [a for a in activities if a.type == 'post']
-        comments = [a for a in activities if a.type == 'comment']
+        # Single pass over the in-memory activities
+        total_posts = total_comments = 0
+        posts_today = comments_today = 0
+        posts_this_week = comments_this_week = 0
+        total_upvotes = 0
+        communities = set()
+        for a in self._activities:
+            total_upvotes += a.upvotes
+            if a.community:
+                communities.add(a.community)
+            kind = a.type
+            if kind == 'post':
+                total_posts += 1
+                ts = a.timestamp
+                if ts >= week_ago:
+                    posts_this_week += 1
+                    if ts >= today:
+                        posts_today += 1
+            elif kind == 'comment':
+                total_comments += 1
+                ts = a.timestamp
+                if ts >= week_ago:
+                    comments_this_week += 1
+                    if ts >= today:
+                        comments_today += 1
 
         return {
-            'total_posts': len(posts),
-            'total_comments': len(comments),
-            'posts_today': len([a for a in posts if a.timestamp >= today]),
-            'comments_today': len([a for a in comments if a.timestamp >= today]),
-            'posts_this_week': len([a for a in posts if a.timestamp >= week_ago]),
-            'comments_this_week': len([a for a in comments if a.timestamp >= week_ago]),
+            'total_posts': total_posts,
+            'total_comments': total_comments,
+            'posts_today': posts_today,
+            'comments_today': comments_today,
+            'posts_this_week': posts_this_week,
+            'comments_this_week': comments_this_week,
             'current_karma': self._last_karma,
-            'total_upvotes': sum(a.upvotes for a in activities),
-            'communities_active': len(set(a.community for a in activities if a.community))
+            'total_upvotes': total_upvotes,
+            'communities_active': len(communities)
         }
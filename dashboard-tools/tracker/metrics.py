@@ -2,28 +2,60 @@
 Metrics Collector for tracking bot performance over time
 """
 
+import atexit
 import json
+import mmap
 import os
+import re
+import threading
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
-from collections import defaultdict
+from collections import defaultdict, deque
 import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _dumps_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps_line(obj: Any) -> bytes:
+        return (json.dumps(obj) + '\n').encode('utf-8')
+
+    _loads = json.loads
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.fromisoformat
+
+# Raw ISO timestamp of a serialized MetricPoint line, for cheap since-filtering
+_TIMESTAMP_RE = re.compile(rb'"timestamp":\s*"([^"]+)"')
+
 
 @dataclass
 class MetricPoint:
     """A single metric data point"""
+    __slots__ = ('timestamp', 'metric', 'value', 'tags', '_iso')
+
     timestamp: datetime
     metric: str
     value: float
     tags: Dict[str, str]
 
+    def __post_init__(self):
+        self._iso: Optional[str] = None
+
     def to_dict(self) -> dict:
+        if self._iso is None:
+            self._iso = self.timestamp.isoformat()
         return {
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self._iso,
             'metric': self.metric,
             'value': self.value,
             'tags': self.tags
@@ -32,7 +64,7 @@ class MetricPoint:
     @classmethod
     def from_dict(cls, data: dict) -> 'MetricPoint':
         return cls(
-            timestamp=datetime.fromisoformat(data['timestamp']),
+            timestamp=_parse_iso(data['timestamp']),
             metric=data['metric'],
             value=data['value'],
             tags=data.get('tags', {})
@@ -42,10 +74,163 @@ class MetricPoint:
 class MetricsCollector:
     """Collects and aggregates bot metrics over time"""
 
+    # Persist the daily aggregates after this many unsaved records
+    DAILY_SAVE_INTERVAL = 100
+    # Bytes of the mapped metrics file split per step when reading backwards
+    READ_BLOCK_SIZE = 1 << 20
+
     def __init__(self, data_dir: str = "./data"):
         self.data_dir = data_dir
         self.metrics_file = os.path.join(data_dir, "metrics.jsonl")
+        # Byte ranges of each metric's lines in metrics_file, one JSON entry per line
+        self.index_file = os.path.join(data_dir, "metrics.index.jsonl")
+        # Per-day sums of each metric, plus how far into metrics_file they cover
+        self.daily_file = os.path.join(data_dir, "daily_aggregates.json")
         os.makedirs(data_dir, exist_ok=True)
+        # record() runs on the event loop while readers run in worker threads;
+        # the lock guards the handles, the index and the daily sums
+        self._lock = threading.Lock()
+        self._fh = None
+        self._index_fh = None
+        self._index: Optional[Dict[str, List[Tuple[int, int]]]] = None
+        self._end = 0
+        self._daily: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(int))
+        self._daily_end = 0
+        self._daily_unsaved = 0
+        self._load_daily()
+
+    def _handle(self):
+        """Return the long-lived buffered append handle, opening it on first use"""
+        if self._fh is None or self._fh.closed:
+            # Make sure the index covers everything already on disk before appending
+            self._load_index()
+            self._fh = open(self.metrics_file, 'ab', buffering=1 << 16)
+            self._end = self._fh.tell()
+            atexit.register(self._fh.close)
+        return self._fh
+
+    def _index_handle(self):
+        """Return the buffered append handle for the index file"""
+        if self._index_fh is None or self._index_fh.closed:
+            self._index_fh = open(self.index_file, 'ab', buffering=1 << 16)
+            atexit.register(self._index_fh.close)
+        return self._index_fh
+
+    def _load_index(self) -> Dict[str, List[Tuple[int, int]]]:
+        """Return the per-metric (offset, length) index, rebuilding it if stale. Call with _lock held."""
+        if self._index is not None:
+            return self._index
+
+        self._flush()
+        size = os.path.getsize(self.metrics_file) if os.path.exists(self.metrics_file) else 0
+        index = defaultdict(list)
+        end = 0
+        if os.path.exists(self.index_file):
+            try:
+                with open(self.index_file, 'rb') as f:
+                    for line in f:
+                        entry = _loads(line)
+                        index[entry['metric']].append((entry['offset'], entry['length']))
+                        end = max(end, entry['offset'] + entry['length'])
+            except Exception as e:
+                logger.warning(f"Failed to read metrics index, rebuilding: {e}")
+                end = -1
+
+        if end != size:
+            index = self._rebuild_index()
+        self._index = index
+        return index
+
+    def _rebuild_index(self) -> Dict[str, List[Tuple[int, int]]]:
+        """Scan metrics_file once and rewrite the index file from it"""
+        if self._index_fh is not None and not self._index_fh.closed:
+            self._index_fh.close()
+        index = defaultdict(list)
+        entries = []
+        if os.path.exists(self.metrics_file):
+            offset = 0
+            with open(self.metrics_file, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        try:
+                            metric = _loads(line)['metric']
+                            index[metric].append((offset, len(line)))
+                            entries.append(_dumps_line({'metric': metric, 'offset': offset, 'length': len(line)}))
+                        except Exception as e:
+                            logger.error(f"Skipping unreadable metric line at {offset}: {e}")
+                    offset += len(line)
+        with open(self.index_file, 'wb') as f:
+            f.write(b''.join(entries))
+        logger.info(f"Rebuilt metrics index ({len(entries)} entries)")
+        return index
+
+    def _load_daily(self):
+        """Load the daily aggregates, catching up on any lines they don't cover yet"""
+        if os.path.exists(self.daily_file):
+            try:
+                with open(self.daily_file, 'rb') as f:
+                    data = _loads(f.read())
+                for day, sums in data['days'].items():
+                    self._daily[day].update(sums)
+                self._daily_end = data['end']
+            except Exception as e:
+                logger.warning(f"Failed to read daily aggregates, rebuilding: {e}")
+                self._daily.clear()
+                self._daily_end = 0
+
+        size = os.path.getsize(self.metrics_file) if os.path.exists(self.metrics_file) else 0
+        if self._daily_end > size:
+            # metrics_file was truncated or replaced; start over
+            self._daily.clear()
+            self._daily_end = 0
+        if self._daily_end == size:
+            return
+
+        with open(self.metrics_file, 'rb') as f:
+            f.seek(self._daily_end)
+            for line in f:
+                if line.strip():
+                    try:
+                        data = _loads(line)
+                        self._daily[data['timestamp'][:10]][data['metric']] += data['value']
+                    except Exception as e:
+                        logger.error(f"Skipping unreadable metric line in daily aggregates: {e}")
+        self._daily_end = size
+        self._save_daily()
+
+    def _save_daily(self):
+        """Atomically write the daily aggregates sidecar. Call with _lock held."""
+        self._flush()
+        tmp_file = self.daily_file + '.tmp'
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps_line({'end': self._daily_end, 'days': self._daily}))
+            os.replace(tmp_file, self.daily_file)
+            self._daily_unsaved = 0
+        except Exception as e:
+            logger.error(f"Failed to save daily aggregates: {e}")
+
+    def _flush(self):
+        """Write buffered metric points to disk. Call with _lock held."""
+        for fh in (self._fh, self._index_fh):
+            if fh is not None and not fh.closed:
+                fh.flush()
+
+    def flush(self):
+        """Write buffered metric points to disk"""
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        """Flush and close the metrics and index files"""
+        with self._lock:
+            if self._daily_unsaved:
+                self._save_daily()
+            for fh in (self._fh, self._index_fh):
+                if fh is not None and not fh.closed:
+                    fh.close()
+            self._fh = None
+            self._index_fh = None
 
     def record(self, metric: str, value: float, tags: Optional[Dict[str, str]] = None):
         """Record a metric data point"""
@@ -57,8 +242,22 @@ class MetricsCollector:
         )
 
         try:
-            with open(self.metrics_file, 'a') as f:
-                f.write(json.dumps(point.to_dict()) + '\n')
+            line = _dumps_line(point.to_dict())
+            with self._lock:
+                fh = self._handle()
+                offset = self._end
+                fh.write(line)
+                self._end += len(line)
+                self._index_handle().write(
+                    _dumps_line({'metric': metric, 'offset': offset, 'length': len(line)})
+                )
+                self._index[metric].append((offset, len(line)))
+
+                self._daily[point.timestamp.strftime('%Y-%m-%d')][metric] += value
+                self._daily_end = self._end
+                self._daily_unsaved += 1
+                if self._daily_unsaved >= self.DAILY_SAVE_INTERVAL:
+                    self._save_daily()
         except Exception as e:
             logger.error(f"Failed to record metric: {e}")
 
@@ -68,23 +267,80 @@ class MetricsCollector:
         since: Optional[datetime] = None,
         limit: int = 10000
     ) -> List[MetricPoint]:
-        """Load metrics from disk"""
-        metrics = []
+        """Load metrics from disk
+
+        A single metric is read through the byte-offset index. Otherwise the
+        file is memory-mapped and walked backwards from the end until
+        ``limit`` points are found; lines are pre-filtered on their raw ISO
+        timestamp so only candidates are JSON-decoded.
+        """
         if not os.path.exists(self.metrics_file):
-            return metrics
+            return []
+        if metric_name:
+            return self._load_indexed(metric_name, since, limit)
+
+        # Read only what is on disk now; record() may keep appending meanwhile
+        with self._lock:
+            self._flush()
+            size = os.path.getsize(self.metrics_file)
+
+        metrics = deque()
+        since_iso = since.isoformat().encode() if since else None
 
         try:
-            with open(self.metrics_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        point = MetricPoint.from_dict(json.loads(line))
-                        if metric_name and point.metric != metric_name:
-                            continue
-                        if since and point.timestamp < since:
-                            continue
-                        metrics.append(point)
-
-            return metrics[-limit:]
+            with open(self.metrics_file, 'rb') as f:
+                if size == 0:
+                    return []
+                with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                    end = size
+                    while end > 0 and len(metrics) < limit:
+                        # Take a block that starts on a line boundary and split it in C
+                        start = max(0, end - self.READ_BLOCK_SIZE)
+                        if start:
+                            start = mm.rfind(b'\n', 0, start) + 1
+                        for line in reversed(mm[start:end].splitlines()):
+                            if not line.strip():
+                                continue
+                            if since_iso:
+                                ts_match = _TIMESTAMP_RE.search(line)
+                                if ts_match and ts_match.group(1) < since_iso:
+                                    continue
+                            point = MetricPoint.from_dict(_loads(line))
+                            if since and point.timestamp < since:
+                                continue
+                            metrics.appendleft(point)
+                            if len(metrics) >= limit:
+                                break
+                        end = start
+
+            return list(metrics)
+        except Exception as e:
+            logger.error(f"Failed to load metrics: {e}")
+            return []
+
+    def _load_indexed(
+        self,
+        metric_name: str,
+        since: Optional[datetime],
+        limit: int
+    ) -> List[MetricPoint]:
+        """Load the latest points of one metric by reading only its indexed byte ranges"""
+        # Copy the ranges with their bytes flushed, so the reads below see whole lines
+        with self._lock:
+            ranges = list(self._load_index().get(metric_name, []))
+            self._flush()
+        metrics = deque()
+        try:
+            with open(self.metrics_file, 'rb') as f:
+                for offset, length in reversed(ranges):
+                    if len(metrics) >= limit:
+                        break
+                    f.seek(offset)
+                    point = MetricPoint.from_dict(_loads(f.read(length)))
+                    if since and point.timestamp < since:
+                        continue
+                    metrics.appendleft(point)
+            return list(metrics)
         except Exception as e:
             logger.error(f"Failed to load metrics: {e}")
             return []
@@ -101,31 +357,40 @@ class MetricsCollector:
         if not metrics:
             return []
 
-        # Group by interval
-        grouped = defaultdict(list)
+        # Aggregate by interval in one pass: bucket -> [count, sum, min, max]
+        if interval == 'hour':
+            truncate = {'minute': 0, 'second': 0, 'microsecond': 0}
+        elif interval == 'day':
+            truncate = {'hour': 0, 'minute': 0, 'second': 0, 'microsecond': 0}
+        else:  # minute
+            truncate = {'second': 0, 'microsecond': 0}
+
+        buckets: Dict[datetime, list] = {}
         for point in metrics:
-            if interval == 'hour':
-                key = point.timestamp.replace(minute=0, second=0, microsecond=0)
-            elif interval == 'day':
-                key = point.timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
-            else:  # minute
-                key = point.timestamp.replace(second=0, microsecond=0)
-
-            grouped[key].append(point.value)
-
-        # Aggregate
-        result = []
-        for timestamp, values in sorted(grouped.items()):
-            result.append({
+            key = point.timestamp.replace(**truncate)
+            value = point.value
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = [1, value, value, value]
+            else:
+                bucket[0] += 1
+                bucket[1] += value
+                if value < bucket[2]:
+                    bucket[2] = value
+                if value > bucket[3]:
+                    bucket[3] = value
+
+        return [
+            {
                 'timestamp': timestamp.isoformat(),
-                'avg': sum(values) / len(values),
-                'min': min(values),
-                'max': max(values),
-                'count': len(values),
-                'sum': sum(values)
-            })
-
-        return result
+                'avg': total / count,
+                'min': low,
+                'max': high,
+                'count': count,
+                'sum': total
+            }
+            for timestamp, (count, total, low, high) in sorted(buckets.items())
+        ]
 
     def get_summary(self, since: Optional[datetime] = None) -> Dict[str, Any]:
         """Get summary statistics for all metrics"""
@@ -134,45 +399,56 @@ class MetricsCollector:
         if not metrics:
             return {}
 
-        by_name = defaultdict(list)
+        # One pass: metric -> [count, sum, min, max, latest]
+        by_name: Dict[str, list] = {}
         for point in metrics:
-            by_name[point.metric].append(point.value)
-
-        summary = {}
-        for name, values in by_name.items():
-            summary[name] = {
-                'avg': sum(values) / len(values),
-                'min': min(values),
-                'max': max(values),
-                'count': len(values),
-                'total': sum(values),
-                'latest': values[-1] if values else None
-            }
+            value = point.value
+            stats = by_name.get(point.metric)
+            if stats is None:
+                by_name[point.metric] = [1, value, value, value, value]
+            else:
+                stats[0] += 1
+                stats[1] += value
+                if value < stats[2]:
+                    stats[2] = value
+                if value > stats[3]:
+                    stats[3] = value
+                stats[4] = value
 
-        return summary
+        return {
+            name: {
+                'avg': total / count,
+                'min': low,
+                'max': high,
+                'count': count,
+                'total': total,
+                'latest': latest
+            }
+            for name, (count, total, low, high, latest) in by_name.items()
+        }
 
     def get_engagement_trends(self, days: int = 7) -> Dict[str, Any]:
-        """Get engagement trends over the past N days"""
-        since = datetime.now() - timedelta(days=days)
-        metrics = self.load_metrics(since=since)
-
-        daily_upvotes = defaultdict(int)
-        daily_comments = defaultdict(int)
-        daily_posts = defaultdict(int)
-
-        for point in metrics:
-            day = point.timestamp.strftime('%Y-%m-%d')
-            if point.metric == 'upvotes':
-                daily_upvotes[day] += point.value
-            elif point.metric == 'comments':
-                daily_comments[day] += point.value
-            elif point.metric == 'posts':
-                daily_posts[day] += point.value
+        """Get engagement trends over the past N days, from the daily aggregates"""
+        first_day = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+
+        daily_upvotes = {}
+        daily_comments = {}
+        daily_posts = {}
+
+        with self._lock:
+            days = [(day, dict(sums)) for day, sums in self._daily.items() if day >= first_day]
+        for day, sums in sorted(days):
+            if 'upvotes' in sums:
+                daily_upvotes[day] = sums['upvotes']
+            if 'comments' in sums:
+                daily_comments[day] = sums['comments']
+            if 'posts' in sums:
+                daily_posts[day] = sums['posts']
 
         return {
-            'upvotes_by_day': dict(daily_upvotes),
-            'comments_by_day': dict(daily_comments),
-            'posts_by_day': dict(daily_posts)
+            'upvotes_by_day': daily_upvotes,
+            'comments_by_day': daily_comments,
+            'posts_by_day': daily_posts
         }
 
     def get_community_breakdown(self) -> Dict[str, Dict[str, int]]:
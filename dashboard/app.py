@@ -10,10 +10,17 @@ BOT_NAME = os.environ.get('BOT_NAME', 'MyAgent')
 import sys
 import json
 import asyncio
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+import atexit
+import functools
+import hashlib
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict, deque
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import Optional, List, Dict, Any, Deque, Tuple
 from contextlib import asynccontextmanager
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from fastapi import FastAPI, Request, HTTPException, BackgroundTasks
@@ -21,6 +28,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
 from pydantic import BaseModel
+import aiohttp
 import uvicorn
 
 # Add parent directory to path for imports
@@ -33,8 +41,83 @@ from tools.slack_bot.bot import SlackBot
 from tools.screenshots.capture import ScreenshotCapture
 from tools.injection_scanner import scan_content, InjectionScanner
 
+try:
+    import orjson
 
-@dataclass
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def _dumps_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def _dumps_line(obj: Any) -> bytes:
+        return (json.dumps(obj) + "\n").encode("utf-8")
+
+    _loads = json.loads
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded with orjson when it is installed."""
+
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
+
+def async_ttl_cache(ttl: float, max_entries: int = 128):
+    """Cache an async function's result per arguments for ttl seconds.
+
+    Concurrent callers with the same arguments share a single computation.
+    The wrapper's cache_clear() drops all cached results.
+    """
+    def decorator(func):
+        cache: Dict[tuple, tuple] = {}
+        locks: Dict[tuple, asyncio.Lock] = {}
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            entry = cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+
+            # Locks are created lazily so they bind to the running event loop
+            lock = locks.get(key)
+            if lock is None:
+                lock = locks[key] = asyncio.Lock()
+            async with lock:
+                entry = cache.get(key)
+                if entry and entry[0] > time.monotonic():
+                    return entry[1]
+                value = await func(*args, **kwargs)
+                if len(cache) >= max_entries:
+                    cache.clear()
+                    locks.clear()
+                cache[key] = (time.monotonic() + ttl, value)
+                return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _epoch_day(timestamp: str) -> int:
+    """Days since 1970-01-01 for the (local) calendar date of an ISO timestamp."""
+    return date.fromisoformat(timestamp[:10]).toordinal() - _EPOCH_ORDINAL
+
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SecurityIncident:
     """A security incident detected by the toolkit."""
     id: str
@@ -46,81 +129,265 @@ class SecurityIncident:
     source_submolt: str
     content_preview: str
     action_taken: str  # 'blocked', 'flagged', 'sanitized'
+    # Incidents are immutable, so the serialized form is built once
+    _dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    # Calendar day as an int, so per-day bucketing compares integers
+    epoch_day: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "epoch_day", _epoch_day(self.timestamp))
 
     def to_dict(self):
-        return asdict(self)
+        if self._dict is None:
+            object.__setattr__(self, "_dict", {
+                "id": self.id,
+                "timestamp": self.timestamp,
+                "risk_level": self.risk_level,
+                "attack_types": self.attack_types,
+                "source_type": self.source_type,
+                "source_author": self.source_author,
+                "source_submolt": self.source_submolt,
+                "content_preview": self.content_preview,
+                "action_taken": self.action_taken,
+            })
+        return self._dict
 
 
 class SecurityIncidentTracker:
     """Tracks security incidents for the dashboard."""
 
+    MAX_INCIDENTS_IN_MEMORY = 10000
+    # Incidents buffered in the append handle before they are flushed to disk
+    FLUSH_INTERVAL = 50
+    # Post ids remembered so live scans skip posts they have already seen
+    MAX_SCANNED_IDS = 10000
+
     def __init__(self, data_dir: str = "./data"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.incidents_file = self.data_dir / "security_incidents.jsonl"
         self.scanner = InjectionScanner(strict_mode=True)
+        # Parsed incidents (oldest first) and how far into incidents_file they cover
+        self._incidents: Deque[SecurityIncident] = deque(maxlen=self.MAX_INCIDENTS_IN_MEMORY)
+        self._file_offset = 0
+        self._lock = threading.Lock()
+        # Running counters over every incident read, so get_stats needs no rescans
+        self._total = 0
+        self._high_risk = 0
+        self._attack_counts: Counter = Counter()
+        self._risk_by_day: Dict[int, Counter] = defaultdict(Counter)
+        # Long-lived buffered append handle; this tracker is the file's only writer
+        self._fh = None
+        self._unflushed = 0
+        # Least recently seen first; persisted so restarts don't rescan the feed
+        self.scanned_ids_file = self.data_dir / "scanned_post_ids.json"
+        self._scanned_ids: "OrderedDict[str, None]" = OrderedDict()
+        self._scanned_dirty = False
+        # Serialises id-file writes so they can happen outside _lock
+        self._save_lock = threading.Lock()
+        if self.scanned_ids_file.exists():
+            try:
+                ids = _loads(self.scanned_ids_file.read_bytes())
+                self._scanned_ids.update((pid, None) for pid in ids[-self.MAX_SCANNED_IDS:])
+            except (OSError, ValueError):
+                pass
+
+    def _handle(self):
+        """Return the buffered append handle, opening it on first use. Call with _lock held."""
+        if self._fh is None or self._fh.closed:
+            # Pick up what's already on disk so offsets line up with our appends
+            self._read_new_incidents()
+            self._fh = open(self.incidents_file, "ab", buffering=1 << 16)
+            atexit.register(self._fh.close)
+        return self._fh
+
+    def _flush(self):
+        """Write buffered incidents to disk. Call with _lock held."""
+        if self._unflushed and self._fh is not None and not self._fh.closed:
+            self._fh.flush()
+            self._unflushed = 0
+
+    def _save_scanned_ids(self):
+        """Write the scanned post ids to disk if they changed since the last save."""
+        with self._save_lock:
+            with self._lock:
+                if not self._scanned_dirty:
+                    return
+                ids = list(self._scanned_ids)
+                self._scanned_dirty = False
+            tmp = self.scanned_ids_file.with_suffix(".tmp")
+            tmp.write_bytes(_dumps(ids))
+            os.replace(tmp, self.scanned_ids_file)
+
+    def flush(self):
+        """Write buffered incidents and the scanned post ids to disk."""
+        with self._lock:
+            self._flush()
+        self._save_scanned_ids()
+
+    def close(self):
+        """Flush and close the incidents file and save the scanned post ids."""
+        with self._lock:
+            if self._fh is not None and not self._fh.closed:
+                self._fh.close()
+            self._fh = None
+            self._unflushed = 0
+        self._save_scanned_ids()
+
+    def _add_incident(self, incident: SecurityIncident):
+        """Add an incident to the cache and counters. Call with _lock held."""
+        self._incidents.append(incident)
+        self._count(incident.epoch_day, incident.risk_level, incident.attack_types)
+
+    def _count(self, epoch_day: int, risk_level: str, attack_types: List[str]):
+        """Update the running counters for one incident. Call with _lock held."""
+        self._total += 1
+        if risk_level == "high":
+            self._high_risk += 1
+        self._attack_counts.update(attack_types)
+        self._risk_by_day[epoch_day][risk_level] += 1
+
+    def _read_new_incidents(self):
+        """Parse incidents appended to the file since the last read. Call with _lock held."""
+        self._flush()
+        try:
+            size = self.incidents_file.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size < self._file_offset:
+            # File was truncated or replaced; start over
+            self._incidents.clear()
+            self._file_offset = 0
+            self._total = 0
+            self._high_risk = 0
+            self._attack_counts.clear()
+            self._risk_by_day.clear()
+        if size == self._file_offset:
+            return
+
+        with open(self.incidents_file, "rb") as f:
+            f.seek(self._file_offset)
+            data = f.read(size - self._file_offset)
+        # Leave a partially written last line for the next read
+        end = data.rfind(b"\n") + 1
+        self._file_offset += end
+        lines = data[:end].splitlines()
+
+        # Only lines that will stay in the bounded cache become objects;
+        # older ones just feed the counters
+        keep_from = len(lines) - self.MAX_INCIDENTS_IN_MEMORY
+        for i, line in enumerate(lines):
+            if not line.strip():
+                continue
+            record = _loads(line)
+            if i >= keep_from:
+                self._add_incident(SecurityIncident(**record))
+            else:
+                self._count(_epoch_day(record["timestamp"]), record["risk_level"], record["attack_types"])
 
     def record_incident(self, incident: SecurityIncident):
         """Record a security incident."""
-        with open(self.incidents_file, "a") as f:
-            f.write(json.dumps(incident.to_dict()) + "\n")
+        self.record_incidents([incident])
+
+    def record_incidents(self, incidents: List[SecurityIncident]):
+        """Record several security incidents with a single write."""
+        if not incidents:
+            return
+        lines = b"".join(_dumps_line(incident.to_dict()) for incident in incidents)
+        with self._lock:
+            self._handle().write(lines)
+            self._file_offset += len(lines)
+            self._unflushed += len(incidents)
+            if self._unflushed >= self.FLUSH_INTERVAL:
+                self._flush()
+            for incident in incidents:
+                self._add_incident(incident)
+
+    @staticmethod
+    def _make_incident(result: Dict, content: str, source_type: str, author: str,
+                       submolt: str, post_id: str = None) -> SecurityIncident:
+        """Build an incident from a suspicious scan result."""
+        return SecurityIncident(
+            id=f"inc_{datetime.now().strftime('%Y%m%d%H%M%S')}_{post_id or 'unknown'}",
+            timestamp=datetime.now().isoformat(),
+            risk_level=result["risk_level"],
+            attack_types=result["attack_types"],
+            source_type=source_type,
+            source_author=author,
+            source_submolt=submolt,
+            content_preview=content[:200] + ("..." if len(content) > 200 else ""),
+            action_taken="blocked" if result["risk_level"] == "high" else "flagged"
+        )
 
     def scan_and_record(self, content: str, source_type: str, author: str,
                         submolt: str, post_id: str = None) -> Optional[SecurityIncident]:
         """Scan content and record incident if threat detected."""
-        result = self.scanner.scan(content)
-
-        if result["is_suspicious"]:
-            incident = SecurityIncident(
-                id=f"inc_{datetime.now().strftime('%Y%m%d%H%M%S')}_{post_id or 'unknown'}",
-                timestamp=datetime.now().isoformat(),
-                risk_level=result["risk_level"],
-                attack_types=result["attack_types"],
-                source_type=source_type,
-                source_author=author,
-                source_submolt=submolt,
-                content_preview=content[:200] + ("..." if len(content) > 200 else ""),
-                action_taken="blocked" if result["risk_level"] == "high" else "flagged"
-            )
-            self.record_incident(incident)
-            return incident
-        return None
+        return self.record_scan_result(self.scanner.scan(content), content, source_type,
+                                       author, submolt, post_id)
+
+    def record_scan_result(self, result: Dict, content: str, source_type: str, author: str,
+                           submolt: str, post_id: str = None) -> Optional[SecurityIncident]:
+        """Record an incident for an existing scan result if it is suspicious."""
+        if not result["is_suspicious"]:
+            return None
+        incident = self._make_incident(result, content, source_type, author, submolt, post_id)
+        self.record_incident(incident)
+        return incident
+
+    def scan_and_record_many(self, items: List[Dict[str, str]]) -> List[SecurityIncident]:
+        """Scan a batch of content and record all threats found in one write.
+
+        Each item holds the scan_and_record arguments: content, source_type,
+        author, submolt and optionally post_id.
+        """
+        results = self.scanner.scan_many([item["content"] for item in items])
+        incidents = [
+            self._make_incident(result, **item)
+            for item, result in zip(items, results)
+            if result["is_suspicious"]
+        ]
+        self.record_incidents(incidents)
+        return incidents
+
+    def unscanned(self, post_keys: List[str]) -> List[bool]:
+        """Return which post keys (see _post_key) have not been scanned yet."""
+        with self._lock:
+            return [key not in self._scanned_ids for key in post_keys]
+
+    def mark_scanned(self, post_keys: List[str]):
+        """Remember post keys as scanned; they are saved on the next flush or close."""
+        with self._lock:
+            for key in post_keys:
+                if key in self._scanned_ids:
+                    self._scanned_ids.move_to_end(key)
+                else:
+                    self._scanned_ids[key] = None
+                    if len(self._scanned_ids) > self.MAX_SCANNED_IDS:
+                        self._scanned_ids.popitem(last=False)
+                    self._scanned_dirty = True
 
     def load_incidents(self, limit: int = 100) -> List[SecurityIncident]:
-        """Load recent security incidents."""
-        incidents = []
-        if self.incidents_file.exists():
-            with open(self.incidents_file, "r") as f:
-                for line in f:
-                    if line.strip():
-                        data = json.loads(line)
-                        incidents.append(SecurityIncident(**data))
-        return list(reversed(incidents[-limit:]))
+        """Load recent security incidents, newest first."""
+        with self._lock:
+            self._read_new_incidents()
+            return list(islice(reversed(self._incidents), limit))
 
     def get_stats(self) -> Dict:
         """Get security statistics."""
-        incidents = self.load_incidents(limit=1000)
-        today = datetime.now().strftime("%Y-%m-%d")
-
-        today_incidents = [i for i in incidents if i.timestamp.startswith(today)]
-        high_risk = [i for i in incidents if i.risk_level == "high"]
-
-        attack_counts = {}
-        for incident in incidents:
-            for attack_type in incident.attack_types:
-                attack_counts[attack_type] = attack_counts.get(attack_type, 0) + 1
-
-        return {
-            "total_incidents": len(incidents),
-            "today_incidents": len(today_incidents),
-            "high_risk_blocked": len(high_risk),
-            "attack_breakdown": attack_counts,
-            "recent_risk_levels": {
-                "high": len([i for i in today_incidents if i.risk_level == "high"]),
-                "medium": len([i for i in today_incidents if i.risk_level == "medium"]),
-                "low": len([i for i in today_incidents if i.risk_level == "low"]),
+        with self._lock:
+            self._read_new_incidents()
+            today = self._risk_by_day.get(date.today().toordinal() - _EPOCH_ORDINAL, Counter())
+            return {
+                "total_incidents": self._total,
+                "today_incidents": sum(today.values()),
+                "high_risk_blocked": self._high_risk,
+                "attack_breakdown": dict(self._attack_counts),
+                "recent_risk_levels": {
+                    "high": today["high"],
+                    "medium": today["medium"],
+                    "low": today["low"],
+                }
             }
-        }
 
 # Configuration from environment
 DATA_DIR = os.environ.get('DATA_DIR', './data')
@@ -128,17 +395,23 @@ SCREENSHOTS_DIR = os.environ.get('SCREENSHOTS_DIR', './screenshots')
 SLACK_WEBHOOK_URL = os.environ.get('SLACK_WEBHOOK_URL', '')
 ANTHROPIC_API_KEY = os.environ.get('ANTHROPIC_API_KEY', '')
 POLL_INTERVAL = int(os.environ.get('POLL_INTERVAL', '60'))
+# Seconds that polled stats endpoints may serve a cached result
+STATS_CACHE_TTL = float(os.environ.get('STATS_CACHE_TTL', '2'))
 
 # Initialize components
 tracker = ActivityTracker(data_dir=DATA_DIR, poll_interval=POLL_INTERVAL, bot_username=BOT_NAME)
 metrics = MetricsCollector(data_dir=DATA_DIR)
 content_gen = ContentGenerator(api_key=ANTHROPIC_API_KEY, bot_name=BOT_NAME) if ANTHROPIC_API_KEY else None
 slack_bot = SlackBot(webhook_url=SLACK_WEBHOOK_URL, bot_name=BOT_NAME) if SLACK_WEBHOOK_URL else None
-screenshot_capture = ScreenshotCapture(output_dir=SCREENSHOTS_DIR)
+screenshot_capture = ScreenshotCapture(output_dir=SCREENSHOTS_DIR, image_format='jpeg')
 security_tracker = SecurityIncidentTracker(data_dir=DATA_DIR)
 
-# Background task handle
+# Most new activities handled (content generation + Slack) at the same time
+ACTIVITY_WORKERS = 8
+
+# Background task handles
 tracker_task = None
+activity_task = None
 
 
 async def on_new_activity(activity: Activity):
@@ -148,6 +421,8 @@ async def on_new_activity(activity: Activity):
     # Record metrics
     metrics.record(activity.type, 1, tags={'community': activity.community})
     metrics.record('upvotes', activity.upvotes, tags={'community': activity.community})
+    for cached in (get_stats, get_engagement_trends, get_community_breakdown):
+        cached.cache_clear()
 
     # Generate content if API key is available
     x_content = None
@@ -155,7 +430,7 @@ async def on_new_activity(activity: Activity):
 
     if content_gen and content_gen.client:
         try:
-            generated = content_gen.generate_for_activity(activity)
+            generated = await content_gen.agenerate_for_activity(activity)
             if 'x' in generated:
                 x_content = generated['x'].content
             if 'linkedin' in generated:
@@ -175,13 +450,44 @@ async def on_new_activity(activity: Activity):
             print(f"Slack notification failed: {e}")
 
 
+async def _activity_worker(queue: asyncio.Queue):
+    """Handle queued activities one at a time until cancelled"""
+    while True:
+        activity = await queue.get()
+        try:
+            await on_new_activity(activity)
+        except Exception as e:
+            print(f"Handling activity {activity.id} failed: {e}")
+        finally:
+            queue.task_done()
+
+
+async def process_new_activities(queue: asyncio.Queue):
+    """Handle queued activities with a fixed pool of workers.
+
+    Each worker picks up the next activity as soon as it is free, so one slow
+    generation doesn't hold back the rest of a burst.
+    """
+    await asyncio.gather(*(_activity_worker(queue) for _ in range(ACTIVITY_WORKERS)))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle"""
-    global tracker_task
-
-    # Set activity callback
-    tracker.on_activity = lambda a: asyncio.create_task(on_new_activity(a))
+    global tracker_task, activity_task
+
+    # Queue new activities for the worker pool
+    activity_queue = asyncio.Queue()
+    tracker.on_activity = activity_queue.put_nowait
+    activity_task = asyncio.create_task(process_new_activities(activity_queue))
+
+    # One keep-alive pool for outbound Moltbook calls: the tracker's polls and
+    # request handlers hit the same host, so they share connections
+    app.state.http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=16, limit_per_host=8, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=30)
+    )
+    tracker.use_session(app.state.http)
 
     # Start tracker in background
     tracker_task = asyncio.create_task(tracker.start())
@@ -197,14 +503,29 @@ async def lifespan(app: FastAPI):
             await tracker_task
         except asyncio.CancelledError:
             pass
+    await tracker.aclose()
     print("Activity tracker stopped")
+    activity_task.cancel()
+    try:
+        await activity_task
+    except asyncio.CancelledError:
+        pass
+    await app.state.http.close()
+    metrics.close()
+    security_tracker.close()
+
+    await screenshot_capture.aclose()
+    if slack_bot:
+        await slack_bot.aclose()
+    await SlackBot.shutdown_shared()
 
 
 app = FastAPI(
     title="Moltbook Content Dashboard",
     description=f"Real-time dashboard for {BOT_NAME} activity",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 # Mount static files
@@ -231,10 +552,14 @@ class SlackTestRequest(BaseModel):
 @app.get("/", response_class=HTMLResponse)
 async def dashboard(request: Request):
     """Main dashboard page"""
+    # Security incidents may need disk reads; do them off the event loop.
+    # The activity tracker is in-memory and mutated on the loop, so it stays here.
+    security_stats, recent_incidents = await asyncio.gather(
+        asyncio.to_thread(security_tracker.get_stats),
+        asyncio.to_thread(security_tracker.load_incidents, 20)
+    )
     stats = tracker.get_stats()
     recent_activities = tracker.load_activities(limit=20)
-    security_stats = security_tracker.get_stats()
-    recent_incidents = security_tracker.load_incidents(limit=20)
 
     return templates.TemplateResponse(
         "index.html",
@@ -265,6 +590,7 @@ async def health_check():
 
 
 @app.get("/api/stats")
+@async_ttl_cache(ttl=STATS_CACHE_TTL)
 async def get_stats():
     """Get current statistics"""
     return tracker.get_stats()
@@ -284,10 +610,9 @@ async def get_activities(limit: int = 50, offset: int = 0):
 @app.get("/api/activities/{activity_id}")
 async def get_activity(activity_id: str):
     """Get a specific activity"""
-    activities = tracker.load_activities(limit=1000)
-    for activity in activities:
-        if activity.id == activity_id:
-            return activity.to_dict()
+    activity = tracker.get_activity_by_id(activity_id)
+    if activity:
+        return activity.to_dict()
     raise HTTPException(status_code=404, detail="Activity not found")
 
 
@@ -298,18 +623,13 @@ async def generate_content(request: GenerateContentRequest):
         raise HTTPException(status_code=503, detail="Content generator not configured")
 
     # Find the activity
-    activities = tracker.load_activities(limit=1000)
-    activity = None
-    for a in activities:
-        if a.id == request.activity_id:
-            activity = a
-            break
+    activity = tracker.get_activity_by_id(request.activity_id)
 
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
     # Generate content
-    generated = content_gen.generate_for_activity(activity, platforms=request.platforms)
+    generated = await content_gen.agenerate_for_activity(activity, platforms=request.platforms)
 
     return {
         "activity_id": activity.id,
@@ -327,14 +647,10 @@ async def generate_daily_summary():
     activities = tracker.load_activities(limit=50)
 
     # Find top content
-    top_content = ""
-    if activities:
-        sorted_activities = sorted(activities, key=lambda a: a.upvotes, reverse=True)
-        if sorted_activities:
-            top = sorted_activities[0]
-            top_content = f"{top.type}: {top.title or top.content[:100]}"
+    top = max(activities, key=lambda a: a.upvotes, default=None)
+    top_content = f"{top.type}: {top.title or top.content[:100]}" if top else ""
 
-    generated = content_gen.generate_daily_summary(stats, top_content=top_content)
+    generated = await content_gen.agenerate_daily_summary(stats, top_content=top_content)
 
     return {
         "generated": {k: v.to_dict() for k, v in generated.items()}
@@ -347,22 +663,24 @@ async def get_metrics(metric: Optional[str] = None, days: int = 7):
     since = datetime.now() - timedelta(days=days)
 
     if metric:
-        time_series = metrics.get_time_series(metric, since=since)
+        time_series = await asyncio.to_thread(metrics.get_time_series, metric, since=since)
         return {"metric": metric, "data": time_series}
 
-    return metrics.get_summary(since=since)
+    return await asyncio.to_thread(metrics.get_summary, since=since)
 
 
 @app.get("/api/metrics/engagement")
+@async_ttl_cache(ttl=STATS_CACHE_TTL)
 async def get_engagement_trends(days: int = 7):
     """Get engagement trend data"""
     return metrics.get_engagement_trends(days=days)
 
 
 @app.get("/api/metrics/communities")
+@async_ttl_cache(ttl=STATS_CACHE_TTL)
 async def get_community_breakdown():
     """Get activity breakdown by community"""
-    return metrics.get_community_breakdown()
+    return await asyncio.to_thread(metrics.get_community_breakdown)
 
 
 @app.post("/api/slack/test")
@@ -382,12 +700,7 @@ async def send_activity_to_slack(activity_id: str, background_tasks: BackgroundT
         raise HTTPException(status_code=503, detail="Slack not configured")
 
     # Find activity
-    activities = tracker.load_activities(limit=1000)
-    activity = None
-    for a in activities:
-        if a.id == activity_id:
-            activity = a
-            break
+    activity = tracker.get_activity_by_id(activity_id)
 
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
@@ -397,7 +710,7 @@ async def send_activity_to_slack(activity_id: str, background_tasks: BackgroundT
     linkedin_content = None
 
     if content_gen and content_gen.client:
-        generated = content_gen.generate_for_activity(activity)
+        generated = await content_gen.agenerate_for_activity(activity)
         x_content = generated.get('x', {}).content if 'x' in generated else None
         linkedin_content = generated.get('linkedin', {}).content if 'linkedin' in generated else None
 
@@ -423,7 +736,7 @@ async def capture_screenshot(url: str):
 @app.get("/api/screenshots")
 async def list_screenshots(limit: int = 20):
     """List recent screenshots"""
-    return screenshot_capture.get_recent_screenshots(limit=limit)
+    return await asyncio.to_thread(screenshot_capture.get_recent_screenshots, limit=limit)
 
 
 @app.get("/screenshots/{filename}")
@@ -449,7 +762,7 @@ async def refresh_tracker():
 @app.get("/api/security/incidents")
 async def get_security_incidents(limit: int = 50):
     """Get recent security incidents"""
-    incidents = security_tracker.load_incidents(limit=limit)
+    incidents = await asyncio.to_thread(security_tracker.load_incidents, limit)
     return {
         "incidents": [i.to_dict() for i in incidents],
         "total": len(incidents)
@@ -457,22 +770,25 @@ async def get_security_incidents(limit: int = 50):
 
 
 @app.get("/api/security/stats")
+@async_ttl_cache(ttl=STATS_CACHE_TTL)
 async def get_security_stats():
     """Get security statistics"""
-    return security_tracker.get_stats()
+    return await asyncio.to_thread(security_tracker.get_stats)
 
 
 @app.post("/api/security/scan")
 async def scan_content_endpoint(content: str, source_type: str = "manual",
                                  author: str = "unknown", submolt: str = "unknown"):
     """Manually scan content for threats"""
-    result = security_tracker.scanner.scan(content)
+    result = await asyncio.to_thread(security_tracker.scanner.scan, content)
 
     incident = None
     if result["is_suspicious"]:
-        incident = security_tracker.scan_and_record(
-            content, source_type, author, submolt
+        # Record from this result rather than scanning the content a second time
+        incident = await asyncio.to_thread(
+            security_tracker.record_scan_result, result, content, source_type, author, submolt
         )
+        get_security_stats.cache_clear()
 
     return {
         "is_suspicious": result["is_suspicious"],
@@ -482,52 +798,83 @@ async def scan_content_endpoint(content: str, source_type: str = "manual",
     }
 
 
+def _post_key(post: Dict[str, Any], content: str) -> str:
+    """Identify a post version by its id and a hash of its text.
+
+    Editing a post changes its key, so the new text is scanned again.
+    """
+    digest = hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
+    post_id = post.get("id")
+    return f"{post_id}:{digest}" if post_id else f"h:{digest}"
+
+
+def _scan_posts(posts: List[Dict[str, Any]]) -> Tuple[int, List[Dict[str, Any]]]:
+    """Scan fetched Moltbook posts not seen before and record any threats found.
+
+    Returns how many posts were scanned and the incidents recorded.
+    """
+    # Skip posts an earlier scan already covered
+    contents = [f"{post.get('title', '')} {post.get('content', '')}" for post in posts]
+    keys = [_post_key(post, content) for post, content in zip(posts, contents)]
+    is_new = security_tracker.unscanned(keys)
+    items = []
+    for post, content, new in zip(posts, contents, is_new):
+        if not new:
+            continue
+        author = post.get("author", {})
+        submolt = post.get("submolt", {})
+        items.append({
+            "content": content,
+            "source_type": "post",
+            "author": author.get("name", "Unknown") if isinstance(author, dict) else str(author),
+            "submolt": submolt.get("name", "unknown") if isinstance(submolt, dict) else str(submolt),
+            "post_id": post.get("id", ""),
+        })
+    incidents = security_tracker.scan_and_record_many(items)
+    # Only a completed scan counts; a failed one leaves the posts for the next run
+    security_tracker.mark_scanned([key for key, new in zip(keys, is_new) if new])
+    security_tracker.flush()
+    return len(items), [incident.to_dict() for incident in incidents]
+
+
 @app.post("/api/security/scan-moltbook")
 async def scan_moltbook_live():
     """Scan live Moltbook content for threats"""
-    import requests
-
     moltbook_api_key = os.environ.get("MOLTBOOK_API_KEY", "")
     if not moltbook_api_key:
         raise HTTPException(status_code=503, detail="Moltbook API key not configured")
 
     headers = {"Authorization": f"Bearer {moltbook_api_key}"}
+    posts = []
+    scanned = 0
     threats_found = []
+    error = None
 
     # Scan recent posts from general submolt
     try:
-        response = requests.get(
+        async with app.state.http.get(
             "https://www.moltbook.com/api/v1/posts?limit=50&sort=new",
-            headers=headers,
-            timeout=30
-        )
-        if response.status_code == 200:
-            posts = response.json().get("posts", [])
-
-            for post in posts:
-                content = f"{post.get('title', '')} {post.get('content', '')}"
-                author = post.get("author", {})
-                author_name = author.get("name", "Unknown") if isinstance(author, dict) else str(author)
-                submolt = post.get("submolt", {})
-                submolt_name = submolt.get("name", "unknown") if isinstance(submolt, dict) else str(submolt)
-
-                incident = security_tracker.scan_and_record(
-                    content=content,
-                    source_type="post",
-                    author=author_name,
-                    submolt=submolt_name,
-                    post_id=post.get("id", "")
-                )
-                if incident:
-                    threats_found.append(incident.to_dict())
+            headers=headers
+        ) as response:
+            if response.status == 200:
+                posts = (await response.json(content_type=None)).get("posts", [])
+
+        # Scanning is CPU-bound; keep it off the event loop
+        scanned, threats_found = await asyncio.to_thread(_scan_posts, posts)
+        if threats_found:
+            get_security_stats.cache_clear()
 
     except Exception as e:
         print(f"Error scanning Moltbook: {e}")
+        error = str(e)
 
     return {
-        "scanned": len(posts) if 'posts' in dir() else 0,
+        "scanned": scanned,
+        # Posts a failed scan never reached are not skipped; they stay unscanned
+        "skipped": 0 if error else len(posts) - scanned,
         "threats_found": len(threats_found),
-        "incidents": threats_found
+        "incidents": threats_found,
+        "error": error
     }
 
 
@@ -14,7 +14,7 @@ Deploy for FREE to Streamlit Cloud:
 5. Done! Your personal dashboard in 2 minutes.
 
 Or run locally:
-    pip install streamlit
+    pip install streamlit streamlit-autorefresh
     MOLTBOOK_API_KEY=your_key streamlit run dashboard/streamlit_app.py
 """
 
@@ -22,23 +22,61 @@ import streamlit as st
 import json
 import os
 import sys
+import functools
+import hashlib
+import threading
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    def _dumps_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps_line(obj: Any) -> bytes:
+        return (json.dumps(obj) + "\n").encode("utf-8")
+
+    _loads = json.loads
+
+# Optional: client-side timer for auto-refresh (pip install streamlit-autorefresh)
+try:
+    from streamlit_autorefresh import st_autorefresh
+except ImportError:
+    st_autorefresh = None
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
-def get_agent_info(api_key: str) -> Optional[Dict]:
+@st.cache_resource
+def get_session() -> requests.Session:
+    """Keep-alive session for Moltbook calls, shared across reruns so TCP/TLS handshakes are reused."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    ))
+    return session
+
+
+def get_agent_info(api_key: str, session: Optional[requests.Session] = None) -> Optional[Dict]:
     """Fetch agent info from Moltbook API."""
     if not api_key:
         return None
     try:
-        response = requests.get(
+        response = (session or get_session()).get(
             "https://www.moltbook.com/api/v1/agents/me",
             headers={"Authorization": f"Bearer {api_key}"},
             timeout=10
@@ -51,6 +89,51 @@ def get_agent_info(api_key: str) -> Optional[Dict]:
     return None
 
 
+class AgentInfoCache:
+    """Last-known agent info per API key, refreshed in the background once stale.
+
+    Only the very first lookup for a key waits on the network; after that reruns
+    get the cached value at once while a worker thread fetches a fresh one.
+    """
+
+    TTL = 300
+
+    def __init__(self, session: requests.Session):
+        self._session = session
+        self._lock = threading.Lock()
+        self._info: Dict[str, Optional[Dict]] = {}
+        self._fetched_at: Dict[str, float] = {}
+        self._refreshing = set()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def get(self, api_key: str) -> Optional[Dict]:
+        with self._lock:
+            known = api_key in self._info
+            stale = time.monotonic() - self._fetched_at.get(api_key, 0.0) > self.TTL
+            if known and stale and api_key not in self._refreshing:
+                self._refreshing.add(api_key)
+                self._executor.submit(self._refresh, api_key)
+        if not known:
+            # Nothing to show yet, so this one fetch happens inline
+            self._refresh(api_key)
+        with self._lock:
+            return self._info.get(api_key)
+
+    def _refresh(self, api_key: str):
+        info = get_agent_info(api_key, self._session)
+        with self._lock:
+            # Keep showing the last good value if a refresh fails
+            if info is not None or api_key not in self._info:
+                self._info[api_key] = info
+            self._fetched_at[api_key] = time.monotonic()
+            self._refreshing.discard(api_key)
+
+
+@st.cache_resource
+def get_agent_info_cache() -> AgentInfoCache:
+    return AgentInfoCache(get_session())
+
+
 # Page config
 st.set_page_config(
     page_title="Moltbook Security Dashboard",
@@ -59,8 +142,9 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS. Streamlit removes any element a rerun doesn't emit again, so the
+# style block is sent on every run rather than once per session.
+CSS = """
 <style>
     .stApp { background-color: #0a0a0a; }
     .main { padding: 1rem 2rem; }
@@ -106,7 +190,8 @@ st.markdown("""
         margin-right: 4px;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(CSS, unsafe_allow_html=True)
 
 
 @dataclass
@@ -122,54 +207,176 @@ class SecurityIncident:
     action_taken: str
 
 
+# Nothing on the page looks further back than this many incidents (get_stats)
+MAX_LOADED_INCIDENTS = 1000
+TAIL_BLOCK_SIZE = 1 << 16
+
+
+def _tail_lines(path: str, n: int) -> List[bytes]:
+    """Return the last n non-empty lines of a file, reading backwards in blocks."""
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b""
+        lines = []
+        while pos > 0:
+            step = min(TAIL_BLOCK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+            # The first line may be cut off until we reach the start of the file
+            lines = data.splitlines()[1:] if pos > 0 else data.splitlines()
+            lines = [line for line in lines if line.strip()]
+            if len(lines) >= n:
+                break
+    return lines[-n:]
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_incident_dicts(path: str, mtime_ns: int, size: int) -> List[Dict]:
+    """Parse the latest MAX_LOADED_INCIDENTS incidents, oldest first.
+
+    Only the tail of the file is read, so the cost stays flat as it grows.
+    mtime_ns and size only key the cache, so reruns skip the parse until the file changes.
+    """
+    return [_loads(line) for line in _tail_lines(path, MAX_LOADED_INCIDENTS)]
+
+
 class SecurityTracker:
     """Tracks and stores security incidents."""
 
+    # Post keys remembered so repeat scans skip posts they have already seen
+    MAX_SCANNED_POSTS = 10000
+
     def __init__(self):
         self.data_dir = Path("data")
         self.data_dir.mkdir(exist_ok=True)
         self.incidents_file = self.data_dir / "security_incidents.jsonl"
+        # Serialized incidents waiting to be appended by flush()
+        self._pending: List[bytes] = []
+        self._lock = threading.Lock()
+        # Least recently seen first; saved by flush() so restarts don't rescan
+        self.scanned_file = self.data_dir / "scanned_posts.json"
+        self._scanned: "OrderedDict[str, None]" = OrderedDict()
+        self._scanned_dirty = False
+        try:
+            keys = _loads(self.scanned_file.read_bytes())
+            self._scanned.update((key, None) for key in keys[-self.MAX_SCANNED_POSTS:])
+        except (OSError, ValueError):
+            pass
+
+    def _records(self) -> List[Dict]:
+        """The latest incident records on disk, oldest first (cached until the file changes)."""
+        try:
+            stat = self.incidents_file.stat()
+        except FileNotFoundError:
+            return []
+        return _load_incident_dicts(str(self.incidents_file), stat.st_mtime_ns, stat.st_size)
 
     def load_incidents(self, limit: int = 100) -> List[SecurityIncident]:
-        incidents = []
-        if self.incidents_file.exists():
-            with open(self.incidents_file, "r") as f:
-                for line in f:
-                    if line.strip():
-                        incidents.append(SecurityIncident(**json.loads(line)))
-        return list(reversed(incidents[-limit:]))
+        return [SecurityIncident(**d) for d in reversed(self._records()[-limit:])]
 
     def record_incident(self, incident: SecurityIncident):
-        with open(self.incidents_file, "a") as f:
-            f.write(json.dumps(asdict(incident)) + "\n")
+        """Queue an incident; it is written on the next flush()."""
+        line = _dumps_line(asdict(incident))
+        with self._lock:
+            self._pending.append(line)
+
+    def unscanned(self, keys: List[str]) -> List[bool]:
+        """Return which post keys have not been scanned yet."""
+        with self._lock:
+            return [key not in self._scanned for key in keys]
+
+    def mark_scanned(self, keys: List[str]):
+        """Remember post keys as scanned; they are saved on the next flush()."""
+        with self._lock:
+            for key in keys:
+                if key in self._scanned:
+                    self._scanned.move_to_end(key)
+                else:
+                    self._scanned[key] = None
+                    if len(self._scanned) > self.MAX_SCANNED_POSTS:
+                        self._scanned.popitem(last=False)
+                    self._scanned_dirty = True
+
+    def flush(self):
+        """Append all queued incidents with a single write and save the scanned posts."""
+        with self._lock:
+            if self._pending:
+                with open(self.incidents_file, "ab", buffering=1 << 16) as f:
+                    f.write(b"".join(self._pending))
+                self._pending.clear()
+            if self._scanned_dirty:
+                tmp = self.scanned_file.with_suffix(".tmp")
+                tmp.write_text(json.dumps(list(self._scanned)))
+                os.replace(tmp, self.scanned_file)
+                self._scanned_dirty = False
 
     def get_stats(self) -> Dict:
-        incidents = self.load_incidents(1000)
+        # One pass over the latest 1000 records, without building incident objects
+        records = self._records()[-MAX_LOADED_INCIDENTS:]
         today = datetime.now().strftime("%Y-%m-%d")
+        today_count = high_risk = blocked = 0
+        attacks = Counter()
+        for record in records:
+            if record["timestamp"].startswith(today):
+                today_count += 1
+            if record["risk_level"] == "high":
+                high_risk += 1
+            if record["action_taken"] == "blocked":
+                blocked += 1
+            attacks.update(record["attack_types"])
 
         return {
-            "total": len(incidents),
-            "today": len([i for i in incidents if i.timestamp.startswith(today)]),
-            "high_risk": len([i for i in incidents if i.risk_level == "high"]),
-            "blocked": len([i for i in incidents if i.action_taken == "blocked"]),
-            "attacks": self._count_attacks(incidents)
+            "total": len(records),
+            "today": today_count,
+            "high_risk": high_risk,
+            "blocked": blocked,
+            "attacks": dict(attacks.most_common())
         }
 
-    def _count_attacks(self, incidents: List[SecurityIncident]) -> Dict[str, int]:
-        counts = {}
-        for inc in incidents:
-            for attack in inc.attack_types:
-                counts[attack] = counts.get(attack, 0) + 1
-        return dict(sorted(counts.items(), key=lambda x: -x[1]))
+
+@st.cache_resource
+def get_tracker() -> SecurityTracker:
+    """Shared tracker, reused across reruns and sessions."""
+    return SecurityTracker()
+
+
+@st.cache_resource
+def get_scanner(strict: bool = True):
+    """Shared injection scanner, so its patterns are compiled once per process."""
+    from tools.injection_scanner import InjectionScanner
+    return InjectionScanner(strict_mode=strict)
+
+
+SCAN_SUBMOLTS = ["general", "agents", "programming", "askagents"]
+
+
+def _fetch_submolt_posts(session: requests.Session, submolt: str, headers: Dict[str, str]) -> List[Dict]:
+    """Fetch the newest posts in a submolt."""
+    response = session.get(
+        f"https://www.moltbook.com/api/v1/posts?submolt={submolt}&limit=25&sort=new",
+        headers=headers,
+        timeout=30
+    )
+    if response.status_code == 200:
+        return response.json().get("posts", [])
+    return []
+
+
+def _post_key(post: Dict, content: str) -> str:
+    """Identify a post version by its id and a hash of its text.
+
+    Editing a post changes its key, so the new text is scanned again.
+    """
+    digest = hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
+    post_id = post.get("id")
+    return f"{post_id}:{digest}" if post_id else f"h:{digest}"
 
 
 def scan_moltbook(tracker: SecurityTracker, api_key: str) -> int:
     """Scan Moltbook for threats and record incidents."""
-    import requests
-
     try:
-        from tools.injection_scanner import InjectionScanner
-        scanner = InjectionScanner(strict_mode=True)
+        scanner = get_scanner()
     except ImportError:
         st.error("Injection scanner not found. Make sure tools/ is in path.")
         return 0
@@ -177,51 +384,74 @@ def scan_moltbook(tracker: SecurityTracker, api_key: str) -> int:
     headers = {"Authorization": f"Bearer {api_key}"}
     threats_found = 0
 
-    for submolt in ["general", "agents", "programming", "askagents"]:
+    # Fetch all submolts concurrently so a scan waits for one round trip, not four
+    session = get_session()
+    with ThreadPoolExecutor(max_workers=len(SCAN_SUBMOLTS)) as pool:
+        fetches = [pool.submit(_fetch_submolt_posts, session, submolt, headers) for submolt in SCAN_SUBMOLTS]
+
+    for submolt, fetch in zip(SCAN_SUBMOLTS, fetches):
         try:
-            response = requests.get(
-                f"https://www.moltbook.com/api/v1/posts?submolt={submolt}&limit=25&sort=new",
-                headers=headers,
-                timeout=30
-            )
-            if response.status_code == 200:
-                posts = response.json().get("posts", [])
-
-                for post in posts:
-                    content = f"{post.get('title', '')} {post.get('content', '')}"
+            posts = fetch.result()
+            contents = [f"{post.get('title', '')} {post.get('content', '')}" for post in posts]
+            # Only scan posts an earlier scan hasn't covered
+            keys = [_post_key(post, content) for post, content in zip(posts, contents)]
+            is_new = tracker.unscanned(keys)
+            keys = [key for key, new in zip(keys, is_new) if new]
+            posts = [post for post, new in zip(posts, is_new) if new]
+            contents = [content for content, new in zip(contents, is_new) if new]
+            for post, content, result in zip(posts, contents, scanner.scan_many(contents)):
+                if result["is_suspicious"]:
                     author = post.get("author", {})
                     author_name = author.get("name", "Unknown") if isinstance(author, dict) else str(author)
                     submolt_data = post.get("submolt", {})
                     submolt_name = submolt_data.get("name", submolt) if isinstance(submolt_data, dict) else submolt
-
-                    result = scanner.scan(content)
-
-                    if result["is_suspicious"]:
-                        incident = SecurityIncident(
-                            id=f"inc_{datetime.now().strftime('%Y%m%d%H%M%S%f')}",
-                            timestamp=datetime.now().isoformat(),
-                            risk_level=result["risk_level"],
-                            attack_types=result["attack_types"],
-                            source_type="post",
-                            source_author=author_name,
-                            source_submolt=submolt_name,
-                            content_preview=content[:200],
-                            action_taken="blocked" if result["risk_level"] == "high" else "flagged"
-                        )
-                        tracker.record_incident(incident)
-                        threats_found += 1
+                    incident = SecurityIncident(
+                        id=f"inc_{datetime.now().strftime('%Y%m%d%H%M%S%f')}",
+                        timestamp=datetime.now().isoformat(),
+                        risk_level=result["risk_level"],
+                        attack_types=result["attack_types"],
+                        source_type="post",
+                        source_author=author_name,
+                        source_submolt=submolt_name,
+                        content_preview=content[:200],
+                        action_taken="blocked" if result["risk_level"] == "high" else "flagged"
+                    )
+                    tracker.record_incident(incident)
+                    threats_found += 1
+            # Only a completed scan counts; a failed one leaves the posts for the next run
+            tracker.mark_scanned(keys)
         except Exception as e:
             st.warning(f"Error scanning {submolt}: {e}")
 
+    tracker.flush()
     return threats_found
 
 
+# Label and colour per incident action; anything not blocked shows as flagged
+ACTION_STYLES = {"blocked": ("🚫 BLOCKED", "#ef4444")}
+FLAGGED_STYLE = ("⚠️ FLAGGED", "#eab308")
+
+
+# Incident cards rendered per "Show more" page
+INCIDENTS_PAGE_SIZE = 10
+
+
+@functools.lru_cache(maxsize=128)
+def _attack_span(attack: str) -> str:
+    """Attack-type tag; the handful of attack labels repeat across incidents."""
+    return f'<span class="attack-tag">{attack}</span>'
+
+
+def _show_more_incidents(shown: int):
+    st.session_state.incidents_shown = shown + INCIDENTS_PAGE_SIZE
+
+
 def main():
     # Get API key from secrets or environment
     api_key = st.secrets.get("MOLTBOOK_API_KEY", os.environ.get("MOLTBOOK_API_KEY", ""))
 
     # Fetch agent info for personalization
-    agent_info = get_agent_info(api_key) if api_key else None
+    agent_info = get_agent_info_cache().get(api_key) if api_key else None
     agent_name = agent_info.get("name", "Your Agent") if agent_info else "Your Agent"
 
     # Header with personalized agent name
@@ -248,7 +478,7 @@ def main():
                 config = yaml.safe_load(f)
                 api_key = config.get("moltbook_api_key", "")
 
-    tracker = SecurityTracker()
+    tracker = get_tracker()
     stats = tracker.get_stats()
 
     # Stats Cards
@@ -316,16 +546,18 @@ def main():
         st.subheader("🔐 Security Incidents")
 
         incidents = tracker.load_incidents(50)
+        shown = st.session_state.get("incidents_shown", INCIDENTS_PAGE_SIZE)
 
         if incidents:
-            for inc in incidents:
-                badge_color = "#ef4444" if inc.risk_level == "high" else "#eab308"
-                action_text = "🚫 BLOCKED" if inc.action_taken == "blocked" else "⚠️ FLAGGED"
-                action_color = "#ef4444" if inc.action_taken == "blocked" else "#eab308"
+            # Render every card into one markdown element instead of one per incident,
+            # and only build the cards for the pages the user has asked to see
+            cards = []
+            for inc in incidents[:shown]:
+                action_text, action_color = ACTION_STYLES.get(inc.action_taken, FLAGGED_STYLE)
 
-                attacks_html = " ".join([f'<span class="attack-tag">{a}</span>' for a in inc.attack_types])
+                attacks_html = " ".join(_attack_span(a) for a in inc.attack_types)
 
-                st.markdown(f"""
+                cards.append(f"""
                 <div class="incident-card {inc.risk_level}">
                     <span class="badge {inc.risk_level}">{inc.risk_level.upper()}</span>
                     <span style="color:#6366f1;font-weight:500;">@{inc.source_author}</span>
@@ -339,7 +571,17 @@ def main():
                         {action_text}
                     </div>
                 </div>
-                """, unsafe_allow_html=True)
+                """)
+            st.markdown("".join(cards), unsafe_allow_html=True)
+
+            remaining = len(incidents) - shown
+            if remaining > 0:
+                st.button(
+                    f"Show {min(remaining, INCIDENTS_PAGE_SIZE)} more",
+                    key="show_more_incidents",
+                    on_click=_show_more_incidents,
+                    args=(shown,)
+                )
         else:
             st.info("No incidents yet. Click 'Scan Now' to analyze Moltbook content.")
 
@@ -347,9 +589,10 @@ def main():
         st.subheader("🎯 Attack Types")
 
         if stats['attacks']:
+            bars = []
             for attack, count in stats['attacks'].items():
                 pct = count / stats['total'] * 100 if stats['total'] > 0 else 0
-                st.markdown(f"""
+                bars.append(f"""
                 <div style="margin-bottom:16px;">
                     <div style="display:flex;justify-content:space-between;margin-bottom:4px;">
                         <span style="font-size:13px;color:#888;">{attack}</span>
@@ -359,14 +602,19 @@ def main():
                         <div style="width:{pct}%;height:100%;background:linear-gradient(90deg,#ef4444,#eab308);border-radius:4px;"></div>
                     </div>
                 </div>
-                """, unsafe_allow_html=True)
+                """)
+            st.markdown("".join(bars), unsafe_allow_html=True)
         else:
             st.info("No attack data yet")
 
-    # Auto-refresh
+    # Auto-refresh: let the browser schedule the rerun rather than holding
+    # the script thread in a sleep
     if auto_refresh:
-        time.sleep(30)
-        st.rerun()
+        if st_autorefresh is not None:
+            st_autorefresh(interval=30_000, key="refresh")
+        else:
+            time.sleep(30)
+            st.rerun()
 
 
 if __name__ == "__main__":
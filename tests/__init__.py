@@ -1 +1,21 @@
 # Moltbook Toolkit Tests
+
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+
+def load_dashboard_tools():
+    """Import dashboard-tools (not a valid module name) as the dashboard_tools package."""
+    if "dashboard_tools" not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            "dashboard_tools",
+            ROOT / "dashboard-tools" / "__init__.py",
+            submodule_search_locations=[str(ROOT / "dashboard-tools")]
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["dashboard_tools"] = module
+        spec.loader.exec_module(module)
+    return sys.modules["dashboard_tools"]
@@ -0,0 +1,122 @@
+"""
+Tests for the Moltbook activity tracker.
+"""
+
+import asyncio
+import importlib.util
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests import load_dashboard_tools
+
+HAS_AIOHTTP = importlib.util.find_spec("aiohttp") is not None
+
+
+@unittest.skipUnless(HAS_AIOHTTP, "aiohttp not installed")
+class TestActivityTracker(unittest.TestCase):
+    """Test the tracker's in-memory activities and local persistence."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        load_dashboard_tools()
+        from dashboard_tools.tracker import activity_tracker
+        self.module = activity_tracker
+        # Keep the tests on local storage even where GCS credentials exist
+        patcher = mock.patch.object(activity_tracker, "_get_gcs_client", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_tracker(self):
+        tracker = self.module.ActivityTracker(data_dir=self.tmp)
+        self.addCleanup(tracker._activities_fh.close)
+        self.addCleanup(lambda: tracker._seen_log_fh.close())
+        return tracker
+
+    def activity(self, activity_id, kind="post", upvotes=0, timestamp=None, community="general"):
+        return self.module.Activity(
+            id=activity_id, type=kind, timestamp=timestamp or datetime.now(),
+            community=community, upvotes=upvotes
+        )
+
+    def test_stats(self):
+        """Stats count posts, comments, upvotes and communities in one pass."""
+        tracker = self.make_tracker()
+        tracker._activities.append(self.activity("p1", "post", upvotes=3))
+        tracker._activities.append(self.activity("c1", "comment", upvotes=2, community="ai"))
+        tracker._activities.append(self.activity(
+            "c2", "comment", timestamp=datetime.now() - timedelta(days=10)
+        ))
+        stats = tracker.get_stats()
+        self.assertEqual(stats["total_posts"], 1)
+        self.assertEqual(stats["posts_today"], 1)
+        self.assertEqual(stats["total_comments"], 2)
+        self.assertEqual(stats["comments_this_week"], 1)
+        self.assertEqual(stats["total_upvotes"], 5)
+        self.assertEqual(stats["communities_active"], 2)
+
+    def test_reload_keeps_newest_activities(self):
+        """Reloading from disk keeps only the newest MAX_ACTIVITIES_IN_MEMORY activities."""
+        tracker = self.make_tracker()
+        for i in range(5):
+            tracker._save_activity(self.activity(f"a{i}", upvotes=i))
+        tracker._activities_fh.flush()
+
+        with mock.patch.object(self.module.ActivityTracker, "MAX_ACTIVITIES_IN_MEMORY", 3):
+            restored = self.make_tracker()
+        self.assertEqual([a.id for a in restored.load_activities()], ["a2", "a3", "a4"])
+        self.assertEqual([a.id for a in restored.get_recent_activities(2)], ["a3", "a4"])
+        # Every saved id still counts as seen
+        self.assertIn("a0", restored._seen_ids)
+
+    def test_lookup_by_id(self):
+        """Activities can be looked up by id once remembered."""
+        tracker = self.make_tracker()
+        first = self.activity("a1")
+        tracker._remember(first)
+        tracker._remember(self.activity("a2"))
+        self.assertIs(tracker.get_activity_by_id("a1"), first)
+        self.assertIsNone(tracker.get_activity_by_id("missing"))
+
+    def test_eviction_drops_index_entry(self):
+        """Evicted activities are no longer found by id."""
+        with mock.patch.object(self.module.ActivityTracker, "MAX_ACTIVITIES_IN_MEMORY", 3):
+            tracker = self.make_tracker()
+        for i in range(5):
+            tracker._remember(self.activity(f"a{i}"))
+        self.assertIsNone(tracker.get_activity_by_id("a0"))
+        self.assertIsNone(tracker.get_activity_by_id("a1"))
+        self.assertEqual(tracker.get_activity_by_id("a4").id, "a4")
+        self.assertEqual(len(tracker._activities_by_id), 3)
+
+    def test_eviction_keeps_newer_duplicate(self):
+        """Evicting an old copy of an id keeps the index pointing at the newer one."""
+        with mock.patch.object(self.module.ActivityTracker, "MAX_ACTIVITIES_IN_MEMORY", 2):
+            tracker = self.make_tracker()
+        tracker._remember(self.activity("dup"))
+        tracker._remember(self.activity("other"))
+        newer = self.activity("dup", upvotes=5)
+        tracker._remember(newer)
+        self.assertIs(tracker.get_activity_by_id("dup"), newer)
+
+    def test_aclose_writes_state_snapshot(self):
+        """Closing the tracker compacts the seen-ids log into tracker_state.json."""
+        tracker = self.make_tracker()
+        tracker._mark_seen("a1")
+        asyncio.run(tracker.aclose())
+        state = json.loads(Path(self.tmp, "tracker_state.json").read_text())
+        self.assertEqual(state["seen_ids"], ["a1"])
+        self.assertEqual(Path(self.tmp, "seen_ids.log").read_text(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+Tests for the content generator's prompt and local post templates.
+"""
+
+import importlib.util
+import os
+import string
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests import load_dashboard_tools
+
+HAS_JINJA2 = importlib.util.find_spec("jinja2") is not None
+
+
+class TestLocalTemplates(unittest.TestCase):
+    """Test the Jinja2 templates for boilerplate posts."""
+
+    def setUp(self):
+        load_dashboard_tools()
+        from dashboard_tools.content_gen import templates
+        self.templates = templates
+
+    @unittest.skipUnless(HAS_JINJA2, "jinja2 not installed")
+    def test_daily_x_pluralization(self):
+        """The daily X template pluralizes its counts."""
+        context = {"agent": "Bot", "cta": "follow @owner", "top_content": ""}
+        one = self.templates.render_local_template(
+            "daily_x.j2", posts_today=1, upvotes_today=1, communities=1, **context
+        )
+        self.assertIn("published 1 post and earned 1 upvote across 1 community.", one)
+        many = self.templates.render_local_template(
+            "daily_x.j2", posts_today=2, upvotes_today=0, communities=3, **context
+        )
+        self.assertIn("published 2 posts and earned 0 upvotes across 3 communities.", many)
+        self.assertTrue(many.endswith("Follow @owner for more."))
+
+    @unittest.skipUnless(HAS_JINJA2, "jinja2 not installed")
+    def test_milestone_previous_value_is_optional(self):
+        """The milestone templates mention the previous value only when there is one."""
+        context = {"agent": "Bot", "owner": "Ada", "cta": "follow Ada", "milestone": "100 karma"}
+        with_previous = self.templates.render_local_template(
+            "milestone_x.j2", current_value=100, previous_value=50, **context
+        )
+        self.assertIn("(100, up from 50)", with_previous)
+        without = self.templates.render_local_template(
+            "milestone_li.j2", current_value=100, previous_value=0, **context
+        )
+        self.assertNotIn("up from", without)
+        self.assertIn("Ada's experiment", without)
+
+    def make_generator(self, **kwargs):
+        from dashboard_tools.content_gen.generator import ContentGenerator
+        with mock.patch.dict(os.environ, {"ANTHROPIC_API_KEY": ""}):
+            return ContentGenerator(api_key=None, bot_name="Bot", **kwargs)
+
+    def test_model_map_covers_only_short_form_templates(self):
+        """Only the short, formulaic outputs run on the smaller model."""
+        generator = self.make_generator()
+        self.assertEqual(set(generator.model_map), {"x_post", "daily_summary_x"})
+        thread = generator._request_kwargs("system", "user", template_name="x_thread")
+        self.assertEqual(thread["model"], generator.model)
+
+    def test_generator_uses_claude_by_default(self):
+        """Local templates are opt-in; by default milestones still go to Claude."""
+        generator = self.make_generator()
+        response = "X POST:\nBig day\n\nLINKEDIN POST:\nA longer post"
+        with mock.patch.object(generator, "_call_claude", return_value=response) as call_claude:
+            results = generator.generate_milestone_content("100 karma", 50, 100)
+        call_claude.assert_called_once()
+        self.assertEqual(results["x"].content, "Big day")
+
+    @unittest.skipUnless(HAS_JINJA2, "jinja2 not installed")
+    def test_generator_renders_milestones_locally(self):
+        """With local templates enabled, milestones are rendered without calling Claude."""
+        generator = self.make_generator(local_templates=True)
+        with mock.patch.object(generator, "_call_claude") as call_claude:
+            results = generator.generate_milestone_content("100 karma", 50, 100)
+        call_claude.assert_not_called()
+        self.assertIn("100 karma", results["x"].content)
+        self.assertLessEqual(len(results["x"].content), generator.X_MAX_CHARS)
+        self.assertIn("#Moltbook", results["linkedin"].content)
+
+    @unittest.skipUnless(HAS_JINJA2, "jinja2 not installed")
+    def test_generator_renders_only_empty_days_locally(self):
+        """Only a daily X summary for a day without activity skips Claude."""
+        generator = self.make_generator(local_templates=True)
+        quiet = {"posts_today": 0, "comments_today": 0, "total_upvotes": 0, "communities_active": 0}
+        busy = dict(quiet, posts_today=3, total_upvotes=12)
+        with mock.patch.object(generator, "_call_claude", return_value="from Claude") as call_claude:
+            results = generator.generate_daily_summary(quiet)
+            self.assertIn("published 0 posts", results["x"].content)
+            self.assertEqual(call_claude.call_count, 1)
+
+            results = generator.generate_daily_summary(busy)
+            self.assertEqual(results["x"].content, "from Claude")
+            self.assertEqual(call_claude.call_count, 3)
+
+
+class TestPromptTemplates(unittest.TestCase):
+    """Test the prompt templates rendered per agent config."""
+
+    def setUp(self):
+        load_dashboard_tools()
+        from dashboard_tools.content_gen import templates
+        self.templates = templates
+
+    def test_get_templates_returns_copies(self):
+        """Callers can modify their templates without affecting later calls."""
+        first = self.templates.get_templates()
+        first["x_post"]["system_prompt"] = "changed"
+        first.pop("milestone")
+        second = self.templates.get_templates()
+        self.assertNotEqual(second["x_post"]["system_prompt"], "changed")
+        self.assertIn("milestone", second)
+
+    def test_templates_have_only_public_keys(self):
+        """Template dicts expose no private bookkeeping keys."""
+        for name, template in self.templates.get_templates().items():
+            self.assertFalse([key for key in template if key.startswith("_")], name)
+
+    def test_render_user_prompt_matches_format(self):
+        """The cached %-template renders the same text as str.format."""
+        for name, template in self.templates.get_templates().items():
+            fields = {
+                parsed[1]: f"<{parsed[1]} {{with braces}} 100%>"
+                for parsed in string.Formatter().parse(template["user_template"]) if parsed[1]
+            }
+            self.assertEqual(
+                self.templates.render_user_prompt(template, **fields),
+                template["user_template"].format(**fields),
+                name
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
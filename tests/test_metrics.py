@@ -0,0 +1,131 @@
+"""
+Tests for the metrics collector.
+"""
+
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests import load_dashboard_tools
+
+HAS_AIOHTTP = importlib.util.find_spec("aiohttp") is not None
+
+
+@unittest.skipUnless(HAS_AIOHTTP, "aiohttp not installed")
+class TestDailyAggregates(unittest.TestCase):
+    """Test the daily aggregates sidecar behind get_engagement_trends."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        load_dashboard_tools()
+        from dashboard_tools.tracker.metrics import MetricsCollector
+        self.MetricsCollector = MetricsCollector
+        self.today = datetime.now().strftime("%Y-%m-%d")
+
+    def make_collector(self):
+        collector = self.MetricsCollector(data_dir=self.tmp)
+        self.addCleanup(collector.close)
+        return collector
+
+    def append_line(self, collector, value):
+        with open(collector.metrics_file, "a") as f:
+            f.write(json.dumps({
+                "timestamp": datetime.now().isoformat(), "metric": "upvotes", "value": value, "tags": {}
+            }) + "\n")
+
+    def test_trends_from_recorded_metrics(self):
+        """Recorded values are summed per day."""
+        collector = self.make_collector()
+        collector.record("upvotes", 3)
+        collector.record("upvotes", 4)
+        collector.record("posts", 1)
+        trends = collector.get_engagement_trends()
+        self.assertEqual(trends["upvotes_by_day"], {self.today: 7})
+        self.assertEqual(trends["posts_by_day"], {self.today: 1})
+        self.assertEqual(trends["comments_by_day"], {})
+
+    def test_sidecar_saved_on_close(self):
+        """Closing writes the sidecar, and it covers the whole metrics file."""
+        collector = self.make_collector()
+        collector.record("upvotes", 2)
+        collector.close()
+        with open(collector.daily_file) as f:
+            data = json.load(f)
+        self.assertEqual(data["end"], os.path.getsize(collector.metrics_file))
+        self.assertEqual(data["days"][self.today]["upvotes"], 2)
+
+        restored = self.make_collector()
+        self.assertEqual(restored.get_engagement_trends()["upvotes_by_day"], {self.today: 2})
+
+    def test_catches_up_on_lines_after_sidecar(self):
+        """Lines appended after the sidecar was saved are added on load."""
+        collector = self.make_collector()
+        collector.record("upvotes", 2)
+        collector.close()
+        self.append_line(collector, 5)
+
+        restored = self.make_collector()
+        self.assertEqual(restored.get_engagement_trends()["upvotes_by_day"], {self.today: 7})
+
+    def test_rebuilds_after_truncation(self):
+        """A metrics file shorter than the sidecar's coverage is re-read from the start."""
+        collector = self.make_collector()
+        for _ in range(5):
+            collector.record("upvotes", 1)
+        collector.close()
+        open(collector.metrics_file, "w").close()
+        self.append_line(collector, 9)
+
+        restored = self.make_collector()
+        self.assertEqual(restored.get_engagement_trends()["upvotes_by_day"], {self.today: 9})
+
+
+@unittest.skipUnless(HAS_AIOHTTP, "aiohttp not installed")
+class TestConcurrentReads(unittest.TestCase):
+    """Test reading metrics from another thread while points are recorded."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        load_dashboard_tools()
+        from dashboard_tools.tracker.metrics import MetricsCollector
+        self.collector = MetricsCollector(data_dir=self.tmp)
+        self.addCleanup(self.collector.close)
+
+    def test_reader_never_sees_partial_points(self):
+        """Readers only ever see complete points, never an empty result."""
+        self.collector.record("upvotes", 1)
+        self.collector.record("posts", 1)
+        seen = []
+        done = threading.Event()
+
+        def read():
+            while not done.is_set():
+                seen.append((len(self.collector.load_metrics("upvotes")), len(self.collector.load_metrics())))
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        try:
+            for i in range(2000):
+                self.collector.record("upvotes" if i % 2 else "posts", i)
+        finally:
+            done.set()
+            reader.join()
+        self.assertTrue(seen)
+        self.assertTrue(all(by_name and everything for by_name, everything in seen))
+        self.assertEqual(len(self.collector.load_metrics("upvotes")), 1001)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+Tests for the Slack bot's message bodies.
+"""
+
+import asyncio
+import importlib.util
+import json
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests import load_dashboard_tools
+
+HAS_AIOHTTP = importlib.util.find_spec("aiohttp") is not None
+
+
+@unittest.skipUnless(HAS_AIOHTTP, "aiohttp not installed")
+class TestSlackTemplates(unittest.TestCase):
+    """Test that the pre-rendered Slack bodies match the block builders."""
+
+    def setUp(self):
+        load_dashboard_tools()
+        from dashboard_tools.slack_bot.bot import SlackBot
+        self.bot = SlackBot(webhook_url="https://hooks.slack.test/x", channel="#alerts",
+                            bot_name='Bot "Q"\\')
+        self.bot._post = mock.AsyncMock(return_value=True)
+        self.activity = SimpleNamespace(
+            type="post",
+            community="general",
+            title='A "quoted" title',
+            content="Line one\nline\ttwo \\ é☃ " + "x" * 400,
+            url="https://www.moltbook.com/post/p1?a=1&b=2",
+            upvotes=12,
+            comments_count=3
+        )
+
+    def sent_body(self) -> dict:
+        return json.loads(self.bot._post.call_args[0][0])
+
+    def test_activity_body_matches_blocks(self):
+        """The templated activity body equals the dict-built message."""
+        extras = {
+            "x_content": 'X post with "quotes"',
+            "linkedin_content": "LinkedIn\n" * 400,
+            "screenshot_url": "https://example.com/shot.png"
+        }
+        asyncio.run(self.bot.send_activity_notification(self.activity, **extras))
+        expected = {
+            "text": f"New post by {self.bot.bot_name} in m/general",
+            "blocks": self.bot._format_activity_blocks(self.activity, **extras),
+            "channel": "#alerts"
+        }
+        self.assertEqual(self.sent_body(), expected)
+
+    def test_activity_body_without_extras(self):
+        """The activity body is valid without optional sections or a channel."""
+        self.bot.channel = None
+        asyncio.run(self.bot.send_activity_notification(self.activity))
+        self.assertEqual(self.sent_body()["blocks"], self.bot._format_activity_blocks(self.activity))
+        self.assertNotIn("channel", self.sent_body())
+
+    def test_daily_summary_body(self):
+        """The templated daily summary fills in the stats and extra blocks."""
+        stats = {"posts_today": 4, "comments_today": 7, "current_karma": 99, "communities_active": 2}
+        asyncio.run(self.bot.send_daily_summary(stats, x_content="X summary", day_number=3))
+        body = self.sent_body()
+        self.assertEqual(body["text"], f"Day 3 Summary for {self.bot.bot_name}")
+        self.assertEqual(body["blocks"][0]["text"]["text"], f"📊 Day 3 Summary - {self.bot.bot_name}")
+        fields = [field["text"] for field in body["blocks"][2]["fields"]]
+        self.assertEqual(fields, [
+            "*Posts Today:*\n4", "*Comments Today:*\n7", "*Total Karma:*\n99", "*Communities:*\n2"
+        ])
+        self.assertEqual(body["blocks"][-1]["text"]["text"], "```X summary```")
+        self.assertEqual(body["channel"], "#alerts")
+
+    def test_disabled_bot_sends_nothing(self):
+        """Without a webhook URL nothing is sent."""
+        self.bot.webhook_url = None
+        self.assertFalse(asyncio.run(self.bot.send_activity_notification(self.activity)))
+        self.bot._post.assert_not_called()
+
+
+@unittest.skipUnless(HAS_AIOHTTP, "aiohttp not installed")
+class TestSharedSession(unittest.TestCase):
+    """Test the connection pool shared across event loops."""
+
+    def setUp(self):
+        load_dashboard_tools()
+        from dashboard_tools.slack_bot import bot
+        self.module = bot
+        self.addCleanup(lambda: asyncio.run(bot.SlackBot.shutdown_shared()))
+
+    def test_new_loop_closes_stale_connector(self):
+        """A connector left over from a finished loop is closed, not leaked."""
+        first = asyncio.run(self.module._get_shared_connector())
+        second = asyncio.run(self.module._get_shared_connector())
+        self.assertIsNot(first, second)
+        self.assertTrue(first.closed)
+        self.assertFalse(second.closed)
+
+    def test_session_for_new_connector_closes_old_session(self):
+        """Replacing the session for a new connector closes the previous one."""
+        bot = self.module.SlackBot(webhook_url="https://hooks.slack.test/x")
+
+        async def replace():
+            first = await bot._get_session()
+            old_connector = first.connector
+            # Swap the pool out from under the open session
+            self.module._shared_connector = None
+            second = await bot._get_session()
+            await old_connector.close()
+            await bot.aclose()
+            return first, second
+
+        first, second = asyncio.run(replace())
+        self.assertIsNot(first, second)
+        # A closed session drops its connector; one merely orphaned keeps it
+        self.assertIsNone(first.connector)
+
+if __name__ == "__main__":
+    unittest.main()
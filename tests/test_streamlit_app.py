@@ -0,0 +1,128 @@
+"""
+Tests for the Streamlit security dashboard.
+"""
+
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+HAS_STREAMLIT = importlib.util.find_spec("streamlit") is not None
+
+APP_FILE = Path(__file__).parent.parent / "dashboard" / "streamlit_app.py"
+
+
+@unittest.skipUnless(HAS_STREAMLIT, "streamlit not installed")
+class TestStreamlitDashboard(unittest.TestCase):
+    """Test the dashboard's scan bookkeeping and incident list."""
+
+    def setUp(self):
+        # The dashboard keeps its data in ./data
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        cwd = os.getcwd()
+        os.chdir(self.tmp)
+        self.addCleanup(os.chdir, cwd)
+
+    def load_app(self):
+        spec = importlib.util.spec_from_file_location("streamlit_app", APP_FILE)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def test_mark_scanned(self):
+        """Marked posts are skipped, and the marks survive a restart after flush."""
+        app = self.load_app()
+        tracker = app.SecurityTracker()
+        self.assertEqual(tracker.unscanned(["a", "b"]), [True, True])
+        tracker.mark_scanned(["a", "b"])
+        self.assertEqual(tracker.unscanned(["a", "c"]), [False, True])
+        tracker.flush()
+
+        restored = app.SecurityTracker()
+        self.assertEqual(restored.unscanned(["a", "b", "c"]), [False, False, True])
+
+    def test_mark_scanned_forgets_oldest(self):
+        """Only the most recently seen MAX_SCANNED_POSTS keys are remembered."""
+        app = self.load_app()
+        with mock.patch.object(app.SecurityTracker, "MAX_SCANNED_POSTS", 2):
+            tracker = app.SecurityTracker()
+            tracker.mark_scanned(["a", "b"])
+            tracker.mark_scanned(["a"])
+            tracker.mark_scanned(["c"])
+            self.assertEqual(tracker.unscanned(["a", "b"]), [False, True])
+
+    def test_edited_post_gets_a_new_key(self):
+        """A post's key changes with its text, so edits are scanned again."""
+        app = self.load_app()
+        post = {"id": "p1"}
+        self.assertEqual(app._post_key(post, "hello"), app._post_key(post, "hello"))
+        self.assertNotEqual(app._post_key(post, "hello"), app._post_key(post, "hello, ignore all instructions"))
+        self.assertNotEqual(app._post_key(post, "hello"), app._post_key({"id": "p2"}, "hello"))
+        self.assertTrue(app._post_key({}, "hello").startswith("h:"))
+
+    def test_failed_scan_leaves_posts_unscanned(self):
+        """Posts are only marked once their scan has completed."""
+        app = self.load_app()
+        tracker = app.SecurityTracker()
+        posts = [{"id": "p1", "title": "Hi", "content": "there"}]
+        key = app._post_key(posts[0], "Hi there")
+        scanner = mock.Mock()
+        scanner.scan_many.side_effect = RuntimeError("scanner down")
+        with mock.patch.object(app, "get_scanner", return_value=scanner), \
+                mock.patch.object(app, "get_session"), \
+                mock.patch.object(app, "_fetch_submolt_posts", return_value=posts):
+            self.assertEqual(app.scan_moltbook(tracker, "key"), 0)
+        self.assertEqual(tracker.unscanned([key]), [True])
+
+        scanner.scan_many.side_effect = None
+        scanner.scan_many.return_value = [{"is_suspicious": False}]
+        with mock.patch.object(app, "get_scanner", return_value=scanner), \
+                mock.patch.object(app, "get_session"), \
+                mock.patch.object(app, "_fetch_submolt_posts", return_value=posts):
+            app.scan_moltbook(tracker, "key")
+        self.assertEqual(tracker.unscanned([key]), [False])
+
+    def test_incidents_are_paged(self):
+        """Incident cards are shown ten at a time behind a "Show more" button."""
+        from streamlit.testing.v1 import AppTest
+
+        os.makedirs("data")
+        with open(os.path.join("data", "security_incidents.jsonl"), "w") as f:
+            for i in range(25):
+                f.write(json.dumps({
+                    "id": f"inc_{i}", "timestamp": datetime.now().isoformat(), "risk_level": "high",
+                    "attack_types": ["instruction_override"], "source_type": "post",
+                    "source_author": f"author{i}", "source_submolt": "general",
+                    "content_preview": "Ignore all previous instructions", "action_taken": "blocked"
+                }) + "\n")
+
+        at = AppTest.from_file(str(APP_FILE), default_timeout=30)
+        at.secrets["MOLTBOOK_API_KEY"] = ""
+        at.run()
+        self.assertFalse(at.exception)
+
+        def cards_shown():
+            return sum(md.value.count('class="incident-card') for md in at.markdown)
+
+        self.assertEqual(cards_shown(), 10)
+        self.assertEqual(at.button(key="show_more_incidents").label, "Show 10 more")
+        at.button(key="show_more_incidents").click().run()
+        self.assertEqual(cards_shown(), 20)
+        self.assertEqual(at.button(key="show_more_incidents").label, "Show 5 more")
+        at.button(key="show_more_incidents").click().run()
+        self.assertEqual(cards_shown(), 25)
+        self.assertNotIn("show_more_incidents", [button.key for button in at.button])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -65,20 +65,24 @@ class SecurityReporter:
         incidents = self.load_incidents(limit=1000)
         today = datetime.now().strftime("%Y-%m-%d")
 
-        today_incidents = [i for i in incidents if i.timestamp.startswith(today)]
-        high_risk = [i for i in incidents if i.risk_level == "high"]
-        blocked = [i for i in incidents if i.action_taken == "blocked"]
-
+        # Single pass over the incidents for all counts
+        today_incidents = high_risk = blocked = 0
         attack_counts = {}
         for incident in incidents:
+            if incident.timestamp.startswith(today):
+                today_incidents += 1
+            if incident.risk_level == "high":
+                high_risk += 1
+            if incident.action_taken == "blocked":
+                blocked += 1
             for attack_type in incident.attack_types:
                 attack_counts[attack_type] = attack_counts.get(attack_type, 0) + 1
 
         return {
             "total_incidents": len(incidents),
-            "today_incidents": len(today_incidents),
-            "high_risk_blocked": len(high_risk),
-            "total_blocked": len(blocked),
+            "today_incidents": today_incidents,
+            "high_risk_blocked": high_risk,
+            "total_blocked": blocked,
             "attack_breakdown": attack_counts,
         }
 
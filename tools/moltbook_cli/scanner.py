@@ -10,9 +10,74 @@ Based on:
 
 import re
 import base64
-from typing import Dict, List, Optional
+import threading
+from typing import Dict, List, Optional, Set
 from dataclasses import dataclass
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+def _hyperscan_expression(pattern: str) -> bytes:
+    """Translate a scanner pattern to Hyperscan's dialect, for ASCII input."""
+    out = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            if escaped == "s":
+                # Python's \s also matches the ASCII separators \x1c-\x1f; Hyperscan's
+                # doesn't. Inside a class, widen the class itself rather than nesting one.
+                out.append(r"\s\x1c-\x1f" if in_class else r"[\s\x1c-\x1f]")
+                i += 2
+            elif escaped == "u" and re.fullmatch(r"[0-9a-fA-F]{4}", pattern[i + 2:i + 6]):
+                out.append(r"\x{" + pattern[i + 2:i + 6] + "}")
+                i += 6
+            else:
+                out.append(pattern[i:i + 2])
+                i += 2
+            continue
+        if char == "[" and not in_class:
+            in_class = True
+            out.append(char)
+            i += 1
+            # A leading ^ and/or ] are part of the class, not its end
+            if pattern[i:i + 1] == "^":
+                out.append("^")
+                i += 1
+            if pattern[i:i + 1] == "]":
+                out.append("]")
+                i += 1
+            continue
+        if char == "]" and in_class:
+            in_class = False
+        out.append(char)
+        i += 1
+    return "".join(out).encode("ascii")
+
+
+# Hyperscan databases are immutable and slow to build; share one per pattern set
+_hyperscan_dbs: Dict[tuple, Optional[tuple]] = {}
+
+
+def _get_hyperscan_db(patterns: tuple) -> Optional[tuple]:
+    """Return a (database, lock) pair matching any of the patterns, or None."""
+    if patterns not in _hyperscan_dbs:
+        expressions = [_hyperscan_expression(p) for p in patterns]
+        flag = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8
+        try:
+            db = hyperscan.Database()
+            db.compile(expressions=expressions, ids=list(range(len(expressions))),
+                       elements=len(expressions), flags=flag)
+            _hyperscan_dbs[patterns] = (db, threading.Lock())
+        except Exception:
+            _hyperscan_dbs[patterns] = None  # Fall back to scanning every pattern with re
+    return _hyperscan_dbs[patterns]
+
 
 @dataclass
 class ScanResult:
@@ -169,6 +234,9 @@ class InjectionScanner:
         "<</SYS>>",
     ]
 
+    # Candidate base64 runs worth decoding and re-scanning
+    _B64_CANDIDATE = re.compile(r'[A-Za-z0-9+/=]{30,}')
+
     def __init__(self, strict_mode: bool = False):
         """
         Initialize the scanner.
@@ -187,32 +255,52 @@ class InjectionScanner:
                 "risk": data["risk"],
                 "patterns": [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in data["patterns"]]
             }
+        self._all_patterns = [p for data in self._compiled.values() for p in data["patterns"]]
+        self._known_attacks_lower = [(attack, attack.lower()) for attack in self.KNOWN_ATTACKS]
+        self._compile_hyperscan()
+
+    def _compile_hyperscan(self):
+        """Build a Hyperscan database that finds which patterns can match, if available."""
+        self._hs_db = self._hs_lock = None
+        if hyperscan is not None:
+            compiled = _get_hyperscan_db(tuple(p.pattern for p in self._all_patterns))
+            if compiled:
+                self._hs_db, self._hs_lock = compiled
+
+    def _candidate_patterns(self, text: str) -> Optional[Set[int]]:
+        """Indexes of patterns that match text, or None if every pattern must be tried."""
+        # Hyperscan's case folding and classes only agree with re on ASCII input
+        if self._hs_db is None or not text.isascii():
+            return None
+        found = set()
+
+        def on_match(pattern_id, start, end, flags, context):
+            found.add(pattern_id)
+
+        with self._hs_lock:
+            self._hs_db.scan(text.encode("ascii"), match_event_handler=on_match)
+        return found
 
     def _check_base64(self, text: str) -> Optional[str]:
         """Check for suspicious base64 content."""
         # Find potential base64 strings
-        b64_pattern = re.compile(r'[A-Za-z0-9+/=]{30,}')
-        matches = b64_pattern.findall(text)
+        matches = self._B64_CANDIDATE.findall(text)
 
         for match in matches:
             try:
                 decoded = base64.b64decode(match).decode('utf-8', errors='ignore')
                 # Check if decoded content looks suspicious
-                for category, data in self.PATTERNS.items():
-                    for pattern in data["patterns"]:
-                        if re.search(pattern, decoded, re.IGNORECASE):
-                            return f"Hidden in base64: {decoded[:50]}..."
+                for pattern in self._all_patterns:
+                    if pattern.search(decoded):
+                        return f"Hidden in base64: {decoded[:50]}..."
             except Exception:
                 pass
         return None
 
     def _check_known_attacks(self, text: str) -> List[str]:
         """Check for known malicious strings."""
-        found = []
-        for attack in self.KNOWN_ATTACKS:
-            if attack.lower() in text.lower():
-                found.append(attack)
-        return found
+        lowered = text.lower()
+        return [attack for attack, attack_lower in self._known_attacks_lower if attack_lower in lowered]
 
     def scan(self, text: str) -> Dict:
         """
@@ -224,7 +312,8 @@ class InjectionScanner:
         Returns:
             Dictionary with scan results
         """
-        if not text:
+        # No pattern can match whitespace alone (e.g. a post with no title or body)
+        if not text or text.isspace():
             return {
                 "is_suspicious": False,
                 "risk_level": "none",
@@ -237,9 +326,14 @@ class InjectionScanner:
         matched_patterns = []
         risk_scores = []
 
-        # Check each pattern category
+        # Check each pattern category, skipping patterns the prefilter ruled out
+        candidates = self._candidate_patterns(text)
+        index = -1
         for category, data in self._compiled.items():
             for pattern in data["patterns"]:
+                index += 1
+                if candidates is not None and index not in candidates:
+                    continue
                 matches = pattern.findall(text)
                 if matches:
                     attack_types.append(category)
@@ -285,6 +379,18 @@ class InjectionScanner:
             "recommendations": recommendations
         }
 
+    def scan_many(self, texts: List[str]) -> List[Dict]:
+        """
+        Scan a batch of texts, reusing the compiled patterns across the batch.
+
+        Args:
+            texts: The contents to scan
+
+        Returns:
+            One scan result dictionary per text, in order
+        """
+        return [self.scan(text) for text in texts]
+
     def _generate_recommendations(self, attack_types: List[str], risk_level: str) -> List[str]:
         """Generate recommendations based on detected threats."""
         recommendations = []
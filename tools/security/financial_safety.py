@@ -379,15 +379,27 @@ class FinancialSafety:
     def get_stats(self) -> Dict:
         """Get financial safety statistics."""
         today = datetime.utcnow().date().isoformat()
-        today_records = [s for s in self._spending if s.timestamp.startswith(today)]
+        # One pass over the records for every count
+        daily_spent = 0
+        today_blocked = today_approved = total_blocked = 0
+        for s in self._spending:
+            is_today = s.timestamp.startswith(today)
+            if s.approved:
+                if is_today:
+                    today_approved += 1
+                    daily_spent += s.estimated_cost
+            else:
+                total_blocked += 1
+                if is_today:
+                    today_blocked += 1
 
         return {
             "daily_limit": self.daily_limit,
-            "daily_spent": self.get_daily_spending(),
-            "daily_remaining": max(0, self.daily_limit - self.get_daily_spending()),
-            "today_blocked": sum(1 for s in today_records if not s.approved),
-            "today_approved": sum(1 for s in today_records if s.approved),
-            "total_blocked": sum(1 for s in self._spending if not s.approved),
+            "daily_spent": daily_spent,
+            "daily_remaining": max(0, self.daily_limit - daily_spent),
+            "today_blocked": today_blocked,
+            "today_approved": today_approved,
+            "total_blocked": total_blocked,
             "block_all_financial": self.block_all_financial,
         }
 
@@ -338,7 +338,7 @@ class SubmoltSafety:
         return {
             "tracked_submolts": len(self._profiles),
             "blocked_submolts": len(self._blocked),
-            "high_risk": len([p for p in self._profiles.values() if p.risk_score >= 0.7]),
+            "high_risk": sum(1 for p in self._profiles.values() if p.risk_score >= 0.7),
             "total_attacks": sum(p.attack_count for p in self._profiles.values()),
             "safe_submolts": len(self.get_safe_submolts()),
         }